@@ -0,0 +1,82 @@
+"""
+Açılış süresi ölçümü: library.json ve ikili önbellek
+
+Aynı kütüphaneyi akış tabanlı JSON okuyucusu ve ikili önbellek ile
+yükleyip süreleri ve dosya boyutlarını karşılaştırır. Ölçülen süre
+dosyanın okunmasını da içerir.
+
+Kullanım:
+    python benchmarks/bench_binary_snapshot.py [düğüm_sayısı]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Proje kök dizinini path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.models.library_models import Library, Topic, Example
+from src.services.binary_snapshot import read_binary_snapshot, write_binary_snapshot
+from src.services.json_stream import dump_library_stream, load_library_stream
+
+
+def build_library(node_count: int) -> Library:
+    """Yaklaşık `node_count` düğümlük örnek kütüphane oluşturur"""
+    library = Library()
+    per_topic = 20
+    for i in range(max(1, node_count // (per_topic + 1))):
+        topic = Topic(title=f"Konu {i}", content="Açıklama satırı\n" * 10, tags=["python", "notlar"])
+        for j in range(per_topic):
+            topic.add_example(Example(name=f"Örnek {j}", content="print('merhaba')\n" * 15,
+                                      language="python"))
+        library.add_topic(topic)
+    return library
+
+
+def best_of(func, repeat: int = 3) -> float:
+    """En iyi çalışma süresini döndürür"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    node_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    library = build_library(node_count)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        json_path = Path(temp_dir) / "library.json"
+        cache_path = Path(temp_dir) / "library.cache"
+        with open(json_path, 'w', encoding='utf-8') as file:
+            dump_library_stream(library, file)
+        with open(cache_path, 'wb') as file:
+            write_binary_snapshot(library, file, (0, 0))
+
+        def load_json():
+            with open(json_path, 'r', encoding='utf-8') as file:
+                load_library_stream(file)
+
+        def load_cache():
+            read_binary_snapshot(cache_path.read_bytes(), (0, 0))
+
+        def read_only():
+            cache_path.read_bytes()
+
+        json_time = best_of(load_json)
+        cache_time = best_of(load_cache)
+        io_time = best_of(read_only)
+        print(f"{node_count} düğüm")
+        print(f"library.json  : {json_path.stat().st_size / 1e6:7.1f} MB  {json_time:.3f} sn")
+        print(f"library.cache : {cache_path.stat().st_size / 1e6:7.1f} MB  {cache_time:.3f} sn "
+              f"({json_time / cache_time:.1f}x)")
+        print(f"  yalnızca dosya okuma: {io_time:.3f} sn")
+
+
+if __name__ == '__main__':
+    main()
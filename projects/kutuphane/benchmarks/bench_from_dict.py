@@ -0,0 +1,111 @@
+"""
+Library.from_dict yükleme süresi ölçümü
+
+Mevcut from_dict'i, zaman damgalarını her düğümde hemen çözen ve
+varsayılan ID'yi her seferinde üreten önceki yükleme yoluyla
+karşılaştırır. Önceki yol aynı model sınıflarıyla kurulur; fark yalnızca
+alanların nasıl hazırlandığıdır.
+
+Kullanım:
+    python benchmarks/bench_from_dict.py [düğüm_sayısı]
+"""
+
+import json
+import sys
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict
+
+# Proje kök dizinini path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.models.library_models import Library, Topic, Example
+
+
+def eager_example(data: Dict[str, Any]) -> Example:
+    """Önceki Example.from_dict"""
+    return Example(
+        id=data.get('id', str(uuid.uuid4())),
+        name=data.get('name', ''),
+        content=data.get('content', ''),
+        language=data.get('language', 'text'),
+        created_at=datetime.fromisoformat(data.get('created_at', datetime.now().isoformat())),
+        updated_at=datetime.fromisoformat(data.get('updated_at', datetime.now().isoformat()))
+    )
+
+
+def eager_topic(data: Dict[str, Any]) -> Topic:
+    """Önceki Topic.from_dict"""
+    topic = Topic(
+        id=data.get('id', str(uuid.uuid4())),
+        title=data.get('title', ''),
+        content=data.get('content', ''),
+        parent_id=data.get('parent_id'),
+        tags=data.get('tags', []),
+        created_at=datetime.fromisoformat(data.get('created_at', datetime.now().isoformat())),
+        updated_at=datetime.fromisoformat(data.get('updated_at', datetime.now().isoformat())),
+        is_expanded=data.get('is_expanded', False)
+    )
+    for child_data in data.get('children', []):
+        child = eager_topic(child_data)
+        child._parent = topic
+        topic.children.append(child)
+    for example_data in data.get('examples', []):
+        topic.examples.append(eager_example(example_data))
+    return topic
+
+
+def eager_library(data: Dict[str, Any]) -> Library:
+    """Önceki Library.from_dict"""
+    library = Library(
+        id=data.get('id', str(uuid.uuid4())),
+        name=data.get('name', 'Kişisel Kütüphanem'),
+        description=data.get('description', ''),
+        created_at=datetime.fromisoformat(data.get('created_at', datetime.now().isoformat())),
+        updated_at=datetime.fromisoformat(data.get('updated_at', datetime.now().isoformat())),
+        version=data.get('version', '1.0.0')
+    )
+    for topic_data in data.get('topics', []):
+        library.topics.append(eager_topic(topic_data))
+    library.rebuild_index()
+    return library
+
+
+def build_text(node_count: int) -> str:
+    """Yaklaşık `node_count` düğümlük kütüphane JSON'u üretir"""
+    library = Library()
+    per_topic = 20
+    for i in range(max(1, node_count // (per_topic + 1))):
+        topic = Topic(title=f"Konu {i}", content="Açıklama")
+        for j in range(per_topic):
+            topic.add_example(Example(name=f"Örnek {j}", content="print(1)", language="python"))
+        library.add_topic(topic)
+    return json.dumps(library.to_dict(), ensure_ascii=False)
+
+
+def best_of(func, text: str, repeat: int = 3) -> float:
+    """Her turda JSON'u yeniden çözüp en iyi from_dict süresini döndürür"""
+    best = float('inf')
+    for _ in range(repeat):
+        data = json.loads(text)
+        start = time.perf_counter()
+        func(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    node_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    text = build_text(node_count)
+    before = best_of(eager_library, text)
+    after = best_of(Library.from_dict, text)
+    print(f"{node_count} düğüm")
+    print(f"önceki from_dict : {before:.3f} sn")
+    print(f"from_dict        : {after:.3f} sn ({before / after:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
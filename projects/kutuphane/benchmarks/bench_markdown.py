@@ -0,0 +1,75 @@
+"""
+Markdown işleme süresi ölçümü
+
+Farklı uzunluktaki metinleri MarkdownProcessor ile HTML'e ve düz metne
+çevirir. Tek taramalı işlemede karakter başına süre metin büyüdükçe
+sabit kalmalıdır; kapanmayan link tekrarları ("[a](" * n) için de.
+
+Kullanım:
+    python benchmarks/bench_markdown.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Proje kök dizinini path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.markdown_processor import MarkdownProcessor
+from src.utils.render_cache import RenderCache
+
+
+SECTION = """## Başlık
+
+Metin **kalın**, *italik*, `kod` ve [bağlantı](https://example.com) içerir.
+
+* öğe bir
+* öğe **iki**
+
+```python
+def topla(*sayilar):
+    return sum(sayilar)
+```
+
+"""
+
+
+def best_of(func, repeat: int = 3) -> float:
+    """En iyi çalışma süresini döndürür"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    # Kayıt tutmayan önbellek: her çalıştırma metni gerçekten işler
+    processor = MarkdownProcessor(cache=RenderCache(max_entries=0))
+    for size in (10_000, 100_000, 1_000_000):
+        text = (SECTION * (size // len(SECTION) + 1))[:size]
+
+        def render():
+            processor.render(text)
+
+        elapsed = best_of(render)
+        print(f"{size:>9} karakter: {elapsed * 1000:8.1f} ms  "
+              f"({elapsed / size * 1e9:6.1f} ns/karakter)")
+
+    # Kapanmayan linkler: geri izleme yapan desenlerde süre karesel artar
+    for count in (1_000, 10_000, 100_000):
+        text = "[a](" * count
+
+        def render_unclosed():
+            processor.render(text)
+
+        elapsed = best_of(render_unclosed)
+        print(f"{len(text):>9} karakter \"[a](\" * {count}: {elapsed * 1000:8.1f} ms  "
+              f"({elapsed / len(text) * 1e9:6.1f} ns/karakter)")
+
+
+if __name__ == '__main__':
+    main()
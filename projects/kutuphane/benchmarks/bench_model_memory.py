@@ -0,0 +1,87 @@
+"""
+Model sınıflarının düğüm başına bellek kullanımı ölçümü
+
+Slotlu Topic/Example sınıflarını, önceki düz dataclass tanımlarının
+birebir kopyasıyla karşılaştırır. Gövde metinleri tüm düğümlerde
+paylaşılır; ölçülen değer düğüm başına yapı maliyetidir.
+
+Kullanım:
+    python benchmarks/bench_model_memory.py [düğüm_sayısı]
+"""
+
+import sys
+import tracemalloc
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, List, Optional
+
+# Proje kök dizinini path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.models.library_models import Topic, Example
+
+
+@dataclass
+class PlainExample:
+    """Önceki (slotsuz) Example tanımı"""
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    name: str = ""
+    content: str = ""
+    language: str = "text"
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+    _content_ref: Optional[Any] = field(default=None, init=False, repr=False, compare=False)
+
+
+@dataclass
+class PlainTopic:
+    """Önceki (slotsuz) Topic tanımı"""
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    title: str = ""
+    content: str = ""
+    parent_id: Optional[str] = None
+    children: List['PlainTopic'] = field(default_factory=list)
+    examples: List[PlainExample] = field(default_factory=list)
+    tags: List[str] = field(default_factory=list)
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+    is_expanded: bool = False
+    _content_ref: Optional[Any] = field(default=None, init=False, repr=False, compare=False)
+    _library: Optional[Any] = field(default=None, init=False, repr=False, compare=False)
+    _parent: Optional[Any] = field(default=None, init=False, repr=False, compare=False)
+
+
+def measure(factory, count: int) -> float:
+    """`count` düğüm oluşturup düğüm başına ayrılan bayt sayısını döndürür"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    nodes = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del nodes
+    return (after - before) / count
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    body = "print('merhaba')\n" * 10
+    cases = [
+        ("Example", PlainExample, Example,
+         lambda cls: lambda i: cls(name=f"Örnek {i}", content=body, language="python")),
+        ("Topic", PlainTopic, Topic,
+         lambda cls: lambda i: cls(title=f"Konu {i}", content=body)),
+    ]
+
+    print(f"{count} düğüm, düğüm başına bayt (paylaşılan gövde hariç)")
+    print(f"{'Sınıf':<10}{'önce':>10}{'sonra':>10}{'kazanç':>10}")
+    for name, plain_cls, slotted_cls, make in cases:
+        before = measure(make(plain_cls), count)
+        after = measure(make(slotted_cls), count)
+        print(f"{name:<10}{before:>10.0f}{after:>10.0f}{1 - after / before:>10.0%}")
+
+
+if __name__ == '__main__':
+    main()
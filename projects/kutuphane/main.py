@@ -7,6 +7,7 @@ ve görüntülemek için geliştirilmiş masaüstü uygulamasıdır.
 
 Kullanım:
     python main.py
+    python main.py --lazy-content   # gövdeleri library.content dosyasında tut
 
 Mimari:
     - MVVM (Model-View-ViewModel) mimarisi
@@ -15,6 +16,7 @@ Mimari:
     - Modüler yapı
 """
 
+import argparse
 import sys
 import os
 from pathlib import Path
@@ -49,10 +51,17 @@ except ImportError as e:
 class LibraryApplication:
     """Ana uygulama sınıfı"""
     
-    def __init__(self):
-        """Uygulama başlatıcısı"""
+    def __init__(self, lazy_content: bool = False):
+        """
+        Uygulama başlatıcısı
+        
+        Args:
+            lazy_content: True ise konu/örnek gövdeleri library.content
+                dosyasında tutulur ve yalnızca gerektiğinde okunur
+        """
         self.app = None
         self.main_window = None
+        self.lazy_content = lazy_content
     
     def setup_application(self):
         """Qt uygulamasını yapılandırır"""
@@ -79,7 +88,8 @@ class LibraryApplication:
     def create_main_window(self):
         """Ana pencereyi oluşturur"""
         try:
-            self.main_window = MainWindow()
+            data_service = DataService(lazy_content=True) if self.lazy_content else None
+            self.main_window = MainWindow(data_service)
             return True
         except Exception as e:
             self.show_error_dialog(
@@ -168,6 +178,18 @@ def check_dependencies():
     return True
 
 
+def parse_arguments() -> argparse.Namespace:
+    """Uygulamanın komut satırı seçeneklerini okur"""
+    parser = argparse.ArgumentParser(description="Kişisel Kütüphane Uygulaması")
+    parser.add_argument(
+        '--lazy-content', action='store_true',
+        help="Konu/örnek gövdelerini library.content dosyasında tutar; büyük "
+             "kütüphaneler hızlı açılır ve bellek yalnızca açılan gövdeler kadar kullanılır"
+    )
+    args, _ = parser.parse_known_args()
+    return args
+
+
 def main():
     """Ana fonksiyon"""
     print("=" * 50)
@@ -191,8 +213,8 @@ def main():
             print(f"⚠️  Gerekli klasör bulunamadı: {dir_path}")
             print("Proje yapısını kontrol edin.")
     
-    # Uygulamayı başlat
-    app = LibraryApplication()
+    # Uygulamayı başlat (tanınmayan argümanlar Qt'ye kalır)
+    app = LibraryApplication(lazy_content=parse_arguments().lazy_content)
     exit_code = app.run()
     
     return exit_code
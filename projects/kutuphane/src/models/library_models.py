@@ -2,21 +2,179 @@
 Kütüphane veri modellerini tanımlar.
 """
 
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass, field
-from datetime import datetime
+from typing import Callable, List, Optional, Dict, Any
+from dataclasses import MISSING, dataclass, field, fields
+from datetime import datetime, timedelta
 import uuid
 
 
+# Zaman damgaları bu andan itibaren saniye (float) olarak saklanır
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _none() -> None:
+    """init=False referans alanlarının varsayılan değeri"""
+    return None
+
+
+def _new_id() -> str:
+    """Yeni düğüm kimliği üretir"""
+    return str(uuid.uuid4())
+
+
+def _or_now(value: Any) -> Any:
+    """from_dict'te eksik zaman damgası yerine şimdiki zaman (0 geçerli bir epoch değeridir)"""
+    return datetime.now() if value is None else value
+
+
+def _slotted(**properties: property) -> Callable[[type], type]:
+    """
+    Dataclass'ı __slots__ kullanan eşdeğer bir sınıfla değiştirir.
+    
+    Python 3.10'daki dataclass(slots=True) ile aynı işi yapar (3.8/3.9
+    desteği için elle). Örnek başına __dict__ olmadığından düğüm başına
+    bellek belirgin şekilde azalır. `properties` ile verilen alanlar
+    property olarak sunulur; değerleri `_<alan>` slotunda tutulur.
+    
+    Sınıf özniteliği kalmadığı için init=False alanlar default yerine
+    default_factory ile tanımlanmalıdır (3.10 öncesi dataclass __init__'i
+    bu alanlar için sınıf özniteliğine güvenir).
+    """
+    def wrap(cls: type) -> type:
+        cls_dict = dict(cls.__dict__)
+        slots = []
+        for f in fields(cls):
+            if not f.init and f.default is not MISSING:
+                raise TypeError(f"{cls.__name__}.{f.name}: init=False alan default_factory kullanmalı")
+            cls_dict.pop(f.name, None)
+            slots.append('_' + f.name if f.name in properties else f.name)
+        cls_dict['__slots__'] = tuple(slots)
+        cls_dict.pop('__dict__', None)
+        cls_dict.pop('__weakref__', None)
+        cls_dict.update(properties)
+
+        slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+        slotted_cls.__qualname__ = cls.__qualname__
+        return slotted_cls
+    return wrap
+
+
+def _timestamp_property(name: str) -> property:
+    """
+    datetime alanı için epoch float olarak saklayan property oluşturur.
+    
+    Float, datetime nesnesine göre çok daha küçüktür; datetime yalnızca
+    alana erişildiğinde üretilir. Saat dilimi bilgisi olan değerler
+    olduğu gibi saklanır.
+    
+    Dosyadan yüklenen ISO metinleri olduğu gibi atanabilir; biçimleri
+    atamada (yani yüklemede) doğrulanır, datetime'a çevrilmeleri ilk
+    erişime kalır. Hiç okunmayan zaman damgası kayıtta metin haliyle
+    geri yazılır (bkz. `isoformat_timestamp`). Sayılar epoch saniyesi
+    kabul edilir. Geçersiz metin ValueError, başka türden bir değer
+    TypeError verir.
+    """
+    slot = '_' + name
+
+    def getter(self) -> datetime:
+        value = getattr(self, slot)
+        if value.__class__ is float:
+            return _EPOCH + timedelta(seconds=value)
+        if value.__class__ is str:
+            value = datetime.fromisoformat(value)
+            setter(self, value)
+        return value
+
+    def setter(self, value: datetime) -> None:
+        if value.__class__ is str:
+            # Bozuk metin ilk erişimde (ör. kayıt sırasında) değil burada yakalanır
+            try:
+                datetime.fromisoformat(value)
+            except ValueError:
+                raise ValueError(f"Geçersiz zaman damgası ({name}): {value!r}") from None
+        elif isinstance(value, datetime):
+            if value.tzinfo is None:
+                value = (value - _EPOCH).total_seconds()
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            value = float(value)
+        else:
+            raise TypeError(f"Geçersiz zaman damgası ({name}): {value!r}")
+        setattr(self, slot, value)
+
+    return property(getter, setter)
+
+
+def isoformat_timestamp(node: Any, name: str) -> str:
+    """
+    Zaman damgası alanının ISO metnini döndürür.
+    
+    Yüklendiğinden beri hiç okunmamış değer için dosyadaki metni
+    çözmeden verir; uygulamanın yazdığı dosyalarda bu metin
+    `getattr(node, name).isoformat()` ile aynıdır.
+    """
+    return timestamp_text(getattr(node, '_' + name))
+
+
+def timestamp_text(value: Any) -> str:
+    """
+    Zaman damgası slotundaki ham değerin (epoch float, ISO metni veya
+    saat dilimli datetime) ISO metni; slot değeri değişmez olduğundan
+    başka bir thread'de de çağrılabilir.
+    """
+    if value.__class__ is str:
+        return value
+    if value.__class__ is float:
+        value = _EPOCH + timedelta(seconds=value)
+    return value.isoformat()
+
+
+def _lazy_content_property() -> property:
+    """
+    `content` alanı için tembel yüklenen property oluşturur.
+    
+    Gövde diskteyse (_content_ref) her erişimde içerik deposunun LRU
+    önbelleğinden okunur; modelde kalıcı olarak tutulmaz. Atama yapılınca
+    metin bellekte tutulur ve bir sonraki kayıtta diske yazılır.
+    """
+    def getter(self) -> str:
+        ref = self._content_ref
+        if ref is not None:
+            return ref.load()
+        return self._content
+
+    def setter(self, value: str) -> None:
+        self._content = value
+        self._content_ref = None
+
+    return property(getter, setter, doc="Gövde metni (gerekirse diskten okunur)")
+
+
+def _content_preview(node: Any, limit: int) -> str:
+    """
+    İçeriğin ilk `limit` karakterini döndürür, devamı varsa '...' ekler.
+    
+    Gövde diskteyse yalnızca baş kısmı çözülür; büyük gövdelerin
+    tamamı belleğe alınmaz.
+    """
+    ref = node._content_ref
+    text = ref.preview(limit + 1) if ref is not None else node._content[:limit + 1]
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+@_slotted(content=_lazy_content_property(),
+          created_at=_timestamp_property('created_at'),
+          updated_at=_timestamp_property('updated_at'))
 @dataclass
 class Example:
     """Örnek kod/snippet modeli"""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     name: str = ""
     content: str = ""
     language: str = "text"
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
+    # Gövde diskteyse okuma referansı (bkz. services.content_store)
+    _content_ref: Optional[Any] = field(default_factory=_none, init=False, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
         """Modeli dictionary'ye çevirir"""
@@ -25,27 +183,34 @@ class Example:
             'name': self.name,
             'content': self.content,
             'language': self.language,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': isoformat_timestamp(self, 'created_at'),
+            'updated_at': isoformat_timestamp(self, 'updated_at')
         }
 
+    def get_content_preview(self, limit: int) -> str:
+        """İçeriğin ilk `limit` karakterlik önizlemesini döndürür"""
+        return _content_preview(self, limit)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Example':
         """Dictionary'den model oluşturur"""
         return cls(
-            id=data.get('id', str(uuid.uuid4())),
+            id=data['id'] if 'id' in data else _new_id(),
             name=data.get('name', ''),
             content=data.get('content', ''),
             language=data.get('language', 'text'),
-            created_at=datetime.fromisoformat(data.get('created_at', datetime.now().isoformat())),
-            updated_at=datetime.fromisoformat(data.get('updated_at', datetime.now().isoformat()))
+            created_at=_or_now(data.get('created_at')),
+            updated_at=_or_now(data.get('updated_at'))
         )
 
 
+@_slotted(content=_lazy_content_property(),
+          created_at=_timestamp_property('created_at'),
+          updated_at=_timestamp_property('updated_at'))
 @dataclass
 class Topic:
     """Konu/başlık modeli"""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     title: str = ""
     content: str = ""
     parent_id: Optional[str] = None
@@ -55,11 +220,29 @@ class Topic:
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
     is_expanded: bool = False
+    # Gövde diskteyse okuma referansı (bkz. services.content_store)
+    _content_ref: Optional[Any] = field(default_factory=_none, init=False, repr=False, compare=False)
+    # Konunun bağlı olduğu kütüphane (ID indeksini güncel tutmak için)
+    _library: Optional['Library'] = field(default_factory=_none, init=False, repr=False, compare=False)
+    # Üst konu referansı (derinlik ve breadcrumb hesabı için)
+    _parent: Optional['Topic'] = field(default_factory=_none, init=False, repr=False, compare=False)
+    # Kayıt için alınmış değişmez görüntü (alt ağacıyla); konu veya alt ağacı
+    # değişince kaydetme servisi tarafından None yapılır
+    _frozen: Optional[Any] = field(default_factory=_none, init=False, repr=False, compare=False)
+
+    @property
+    def parent(self) -> Optional['Topic']:
+        """Üst konuyu döndürür (ana konular için None)"""
+        return self._parent
 
     def add_child(self, child: 'Topic') -> None:
         """Alt konu ekler"""
         child.parent_id = self.id
+        child._parent = self
         self.children.append(child)
+        if self._library is not None:
+            self._library._index_topic(child)
+            self._library.mark_dirty()
         self.updated_at = datetime.now()
 
     def remove_child(self, child_id: str) -> bool:
@@ -67,6 +250,10 @@ class Topic:
         for i, child in enumerate(self.children):
             if child.id == child_id:
                 del self.children[i]
+                child._parent = None
+                if self._library is not None:
+                    self._library._unindex_topic(child)
+                    self._library.mark_dirty()
                 self.updated_at = datetime.now()
                 return True
         return False
@@ -74,6 +261,9 @@ class Topic:
     def add_example(self, example: Example) -> None:
         """Örnek ekler"""
         self.examples.append(example)
+        if self._library is not None:
+            self._library._example_index[example.id] = example
+            self._library.mark_dirty()
         self.updated_at = datetime.now()
 
     def remove_example(self, example_id: str) -> bool:
@@ -81,21 +271,42 @@ class Topic:
         for i, example in enumerate(self.examples):
             if example.id == example_id:
                 del self.examples[i]
+                if self._library is not None:
+                    self._library._example_index.pop(example_id, None)
+                    self._library.mark_dirty()
                 self.updated_at = datetime.now()
                 return True
         return False
 
+    def get_content_preview(self, limit: int) -> str:
+        """İçeriğin ilk `limit` karakterlik önizlemesini döndürür"""
+        return _content_preview(self, limit)
+
     def get_depth(self) -> int:
-        """Hiyerarşideki derinliği hesaplar"""
+        """Hiyerarşideki derinliği hesaplar (O(derinlik))"""
         depth = 0
-        current = self
-        while current.parent_id:
+        current = self._parent
+        while current is not None:
             depth += 1
-            # Parent'ı bulmak için root'tan traverse etmek gerekir
-            # Bu metod optimize edilebilir
-            break
+            current = current._parent
         return depth
 
+    def get_ancestors(self) -> List['Topic']:
+        """Üst konuları kökten başlayarak döndürür (kendisi hariç)"""
+        ancestors = []
+        current = self._parent
+        while current is not None:
+            ancestors.append(current)
+            current = current._parent
+        ancestors.reverse()
+        return ancestors
+
+    def get_path(self) -> List['Topic']:
+        """Kökten bu konuya kadar olan yolu döndürür (breadcrumb için)"""
+        path = self.get_ancestors()
+        path.append(self)
+        return path
+
     def to_dict(self) -> Dict[str, Any]:
         """Modeli dictionary'ye çevirir"""
         return {
@@ -106,8 +317,8 @@ class Topic:
             'children': [child.to_dict() for child in self.children],
             'examples': [example.to_dict() for example in self.examples],
             'tags': self.tags,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
+            'created_at': isoformat_timestamp(self, 'created_at'),
+            'updated_at': isoformat_timestamp(self, 'updated_at'),
             'is_expanded': self.is_expanded
         }
 
@@ -115,43 +326,68 @@ class Topic:
     def from_dict(cls, data: Dict[str, Any]) -> 'Topic':
         """Dictionary'den model oluşturur"""
         topic = cls(
-            id=data.get('id', str(uuid.uuid4())),
+            id=data['id'] if 'id' in data else _new_id(),
             title=data.get('title', ''),
             content=data.get('content', ''),
             parent_id=data.get('parent_id'),
             tags=data.get('tags', []),
-            created_at=datetime.fromisoformat(data.get('created_at', datetime.now().isoformat())),
-            updated_at=datetime.fromisoformat(data.get('updated_at', datetime.now().isoformat())),
+            created_at=_or_now(data.get('created_at')),
+            updated_at=_or_now(data.get('updated_at')),
             is_expanded=data.get('is_expanded', False)
         )
         
-        # Children'ları yükle
+        # Children'ları yükle (akış okuyucusu hazır Topic nesneleri verebilir)
         for child_data in data.get('children', []):
-            child = cls.from_dict(child_data)
+            child = child_data if isinstance(child_data, Topic) else cls.from_dict(child_data)
+            child._parent = topic
             topic.children.append(child)
         
         # Examples'ları yükle
         for example_data in data.get('examples', []):
-            example = Example.from_dict(example_data)
+            example = example_data if isinstance(example_data, Example) else Example.from_dict(example_data)
             topic.examples.append(example)
         
         return topic
 
 
+@_slotted(created_at=_timestamp_property('created_at'),
+          updated_at=_timestamp_property('updated_at'))
 @dataclass
 class Library:
     """Kütüphane ana modeli"""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     name: str = "Kişisel Kütüphanem"
     description: str = ""
     topics: List[Topic] = field(default_factory=list)
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
     version: str = "1.0.0"
+    # ID -> düğüm indeksleri (O(1) arama için)
+    _topic_index: Dict[str, Topic] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _example_index: Dict[str, Example] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Her değişiklikte artan sayaç (kaydedilmemiş değişiklik takibi için)
+    _generation: int = field(default_factory=int, init=False, repr=False, compare=False)
+
+    @property
+    def generation(self) -> int:
+        """Değişiklik sayacını döndürür"""
+        return self._generation
+
+    def mark_dirty(self) -> None:
+        """
+        Kütüphanenin değiştiğini işaretler.
+        
+        Yapısal değişiklikler (ekleme/silme) otomatik işaretlenir; alan
+        değerleri doğrudan değiştirildiğinde çağıranın işaretlemesi gerekir.
+        """
+        self._generation += 1
 
     def add_topic(self, topic: Topic) -> None:
         """Ana konu ekler"""
+        topic._parent = None
         self.topics.append(topic)
+        self._index_topic(topic)
+        self.mark_dirty()
         self.updated_at = datetime.now()
 
     def remove_topic(self, topic_id: str) -> bool:
@@ -159,26 +395,58 @@ class Library:
         for i, topic in enumerate(self.topics):
             if topic.id == topic_id:
                 del self.topics[i]
+                self._unindex_topic(topic)
+                self.mark_dirty()
                 self.updated_at = datetime.now()
                 return True
         return False
 
     def find_topic_by_id(self, topic_id: str) -> Optional[Topic]:
-        """ID'ye göre konu bulur (recursive)"""
-        def search_in_topic(topic: Topic) -> Optional[Topic]:
-            if topic.id == topic_id:
-                return topic
-            for child in topic.children:
-                result = search_in_topic(child)
-                if result:
-                    return result
-            return None
+        """ID'ye göre konu bulur (indeks üzerinden O(1))"""
+        return self._topic_index.get(topic_id)
+
+    def get_topic_path(self, topic_id: str) -> List[Topic]:
+        """Kökten verilen konuya kadar olan yolu döndürür"""
+        topic = self.find_topic_by_id(topic_id)
+        return topic.get_path() if topic else []
 
+    def find_example_by_id(self, example_id: str) -> Optional[Example]:
+        """ID'ye göre örnek bulur (indeks üzerinden O(1))"""
+        return self._example_index.get(example_id)
+
+    def rebuild_index(self) -> None:
+        """
+        ID indekslerini baştan oluşturur.
+        
+        `topics`/`children`/`examples` listeleri add/remove metotları
+        kullanılmadan doğrudan değiştirildiyse çağrılmalıdır.
+        """
+        self._topic_index.clear()
+        self._example_index.clear()
         for topic in self.topics:
-            result = search_in_topic(topic)
-            if result:
-                return result
-        return None
+            self._index_topic(topic)
+
+    def _index_topic(self, topic: Topic) -> None:
+        """Konuyu alt ağacı ve örnekleriyle birlikte indekse ekler"""
+        stack = [topic]
+        while stack:
+            current = stack.pop()
+            current._library = self
+            self._topic_index[current.id] = current
+            for example in current.examples:
+                self._example_index[example.id] = example
+            stack.extend(current.children)
+
+    def _unindex_topic(self, topic: Topic) -> None:
+        """Konuyu alt ağacı ve örnekleriyle birlikte indeksten çıkarır"""
+        stack = [topic]
+        while stack:
+            current = stack.pop()
+            current._library = None
+            self._topic_index.pop(current.id, None)
+            for example in current.examples:
+                self._example_index.pop(example.id, None)
+            stack.extend(current.children)
 
     def search_topics(self, query: str) -> List[Topic]:
         """Konularda arama yapar"""
@@ -206,8 +474,8 @@ class Library:
             'name': self.name,
             'description': self.description,
             'topics': [topic.to_dict() for topic in self.topics],
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
+            'created_at': isoformat_timestamp(self, 'created_at'),
+            'updated_at': isoformat_timestamp(self, 'updated_at'),
             'version': self.version
         }
 
@@ -215,17 +483,20 @@ class Library:
     def from_dict(cls, data: Dict[str, Any]) -> 'Library':
         """Dictionary'den model oluşturur"""
         library = cls(
-            id=data.get('id', str(uuid.uuid4())),
+            id=data['id'] if 'id' in data else _new_id(),
             name=data.get('name', 'Kişisel Kütüphanem'),
             description=data.get('description', ''),
-            created_at=datetime.fromisoformat(data.get('created_at', datetime.now().isoformat())),
-            updated_at=datetime.fromisoformat(data.get('updated_at', datetime.now().isoformat())),
+            created_at=_or_now(data.get('created_at')),
+            updated_at=_or_now(data.get('updated_at')),
             version=data.get('version', '1.0.0')
         )
         
         # Topics'leri yükle
         for topic_data in data.get('topics', []):
-            topic = Topic.from_dict(topic_data)
+            topic = topic_data if isinstance(topic_data, Topic) else Topic.from_dict(topic_data)
             library.topics.append(topic)
         
+        # ID indeksini tek seferde oluştur
+        library.rebuild_index()
+        
         return library
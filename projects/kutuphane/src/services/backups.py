@@ -0,0 +1,138 @@
+"""
+Kütüphane dosyası için dönen (rotating) yedekler
+Her tam kayıttan önce mevcut dosya `backups/` klasörüne zaman damgalı
+bir adla bağlanır (hard link). library.json hiçbir zaman yerinde
+değiştirilmez, her kayıt yeni bir dosya yazıp atomik olarak yerine
+taşır; bu yüzden eski dosyanın verisi kopyalanmadan yedekte kalır.
+Hard link desteklenmiyorsa çekirdek içi kopyaya (sendfile /
+copy_file_range) düşülür. En yeni N yedek tutulur, fazlası arka planda
+silinir.
+"""
+
+import os
+import re
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Union
+
+
+def link_or_copy(source: Union[str, Path], target: Union[str, Path]) -> None:
+    """
+    Dosyayı hard link ile hedefe bağlar; olmazsa kopyalar
+
+    Kopya shutil.copyfile ile yapılır; Linux/macOS'ta veri Python'a
+    okunmadan çekirdek içinde kopyalanır.
+    """
+    try:
+        os.link(source, target)
+    except (OSError, AttributeError, NotImplementedError):
+        # Farklı dosya sistemi, FAT/ağ sürücüsü veya link desteği yok
+        shutil.copyfile(source, target)
+
+
+class BackupRotator:
+    """Kütüphane dosyasının zaman damgalı yedeklerini tutar ve budar"""
+
+    # Varsayılan olarak saklanan yedek sayısı
+    DEFAULT_KEEP = 10
+
+    def __init__(self, data_file_path: Union[str, Path], keep: int = DEFAULT_KEEP,
+                 directory: Optional[Union[str, Path]] = None):
+        """
+        BackupRotator constructor
+
+        Args:
+            data_file_path: Yedeklenecek dosya
+            keep: Saklanacak en yeni yedek sayısı
+            directory: Yedek klasörü (varsayılan: dosyanın yanındaki backups/);
+                hard link için aynı dosya sisteminde olmalı
+        """
+        self.data_file_path = Path(data_file_path)
+        self.directory = Path(directory) if directory else self.data_file_path.parent / "backups"
+        self.keep = keep
+        # library.json.gz -> ("library", "json.gz"); yedek adı library.<zaman>.json.gz
+        base, _, extension = self.data_file_path.name.partition('.')
+        self._base = base
+        self._extension = '.' + extension if extension else ''
+        self._pattern = re.compile(
+            re.escape(base) + r'\.(\d{8}-\d{6}-\d{6})(?:-(\d+))?' + re.escape(self._extension) + '$'
+        )
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._prune_pending = False
+        self._lock = threading.Lock()
+
+    def backup(self) -> Optional[Path]:
+        """
+        Dosyanın şu anki halini yeni bir yedek olarak saklar
+
+        Dosya yerine yenisi yazılmadan hemen önce çağrılmalıdır.
+
+        Returns:
+            Optional[Path]: Oluşturulan yedek; dosya yoksa None
+        """
+        if not self.data_file_path.exists():
+            return None
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        target = self.directory / f"{self._base}.{stamp}{self._extension}"
+        counter = 1
+        while target.exists():
+            target = self.directory / f"{self._base}.{stamp}-{counter}{self._extension}"
+            counter += 1
+        link_or_copy(self.data_file_path, target)
+        return target
+
+    def list_backups(self) -> List[Path]:
+        """Dönen yedekleri eskiden yeniye sıralı döndürür"""
+        if not self.directory.is_dir():
+            return []
+        backups = []
+        for entry in os.scandir(self.directory):
+            match = self._pattern.match(entry.name)
+            if match is not None and entry.is_file():
+                backups.append((match.group(1), int(match.group(2) or 0), entry.name))
+        backups.sort()
+        return [self.directory / name for _, _, name in backups]
+
+    def prune(self) -> int:
+        """
+        En yeni `keep` yedek dışındakileri siler
+
+        Returns:
+            int: Silinen yedek sayısı
+        """
+        backups = self.list_backups()
+        removed = 0
+        for path in backups[:max(0, len(backups) - self.keep)]:
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError as e:
+                print(f"Eski yedek silinemedi: {e}")
+        return removed
+
+    def prune_async(self) -> None:
+        """Budamayı arka plan thread'inde yapar (bekleyen varsa yenisini eklemez)"""
+        with self._lock:
+            if self._prune_pending:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="backup-prune")
+            self._prune_pending = True
+            self._executor.submit(self._run_prune)
+
+    def close(self) -> None:
+        """Bekleyen budama işinin bitmesini bekler"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _run_prune(self) -> None:
+        with self._lock:
+            self._prune_pending = False
+        self.prune()
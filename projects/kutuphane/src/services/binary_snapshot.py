@@ -0,0 +1,380 @@
+"""
+Kütüphane için ikili (binary) başlangıç önbelleği
+library.json'un yanında tutulan, hızlı açılış için kompakt bir kopyadır.
+JSON değişim biçimi olmaya devam eder; önbellek yalnızca kaynak dosyanın
+boyutu ve değiştirilme zamanı kayıttakiyle aynıysa kullanılır.
+
+Biçim (tüm sayılar little-endian):
+    başlık : MAGIC, sürüm (1 bayt), kaynak boyutu (8), kaynak mtime_ns (8),
+             gövdenin crc32 değeri (4)
+    gövde  : kayıt dizisi; her kayıt uzunluk (4) + tür baytı + alanlar
+        'S' : tekilleştirilmiş metin (etiket/dil); sırayla numaralanır
+        'L' : kütüphane
+        'T' : konu; ardından örnekleri ('E') ve alt konuları (önce-kök sırası)
+        'E' : örnek
+
+Her kaydın sayısal alanları sabit genişlikli bir başlıkta durur ve tek
+`struct.unpack_from` çağrısıyla çözülür; kaydın tüm metinleri ardışık tek
+bir UTF-8 bloğudur ve tek seferde çözülüp karakter uzunluklarıyla
+bölünür. Zaman damgaları epoch'tan beri mikro saniye olarak saklanır.
+Kayıtlar uzunlukla öneklendiği için okuyucu sondaki bilinmeyen alanları
+atlayabilir.
+"""
+
+import gc
+import struct
+import zlib
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
+
+from ..models.library_models import Library, Topic, Example
+from .content_store import ContentStore, attach_content_ref
+
+
+MAGIC = b'KTPB'
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct('<4sBQQI')
+_LENGTH = struct.Struct('<I')
+# bayraklar, created, updated, metin uzunlukları (id, ad, açıklama, sürüm,
+# içerik dosyası), ana konu sayısı
+_LIBRARY = struct.Struct('<BqqIIIIII')
+# bayraklar, created, updated, gövde ref (offset, uzunluk), etiket, örnek ve
+# alt konu sayısı, metin uzunlukları (id, başlık, gövde, parent_id)
+_TOPIC = struct.Struct('<BqqQIIIIIIII')
+# bayraklar, created, updated, gövde ref (offset, uzunluk), dil indeksi,
+# metin uzunlukları (id, ad, gövde)
+_EXAMPLE = struct.Struct('<BqqQIIIII')
+
+# Bayrak bitleri
+_CREATED_TEXT = 1      # created_at mikro saniye değil, metin bloğunda ISO metni
+_UPDATED_TEXT = 2
+_CONTENT_REF = 4       # gövde içerik dosyasında
+_EXPANDED = 8
+_HAS_PARENT = 16
+
+# Dosyaya bu boyuta ulaşan tampon parçalar halinde yazılır
+_FLUSH_SIZE = 1024 * 1024
+
+
+def _timestamp_field(value: Any, text_flag: int, texts: List[str]) -> Tuple[int, int]:
+    """
+    Zaman damgasını (bayrak, sayı) olarak kodlar
+
+    Saat dilimsiz değerler modelde epoch float olarak durur ve mikro
+    saniyeye tam olarak geri çevrilir. Saat dilimli veya henüz
+    çözülmemiş değerler metin bloğuna eklenir; sayı alanı metnin
+    uzunluğudur.
+    """
+    if value.__class__ is float:
+        return 0, round(value * 1_000_000)
+    text = value if value.__class__ is str else value.isoformat()
+    texts.append(text)
+    return text_flag, len(text)
+
+
+class _Encoder:
+    """Model ağacını kayıt kayıt ikili biçime çeviren yazıcı"""
+
+    def __init__(self, file: BinaryIO, content_file: Optional[str]):
+        self._file = file
+        # İçerik dosyası yoksa diskteki gövdeler de metin olarak yazılır
+        self._content_file = content_file
+        self._crc = 0
+        self._buffer = bytearray()
+        self._strings: Dict[str, int] = {}
+
+    def library(self, library: Library) -> None:
+        texts = [library.id, library.name, library.description, library.version,
+                 self._content_file or ""]
+        created_flag, created = _timestamp_field(library._created_at, _CREATED_TEXT, texts)
+        updated_flag, updated = _timestamp_field(library._updated_at, _UPDATED_TEXT, texts)
+        self._emit(b'L', _LIBRARY.pack(
+            created_flag | updated_flag, created, updated,
+            len(texts[0]), len(texts[1]), len(texts[2]), len(texts[3]), len(texts[4]),
+            len(library.topics)
+        ), texts)
+
+    def topic(self, topic: Topic) -> None:
+        tag_indexes = [self._intern(tag) for tag in topic.tags]
+        ref, content = self._content(topic)
+        parent_id = topic.parent_id
+        texts = [topic.id, topic.title, content, parent_id or ""]
+        flags = (_CONTENT_REF if ref is not None else 0) \
+            | (_EXPANDED if topic.is_expanded else 0) \
+            | (_HAS_PARENT if parent_id is not None else 0)
+        created_flag, created = _timestamp_field(topic._created_at, _CREATED_TEXT, texts)
+        updated_flag, updated = _timestamp_field(topic._updated_at, _UPDATED_TEXT, texts)
+        header = _TOPIC.pack(
+            flags | created_flag | updated_flag, created, updated,
+            ref.offset if ref is not None else 0, ref.length if ref is not None else 0,
+            len(tag_indexes), len(topic.examples), len(topic.children),
+            len(texts[0]), len(texts[1]), len(content), len(texts[3])
+        )
+        if tag_indexes:
+            header += struct.pack(f'<{len(tag_indexes)}I', *tag_indexes)
+        self._emit(b'T', header, texts)
+
+        for example in topic.examples:
+            self.example(example)
+        for child in topic.children:
+            self.topic(child)
+
+    def example(self, example: Example) -> None:
+        language = self._intern(example.language)
+        ref, content = self._content(example)
+        texts = [example.id, example.name, content]
+        created_flag, created = _timestamp_field(example._created_at, _CREATED_TEXT, texts)
+        updated_flag, updated = _timestamp_field(example._updated_at, _UPDATED_TEXT, texts)
+        self._emit(b'E', _EXAMPLE.pack(
+            (_CONTENT_REF if ref is not None else 0) | created_flag | updated_flag,
+            created, updated,
+            ref.offset if ref is not None else 0, ref.length if ref is not None else 0,
+            language, len(texts[0]), len(texts[1]), len(content)
+        ), texts)
+
+    def finish(self) -> int:
+        """Kalan tamponu yazar ve gövdenin crc32 değerini döndürür"""
+        self._flush()
+        return self._crc
+
+    def _content(self, node: Any) -> Tuple[Any, str]:
+        """(içerik dosyası referansı, metin) çifti; referans yazılacaksa metin boştur"""
+        ref = node._content_ref if self._content_file else None
+        return ref, node.content if ref is None else ""
+
+    def _intern(self, text: str) -> int:
+        """Metnin tablo indeksini döndürür; ilk kullanımda 'S' kaydı yazar"""
+        index = self._strings.get(text)
+        if index is None:
+            index = self._strings[text] = len(self._strings)
+            self._emit(b'S', b'', [text])
+        return index
+
+    def _emit(self, kind: bytes, header: bytes, texts: List[str]) -> None:
+        block = "".join(texts).encode('utf-8')
+        buffer = self._buffer
+        buffer += _LENGTH.pack(1 + len(header) + len(block))
+        buffer += kind
+        buffer += header
+        buffer += block
+        if len(buffer) >= _FLUSH_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        self._crc = zlib.crc32(self._buffer, self._crc)
+        self._file.write(self._buffer)
+        self._buffer = bytearray()
+
+
+def write_binary_snapshot(library: Library, file: BinaryIO, source_key: Tuple[int, int],
+                          content_file: Optional[str] = None) -> None:
+    """
+    Kütüphaneyi ikili biçimde yazar
+
+    Args:
+        library: Yazılacak kütüphane
+        file: İkili modda açılmış, konumlanabilir (seek) hedef dosya
+        source_key: Önbelleğin ait olduğu JSON dosyasının (boyut, mtime_ns) çifti
+        content_file: Gövdelerin tutulduğu içerik dosyasının adı (verilirse
+            diskteki gövdeler referans olarak yazılır, bkz. LibraryJsonWriter)
+    """
+    start = file.tell()
+    file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, source_key[0], source_key[1], 0))
+
+    encoder = _Encoder(file, content_file)
+    encoder.library(library)
+    for topic in library.topics:
+        encoder.topic(topic)
+    crc = encoder.finish()
+
+    end = file.tell()
+    file.seek(start)
+    file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, source_key[0], source_key[1], crc))
+    file.seek(end)
+
+
+def _timestamp_value(flags: int, text_flag: int, number: int, texts: str, pos: int) -> Tuple[Any, int]:
+    """_timestamp_field'ın tersi: (epoch float veya ISO metni, metin konumu)"""
+    if flags & text_flag:
+        return texts[pos:pos + number], pos + number
+    return number / 1_000_000, pos
+
+
+class _Decoder:
+    """İkili gövdeyi kayıt kayıt modele çeviren okuyucu"""
+
+    def __init__(self, data: bytes, pos: int, content_store: Optional[ContentStore]):
+        self._data = data
+        self._pos = pos
+        self._strings: List[str] = []
+        self._content_store = content_store
+
+    def library(self) -> Tuple[Library, str, int]:
+        """Kütüphane kaydını okur: (kütüphane, içerik dosyası adı, ana konu sayısı)"""
+        start, end = self._record(b'L')
+        (flags, created, updated, id_len, name_len, description_len,
+         version_len, content_file_len, topic_count) = _LIBRARY.unpack_from(self._data, start)
+        texts = self._data[start + _LIBRARY.size:end].decode('utf-8')
+        pos = 0
+        fields = []
+        for length in (id_len, name_len, description_len, version_len, content_file_len):
+            fields.append(texts[pos:pos + length])
+            pos += length
+        created, pos = _timestamp_value(flags, _CREATED_TEXT, created, texts, pos)
+        updated, pos = _timestamp_value(flags, _UPDATED_TEXT, updated, texts, pos)
+        library = Library(id=fields[0], name=fields[1], description=fields[2], version=fields[3],
+                          created_at=created, updated_at=updated)
+        return library, fields[4], topic_count
+
+    def topic(self, parent: Optional[Topic]) -> Topic:
+        data = self._data
+        start, end = self._record(b'T')
+        (flags, created, updated, ref_offset, ref_length, tag_count, example_count,
+         child_count, id_len, title_len, content_len, parent_len) = _TOPIC.unpack_from(data, start)
+        start += _TOPIC.size
+        tags: List[str] = []
+        if tag_count:
+            strings = self._strings
+            tags = [strings[i] for i in struct.unpack_from(f'<{tag_count}I', data, start)]
+            start += 4 * tag_count
+
+        texts = data[start:end].decode('utf-8')
+        pos = id_len + title_len
+        content_end = pos + content_len
+        parent_end = content_end + parent_len
+        created, timestamp_pos = _timestamp_value(flags, _CREATED_TEXT, created, texts, parent_end)
+        updated, _ = _timestamp_value(flags, _UPDATED_TEXT, updated, texts, timestamp_pos)
+        topic = Topic(
+            id=texts[:id_len],
+            title=texts[id_len:pos],
+            content=texts[pos:content_end],
+            parent_id=texts[content_end:parent_end] if flags & _HAS_PARENT else None,
+            tags=tags,
+            created_at=created,
+            updated_at=updated,
+            is_expanded=bool(flags & _EXPANDED),
+        )
+        if flags & _CONTENT_REF:
+            attach_content_ref(topic, self._ref(ref_offset, ref_length))
+        topic._parent = parent
+
+        examples = topic.examples
+        for _ in range(example_count):
+            examples.append(self.example())
+        children = topic.children
+        for _ in range(child_count):
+            children.append(self.topic(topic))
+        return topic
+
+    def example(self) -> Example:
+        start, end = self._record(b'E')
+        (flags, created, updated, ref_offset, ref_length, language,
+         id_len, name_len, content_len) = _EXAMPLE.unpack_from(self._data, start)
+        texts = self._data[start + _EXAMPLE.size:end].decode('utf-8')
+        pos = id_len + name_len
+        content_end = pos + content_len
+        created, timestamp_pos = _timestamp_value(flags, _CREATED_TEXT, created, texts, content_end)
+        updated, _ = _timestamp_value(flags, _UPDATED_TEXT, updated, texts, timestamp_pos)
+        example = Example(
+            id=texts[:id_len],
+            name=texts[id_len:pos],
+            content=texts[pos:content_end],
+            language=self._strings[language],
+            created_at=created,
+            updated_at=updated,
+        )
+        if flags & _CONTENT_REF:
+            attach_content_ref(example, self._ref(ref_offset, ref_length))
+        return example
+
+    def _record(self, kind: bytes) -> Tuple[int, int]:
+        """
+        Beklenen türdeki kayda ilerler; aradaki 'S' kayıtlarını tabloya alır
+
+        Returns:
+            Tuple[int, int]: Kayıt alanlarının (tür baytından sonraki)
+            başlangıcı ve kaydın sonu
+        """
+        data = self._data
+        while True:
+            (length,) = _LENGTH.unpack_from(data, self._pos)
+            start = self._pos + _LENGTH.size
+            end = start + length
+            if length == 0 or end > len(data):
+                raise ValueError("İkili önbellek kaydı yarım")
+            self._pos = end
+            record_kind = data[start:start + 1]
+            if record_kind == b'S':
+                self._strings.append(data[start + 1:end].decode('utf-8'))
+                continue
+            if record_kind != kind:
+                raise ValueError(f"İkili önbellekte {kind!r} kaydı bekleniyor")
+            return start + 1, end
+
+    def _ref(self, offset: int, length: int) -> Any:
+        if self._content_store is None:
+            raise ValueError("İkili önbellekte içerik referansı var ama içerik deposu yok")
+        return self._content_store.ref(offset, length)
+
+
+def read_source_key(data: bytes) -> Optional[Tuple[int, int]]:
+    """Başlıktaki (boyut, mtime_ns) anahtarını döndürür; biçim tanınmazsa None"""
+    if len(data) < _HEADER.size:
+        return None
+    magic, version, size, mtime_ns, _ = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        return None
+    return size, mtime_ns
+
+
+def read_binary_snapshot(data: bytes, source_key: Tuple[int, int],
+                         on_topic: Optional[Callable[[Topic], None]] = None,
+                         content_store: Optional[ContentStore] = None) -> Optional[Library]:
+    """
+    İkili önbellekten kütüphane oluşturur
+
+    Gövdenin crc32 değeri model kurulmadan önce doğrulanır; böylece
+    bozuk bir önbellek `on_topic` çağrılmadan reddedilir.
+
+    Args:
+        data: Önbellek dosyasının tüm içeriği
+        source_key: JSON dosyasının güncel (boyut, mtime_ns) çifti
+        on_topic: Her ana konu çözüldüğünde çağrılır
+        content_store: Gövde referanslarının çözüleceği içerik deposu;
+            önbellekte içerik dosyası adı varsa depo o dosyaya yönlendirilir
+
+    Returns:
+        Optional[Library]: Kütüphane; önbellek başka bir biçim sürümüne
+        veya JSON dosyasının başka bir haline aitse None
+
+    Raises:
+        ValueError: Önbellek bozuksa
+    """
+    if read_source_key(data) != tuple(source_key):
+        return None
+    crc = _HEADER.unpack_from(data)[4]
+    if zlib.crc32(memoryview(data)[_HEADER.size:]) != crc:
+        raise ValueError("İkili önbellek sağlama toplamı tutmuyor")
+
+    decoder = _Decoder(data, _HEADER.size, content_store)
+    # Yüz binlerce liste/nesne art arda oluşturulurken döngüsel çöp
+    # toplayıcı defalarca tüm heap'i tarar; yükleme süresince kapatılır
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        library, content_file, topic_count = decoder.library()
+        if content_file and content_store is not None:
+            content_store.set_path(content_store.path.with_name(content_file))
+        for _ in range(topic_count):
+            topic = decoder.topic(None)
+            library.topics.append(topic)
+            if on_topic is not None:
+                on_topic(topic)
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        raise ValueError(f"İkili önbellek okunamadı: {e}") from e
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    library.rebuild_index()
+    return library
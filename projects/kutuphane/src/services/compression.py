@@ -0,0 +1,114 @@
+"""
+Kütüphane dosyaları için sıkıştırma desteği
+Dosya adı `.gz` ile bitiyorsa gzip, `.zst` ile bitiyorsa zstd ile
+yazılır; okurken biçim dosyanın ilk baytlarından anlaşılır. Sıkıştırma
+akış olarak yapılır, dosyanın tamamı bellekte tutulmaz. zstd desteği
+isteğe bağlı `zstandard` paketi kuruluysa vardır.
+"""
+
+import gzip
+import io
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, TextIO, Union
+
+try:
+    import zstandard
+except ImportError:  # İsteğe bağlı bağımlılık
+    zstandard = None
+
+
+GZIP = 'gzip'
+ZSTD = 'zstd'
+
+_GZIP_MAGIC = b'\x1f\x8b'
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+# Kayıt sıklığı düşünülerek hız ağırlıklı seviyeler
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def zstd_available() -> bool:
+    """zstandard paketi kurulu mu"""
+    return zstandard is not None
+
+
+def compression_for_path(path: Union[str, Path]) -> Optional[str]:
+    """Dosya uzantısına göre yazarken kullanılacak sıkıştırma (yoksa None)"""
+    suffix = Path(path).suffix.lower()
+    if suffix == '.gz':
+        return GZIP
+    if suffix in ('.zst', '.zstd'):
+        return ZSTD
+    return None
+
+
+def _require_zstd() -> None:
+    if zstandard is None:
+        raise ValueError("zstd dosyaları için 'zstandard' paketi kurulmalı")
+
+
+@contextmanager
+def text_writer(raw: BinaryIO, compression: Optional[str]) -> Iterator[TextIO]:
+    """
+    Açık ikili dosyanın üzerine (gerekirse sıkıştıran) UTF-8 metin akışı kurar
+
+    Blok bittiğinde sıkıştırma akışı sonlandırılır ama `raw` açık kalır;
+    çağıran fsync ve kapatma işlemlerini kendisi yapabilir.
+
+    Args:
+        raw: İkili modda açılmış hedef dosya
+        compression: None, GZIP veya ZSTD
+    """
+    if compression == GZIP:
+        # mtime=0: aynı içerik her seferinde aynı baytlara sıkışsın
+        stream = gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=GZIP_LEVEL, mtime=0)
+    elif compression == ZSTD:
+        _require_zstd()
+        stream = zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(raw, closefd=False)
+    else:
+        stream = raw
+
+    text = io.TextIOWrapper(stream, encoding='utf-8')
+    yield text
+    text.flush()
+    text.detach()
+    if stream is not raw:
+        stream.close()
+
+
+@contextmanager
+def open_text_writer(path: Union[str, Path]) -> Iterator[TextIO]:
+    """Dosyayı uzantısına göre sıkıştırarak yazmak için açar"""
+    with open(path, 'wb') as raw:
+        with text_writer(raw, compression_for_path(path)) as text:
+            yield text
+
+
+@contextmanager
+def open_text_reader(path: Union[str, Path]) -> Iterator[TextIO]:
+    """
+    Düz, gzip veya zstd kütüphane dosyasını metin olarak okumak için açar
+
+    Biçim dosya adından değil ilk baytlardan anlaşılır; böylece yanlış
+    uzantılı dosyalar da okunabilir.
+    """
+    with open(path, 'rb') as raw:
+        magic = raw.read(4)
+        raw.seek(0)
+        if magic.startswith(_GZIP_MAGIC):
+            stream = gzip.GzipFile(fileobj=raw, mode='rb')
+        elif magic == _ZSTD_MAGIC:
+            _require_zstd()
+            stream = zstandard.ZstdDecompressor().stream_reader(raw, closefd=False)
+        else:
+            stream = raw
+
+        text = io.TextIOWrapper(stream, encoding='utf-8')
+        try:
+            yield text
+        finally:
+            text.detach()
+            if stream is not raw:
+                stream.close()
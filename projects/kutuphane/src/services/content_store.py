@@ -0,0 +1,407 @@
+"""
+Konu/örnek gövdeleri için disk tabanlı içerik deposu
+Gövdeler library.content dosyasına eklenerek yazılır; modelde yalnızca
+(offset, uzunluk) referansı tutulur. Dosya belleğe eşlenir (mmap) ve
+metin yalnızca gösterilirken veya aranırken çözülür. Gövdeler içerik
+özetiyle (sha256) adreslenir; aynı gövde dosyaya bir kez yazılır.
+"""
+
+import hashlib
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ..models.library_models import Library, Topic, Example
+
+
+class ContentRef:
+    """İçerik dosyasındaki tek bir gövdenin konumu"""
+
+    __slots__ = ('store', 'offset', 'length')
+
+    def __init__(self, store: 'ContentStore', offset: int, length: int):
+        self.store = store
+        self.offset = offset
+        self.length = length
+
+    def load(self) -> str:
+        """Gövdeyi (önbellekten veya diskten) döndürür"""
+        return self.store.read(self.offset, self.length)
+
+    def view(self) -> memoryview:
+        """Gövdenin çözülmemiş baytlarını kopyalamadan döndürür"""
+        return self.store.view(self.offset, self.length)
+
+    def preview(self, limit: int) -> str:
+        """Gövdenin yalnızca ilk `limit` karakterini çözer"""
+        return self.store.read_prefix(self.offset, self.length, limit)
+
+
+class PendingContent:
+    """
+    İçerik dosyasına henüz yazılmamış gövde
+
+    Anlık görüntüde bellekteki metnin yerini tutar. Kayıt thread'inde
+    ContentStore.store_pending ile dosyaya eklenip diske zorlandıktan
+    sonra `ref` doldurulur; görüntü bu referansla yazılır.
+    """
+
+    __slots__ = ('text', 'ref')
+
+    def __init__(self, text: str):
+        self.text: Optional[str] = text
+        self.ref: Optional[ContentRef] = None
+
+
+class ContentStore:
+    """
+    Yalnızca sona ekleme yapılan, belleğe eşlenmiş içerik dosyası
+
+    Yazılmış bir bölge hiçbir zaman değiştirilmez; böylece eski bir
+    library.json'daki referanslar da geçerli kalır. Değişen gövdeler
+    dosyanın sonuna yeniden eklenir; dosyada zaten bulunan bir gövde
+    (aynı sha256) tekrar yazılmaz, mevcut referans paylaşılır. Özet
+    indeksi `<dosya>.idx` içinde tutulur. Okumalar mmap üzerinden yapılır;
+    sayfalar işletim sisteminin sayfa önbelleğinde kalır, Python
+    heap'ine yalnızca çözülen metinler girer. Çözülen metinler toplam
+    karakter bütçeli bir LRU önbelleğinde tutulur.
+    """
+
+    # Önbellekteki çözülmüş metinlerin toplam karakter bütçesi
+    DEFAULT_CACHE_CHARS = 8 * 1024 * 1024
+
+    def __init__(self, path: Union[str, Path], cache_chars: int = DEFAULT_CACHE_CHARS):
+        """
+        ContentStore constructor
+
+        Args:
+            path: İçerik dosyasının yolu
+            cache_chars: LRU önbelleğinin toplam karakter bütçesi
+        """
+        self.path = Path(path)
+        self._cache_chars = cache_chars
+        self._cached_chars = 0
+        self._cache: "OrderedDict[int, str]" = OrderedDict()
+        self._map: Optional[mmap.mmap] = None
+        self._writer = None
+        # sha256 özeti -> gövde referansı (ilk eklemede .idx dosyasından okunur)
+        self._by_hash: Dict[bytes, ContentRef] = {}
+        self._index_loaded = False
+        self._index_writer = None
+        # Arka plan aramaları gövdeleri başka thread'den de okuyabilir
+        self._lock = threading.Lock()
+
+    @property
+    def index_path(self) -> Path:
+        """Özet indeksi dosyasının yolu"""
+        return self.path.with_name(self.path.name + ".idx")
+
+    def set_path(self, path: Union[str, Path]) -> None:
+        """Depoyu başka bir içerik dosyasına yönlendirir (yükleme sırasında)"""
+        with self._lock:
+            self._reset(Path(path))
+
+    def ref(self, offset: int, length: int) -> ContentRef:
+        """Var olan bir gövde için referans oluşturur"""
+        return ContentRef(self, offset, length)
+
+    def read(self, offset: int, length: int) -> str:
+        """
+        Gövdeyi okur
+
+        Args:
+            offset: Dosyadaki bayt konumu
+            length: Bayt cinsinden uzunluk
+
+        Returns:
+            str: Gövde metni
+        """
+        with self._lock:
+            text = self._cache.get(offset)
+            if text is not None:
+                self._cache.move_to_end(offset)
+                return text
+
+            text = str(self._view(offset, length), 'utf-8')
+            self._remember(offset, text)
+            return text
+
+    def view(self, offset: int, length: int) -> memoryview:
+        """
+        Gövdenin baytlarını eşlenmiş dosyadan kopyalamadan döndürür
+
+        Args:
+            offset: Dosyadaki bayt konumu
+            length: Bayt cinsinden uzunluk
+
+        Returns:
+            memoryview: Salt okunur UTF-8 baytları
+        """
+        with self._lock:
+            return self._view(offset, length)
+
+    def read_prefix(self, offset: int, length: int, limit: int) -> str:
+        """
+        Gövdenin yalnızca başını çözer (önizleme için)
+
+        Args:
+            offset: Dosyadaki bayt konumu
+            length: Bayt cinsinden uzunluk
+            limit: En fazla döndürülecek karakter sayısı
+
+        Returns:
+            str: Gövdenin ilk `limit` karakteri
+        """
+        with self._lock:
+            text = self._cache.get(offset)
+            if text is not None:
+                return text[:limit]
+            # UTF-8'de bir karakter en fazla 4 bayttır; yarım kalan son karakter atılır
+            data = self._view(offset, min(length, limit * 4))
+            return str(data, 'utf-8', 'ignore')[:limit]
+
+    def append(self, text: str) -> ContentRef:
+        """
+        Gövdeyi dosyanın sonuna ekler (kalıcılık için ardından sync çağrılmalı)
+
+        Aynı gövde daha önce yazıldıysa dosyaya dokunulmaz, mevcut
+        referans döndürülür.
+
+        Args:
+            text: Eklenecek metin
+
+        Returns:
+            ContentRef: Gövdenin referansı
+        """
+        with self._lock:
+            ref = self._append_bytes(text.encode('utf-8'))
+            self._remember(ref.offset, text)
+        return ref
+
+    def sync(self) -> None:
+        """Eklenen gövdeleri ve özet indeksini diske zorlar"""
+        with self._lock:
+            # Önce veri, sonra ona işaret eden indeks
+            for handle in (self._writer, self._index_writer):
+                if handle is not None:
+                    handle.flush()
+                    os.fsync(handle.fileno())
+
+    def persist(self, library: Library) -> int:
+        """
+        Bellekteki (yeni veya değişmiş) gövdeleri dosyaya yazar ve modelde
+        referansla değiştirir; library.json yazılmadan önce çağrılır.
+
+        Args:
+            library: Gövdeleri yazılacak kütüphane
+
+        Returns:
+            int: Yazılan gövde sayısı
+        """
+        count = 0
+        for node in _iter_nodes(library):
+            count += self._persist_node(node)
+
+        if count:
+            self.sync()
+        return count
+
+    def store_pending(self, pending: Iterable[PendingContent]) -> int:
+        """
+        Referansı olmayan bekleyen gövdeleri ekler, diske zorlar ve ardından
+        referanslarını doldurur (kayıt thread'inde çağrılır)
+
+        Returns:
+            int: Yazılan gövde sayısı
+        """
+        waiting = [item for item in pending if item.ref is None]
+        if not waiting:
+            return 0
+        refs = [self.append(item.text) for item in waiting]
+        self.sync()
+        for item, ref in zip(waiting, refs):
+            item.ref = ref
+        return len(waiting)
+
+    def compact(self, library: Library, new_path: Union[str, Path]) -> int:
+        """
+        Kütüphanede kullanılan gövdeleri tekilleştirerek yeni bir dosyaya yazar
+        ve depoyu o dosyaya geçirir (dedup bakım işlemi).
+
+        Eski dosya silinmez; ona işaret eden library.json yenisiyle
+        değiştirildikten sonra çağıran tarafından silinmelidir. Hata olursa
+        model ve depo eski dosyada kalır.
+
+        Args:
+            library: Gövdeleri taşınacak kütüphane
+            new_path: Yeni içerik dosyasının yolu
+
+        Returns:
+            int: Başka bir düğümle aynı olduğu için ayrıca yazılmayan gövde sayısı
+        """
+        old_path = self.path
+        old_reader = ContentStore(old_path) if old_path.exists() else None
+        moves: List[Tuple[Union[Topic, Example], ContentRef]] = []
+        duplicates = 0
+
+        with self._lock:
+            self._reset(Path(new_path))
+            try:
+                for node in _iter_nodes(library):
+                    ref = node._content_ref
+                    if ref is not None:
+                        data = old_reader.view(ref.offset, ref.length)
+                    elif node._content:
+                        data = node._content.encode('utf-8')
+                    else:
+                        continue
+                    known = len(self._by_hash)
+                    moves.append((node, self._append_bytes(data)))
+                    if len(self._by_hash) == known:
+                        duplicates += 1
+                for handle in (self._writer, self._index_writer):
+                    if handle is not None:
+                        handle.flush()
+                        os.fsync(handle.fileno())
+            except Exception:
+                self._reset(old_path)
+                raise
+            finally:
+                if old_reader is not None:
+                    old_reader.close()
+
+        # Yeni dosya diskte; düğümleri toplu olarak yeni referanslara geçir
+        for node, ref in moves:
+            node._content_ref = ref
+            node._content = ""
+        return duplicates
+
+    def close(self) -> None:
+        """Açık dosya tanıtıcılarını kapatır"""
+        with self._lock:
+            self._close_handles()
+
+    # Private Methods
+    def _reset(self, path: Path) -> None:
+        """Depoyu başka bir dosyaya yönlendirir (kilit alınmış olmalı)"""
+        self._close_handles()
+        self.path = path
+
+    def _close_handles(self) -> None:
+        """Dosya tanıtıcılarını kapatıp önbellekleri temizler (kilit alınmış olmalı)"""
+        for handle in (self._writer, self._index_writer):
+            if handle is not None:
+                handle.close()
+        self._writer = None
+        self._index_writer = None
+        self._unmap()
+        self._cache.clear()
+        self._cached_chars = 0
+        self._by_hash.clear()
+        self._index_loaded = False
+
+    def _append_bytes(self, data: Union[bytes, memoryview]) -> ContentRef:
+        """Gövde baytlarını (yoksa) ekler ve referansını döndürür (kilit alınmış olmalı)"""
+        digest = hashlib.sha256(data).digest()
+        self._load_index()
+        ref = self._by_hash.get(digest)
+        if ref is not None:
+            return ref
+
+        if self._writer is None:
+            self._writer = open(self.path, 'ab')
+            self._index_writer = open(self.index_path, 'a', encoding='ascii')
+        offset = self._writer.seek(0, os.SEEK_END)
+        self._writer.write(data)
+        # Eşleme yeni veriyi görebilsin
+        self._writer.flush()
+        self._index_writer.write(f"{digest.hex()} {offset} {len(data)}\n")
+
+        ref = ContentRef(self, offset, len(data))
+        self._by_hash[digest] = ref
+        return ref
+
+    def _load_index(self) -> None:
+        """Özet indeksini dosyadan okur (kilit alınmış olmalı)"""
+        if self._index_loaded:
+            return
+        self._index_loaded = True
+        if not self.index_path.exists() or not self.path.exists():
+            return
+
+        size = self.path.stat().st_size
+        with open(self.index_path, 'r', encoding='ascii') as file:
+            for line in file:
+                try:
+                    digest, offset, length = line.split()
+                    offset, length = int(offset), int(length)
+                    digest = bytes.fromhex(digest)
+                except ValueError:
+                    # Çökme sırasında yarım kalmış satır
+                    continue
+                # Verisi diske ulaşmamış kayıtlar yok sayılır
+                if offset + length <= size:
+                    self._by_hash[digest] = ContentRef(self, offset, length)
+
+    def _persist_node(self, node: Union[Topic, Example]) -> int:
+        """Düğümün bellekteki gövdesini yazar (boş gövdeler bellekte kalır)"""
+        if node._content_ref is not None or not node._content:
+            return 0
+        node._content_ref = self.append(node._content)
+        node._content = ""
+        return 1
+
+    def _view(self, offset: int, length: int) -> memoryview:
+        """Eşlemeyi gerekirse büyütüp istenen bölgeyi döndürür (kilit alınmış olmalı)"""
+        end = offset + length
+        if self._map is None or len(self._map) < end:
+            # Dosya sona eklemelerle büyüdü; yeni boyutla tekrar eşle
+            with open(self.path, 'rb') as file:
+                if os.fstat(file.fileno()).st_size < end:
+                    raise ValueError(f"İçerik dosyası eksik: {self.path} ({offset}+{length})")
+                self._unmap()
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(self._map)[offset:end]
+
+    def _unmap(self) -> None:
+        """Eşlemeyi bırakır"""
+        if self._map is None:
+            return
+        try:
+            self._map.close()
+        except BufferError:
+            # Dışarıda hâlâ view var; eşleme son view ile birlikte kapanır
+            pass
+        self._map = None
+
+    def _remember(self, offset: int, text: str) -> None:
+        """Gövdeyi LRU önbelleğine ekler (bütçeden büyük gövdeler tutulmaz)"""
+        if len(text) > self._cache_chars // 4:
+            return
+        previous = self._cache.pop(offset, None)
+        if previous is not None:
+            self._cached_chars -= len(previous)
+        self._cache[offset] = text
+        self._cached_chars += len(text)
+        while self._cached_chars > self._cache_chars:
+            _, evicted = self._cache.popitem(last=False)
+            self._cached_chars -= len(evicted)
+
+
+def _iter_nodes(library: Library) -> Iterator[Union[Topic, Example]]:
+    """Kütüphanedeki tüm konu ve örnekleri gezer"""
+    stack = list(library.topics)
+    while stack:
+        topic = stack.pop()
+        yield topic
+        yield from topic.examples
+        stack.extend(topic.children)
+
+
+def attach_content_ref(node: Union[Topic, Example], ref: Optional[ContentRef]) -> None:
+    """Düğümün gövdesini diskteki referansa bağlar (bellekteki metni bırakır)"""
+    node._content_ref = ref
+    node._content = ""
@@ -4,21 +4,48 @@ JSON tabanlı veri yönetim servisi
 
 import json
 import os
-from typing import Optional
+import shutil
+import tempfile
+import threading
+import uuid
+from typing import Optional, Any, Callable, Dict, List, Tuple, IO
 from pathlib import Path
 
 from ..models.library_models import Library, Topic, Example
+from .backups import BackupRotator, link_or_copy
+from .binary_snapshot import read_binary_snapshot, read_source_key, write_binary_snapshot
+from .compression import compression_for_path, open_text_reader, open_text_writer, text_writer
+from .content_store import ContentStore, PendingContent, attach_content_ref
+from .journal import Journal, replay_records
+from .json_stream import (
+    FrozenList, dump_frozen_library, dump_library_stream, freeze_library, freeze_topic,
+    load_library_stream,
+)
 
 
 class DataService:
     """JSON dosyası ile veri yönetimi yapan servis"""
     
-    def __init__(self, data_file_path: str = None):
+    # Günlük bu boyuta ulaşınca tam kayda katlanır (compaction)
+    COMPACTION_THRESHOLD = 256 * 1024
+    
+    def __init__(self, data_file_path: str = None, use_journal: bool = True,
+                 lazy_content: bool = False, binary_cache: bool = True,
+                 json_indent: Optional[int] = 2,
+                 backup_count: int = BackupRotator.DEFAULT_KEEP):
         """
         DataService constructor
         
         Args:
             data_file_path: JSON dosyasının yolu. Belirtilmezse varsayılan yol kullanılır.
+                `.json.gz` / `.json.zst` uzantılı dosyalar sıkıştırılarak yazılır.
+            use_journal: True ise her düzenleme library.journal dosyasına eklenir
+            lazy_content: True ise konu/örnek gövdeleri library.content dosyasında
+                tutulur ve yalnızca erişildiğinde okunur
+            binary_cache: True ise kapanışta library.cache ikili önbelleği
+                yazılır ve library.json değişmediyse açılışta o okunur
+            json_indent: JSON girinti boşluk sayısı (None ise tek satır)
+            backup_count: Her kayıtta alınan dönen yedeklerden saklanacak sayı
         """
         if data_file_path is None:
             # Proje kök dizinini bul
@@ -30,23 +57,80 @@ class DataService:
         # Veri klasörünü oluştur
         self.data_file_path.parent.mkdir(parents=True, exist_ok=True)
         
+        self._json_indent = json_indent
         self._library: Optional[Library] = None
+        # Son başarılı kayıttaki değişiklik sayacı (None: hiç kaydedilmedi)
+        self._saved_generation: Optional[int] = None
+        # Aynı anda yalnızca bir yazma işlemi (GUI veya arka plan thread'i)
+        self._write_lock = threading.Lock()
+        
+        # Düzenleme günlüğü (write-ahead log)
+        self._journal: Optional[Journal] = None
+        if use_journal:
+            self._journal = Journal(self.data_file_path.with_suffix('.journal'))
+        # Günlüğe yazılmış son değişiklik sayacı
+        self._journal_generation: Optional[int] = None
+        # Yüklemede oynatılamayan günlük; tam kayıtlar onu döndürmez ve silmez
+        self._journal_pending = False
+        
+        # Gövde deposu; dosyada referans varsa tembel modda olmasak da okunur
+        self._lazy_content = lazy_content
+        self._content_store = ContentStore(self.data_file_path.with_suffix('.content'))
+        # dedup sonrası artık kullanılmayan içerik dosyaları ve geçişin değişiklik sayacı
+        self._obsolete_content_files: List[Path] = []
+        self._content_switch_generation = 0
+        
+        # Hızlı açılış için ikili önbellek (JSON değişim biçimi olarak kalır)
+        self._cache_path: Optional[Path] = None
+        if binary_cache:
+            self._cache_path = self.data_file_path.with_suffix('.cache')
+        # Bu servisin son okuduğu/yazdığı library.json'un (boyut, mtime_ns) çifti;
+        # dosya başka biri tarafından değiştirildiyse önbellek yazılmaz
+        self._json_source_key: Optional[Tuple[int, int]] = None
+        
+        # Kayıt öncesi yedekler (hard link, kopyalama yok)
+        self._backups = BackupRotator(self.data_file_path, keep=backup_count)
+        
+        # Konu görüntüleri (Topic._frozen) hangi kütüphane ve içerik dosyası
+        # adı için alındı; farklıysa görüntüler baştan alınır
+        self._frozen_library: Optional[Library] = None
+        self._frozen_content_file: Optional[str] = None
+        # record_change ile izlenen son değişiklik sayacı; model başka yoldan
+        # değiştiyse (yalnızca mark_dirty ile) farklıdır
+        self._frozen_generation: Optional[int] = None
+        # Görüntülerdeki, içerik dosyasına kayıt thread'inde yazılan gövdeler:
+        # (düğüm, PendingContent); referansları bir sonraki görüntüde modele bağlanır
+        self._pending_content: List[Tuple[Any, PendingContent]] = []
     
-    def load_library(self) -> Library:
+    def load_library(self, on_topic: Optional[Callable[[Topic], None]] = None) -> Library:
         """
         Kütüphane verisini yükler. Dosya yoksa yeni kütüphane oluşturur.
         
+        Dosya akış olarak okunur; ara sözlük ağacı kurulmadığından en yüksek
+        bellek kullanımı kütüphanenin kendisine yakındır. library.json son
+        kapanıştan beri değişmediyse onun yerine ikili önbellek okunur.
+        
+        Args:
+            on_topic: Her ana konu okunduğunda (dosyanın tamamı beklenmeden) çağrılır
+        
         Returns:
             Library: Yüklenen veya yeni oluşturulan kütüphane
         """
         if self._library is not None:
             return self._library
         
+        loaded = False
         try:
             if self.data_file_path.exists():
-                with open(self.data_file_path, 'r', encoding='utf-8') as file:
-                    data = json.load(file)
-                    self._library = Library.from_dict(data)
+                self._json_source_key = self._source_key()
+                self._library = self._load_binary_cache(on_topic)
+                if self._library is None:
+                    with open_text_reader(self.data_file_path) as file:
+                        self._library = load_library_stream(
+                            file, on_topic, content_store=self._content_store
+                        )
+                self._mark_saved()
+                loaded = True
             else:
                 # Varsayılan kütüphane oluştur
                 self._library = self._create_default_library()
@@ -55,7 +139,7 @@ class DataService:
             print(f"Veri yüklenirken hata oluştu: {e}")
             # Hatalı dosya varsa backup oluştur
             if self.data_file_path.exists():
-                backup_path = self.data_file_path.with_suffix('.json.backup')
+                backup_path = self.data_file_path.with_name(self.data_file_path.name + '.backup')
                 self.data_file_path.rename(backup_path)
                 print(f"Hatalı dosya {backup_path} olarak yedeklendi")
             
@@ -63,35 +147,439 @@ class DataService:
             self._library = self._create_default_library()
             self.save_library()
         
+        # Dosya sağlam okunduysa günlük uygulanır; günlükteki sorunlar
+        # dosyanın yedeğe alınıp varsayılan kütüphaneyle değiştirilmesine yol açmaz
+        if loaded:
+            self._replay_journal()
+        
         return self._library
     
-    def save_library(self) -> bool:
+    def save_library(self, force: bool = False) -> bool:
         """
-        Kütüphane verisini kaydeder.
+        Kütüphane verisini kaydeder. Son kayıttan bu yana değişiklik
+        yoksa backup ve yazma adımları tamamen atlanır.
+        
+        Args:
+            force: True ise değişiklik olmasa da yazar
         
         Returns:
-            bool: Kaydetme işlemi başarılı ise True
+            bool: Kaydetme işlemi başarılı (veya gereksiz) ise True
         """
         if self._library is None:
             return False
         
+        if not force and not self._snapshot_is_stale():
+            return True
+        
+        # Aynı thread'de model değişemeyeceği için görüntü almadan doğrudan yaz
+        library = self._library
         try:
-            # Backup oluştur
-            if self.data_file_path.exists():
-                backup_path = self.data_file_path.with_suffix('.json.bak')
-                with open(self.data_file_path, 'r', encoding='utf-8') as original:
-                    with open(backup_path, 'w', encoding='utf-8') as backup:
-                        backup.write(original.read())
-            
-            # Yeni veriyi kaydet
-            with open(self.data_file_path, 'w', encoding='utf-8') as file:
-                json.dump(self._library.to_dict(), file, indent=2, ensure_ascii=False)
-            
+            self._persist_content()
+        except OSError as e:
+            print(f"Veri kaydedilirken hata oluştu: {e}")
+            return False
+        self._rotate_journal()
+        return self._write_library_file(
+            library.generation,
+            lambda file: dump_library_stream(library, file, indent=self._json_indent,
+                                             content_file=self._content_file_name())
+        )
+    
+    def record_change(self, op: str, **payload: Any) -> None:
+        """
+        Bir düzenlemeyi kaydeder: kütüphaneyi değişmiş olarak işaretler
+        ve günlük açıksa düzenlemeyi küçük bir kayıt olarak ekler.
+        
+        Args:
+            op: İşlem adı (add_topic, update_topic, delete_topic, ...)
+            **payload: İşleme ait veriler
+        """
+        if self._library is None:
+            return
+        
+        self._library.mark_dirty()
+        self._invalidate_frozen(op, payload)
+        if self._journal is None:
+            return
+        
+        try:
+            self._journal.append(op, payload)
+            self._journal_generation = self._library.generation
+        except OSError as e:
+            print(f"Günlüğe yazılırken hata oluştu: {e}")
+    
+    def needs_compaction(self) -> bool:
+        """
+        Günlüğün tam kayda katlanması gerekiyor mu kontrol eder.
+        
+        Returns:
+            bool: Günlük eşik değerini aştıysa ve tam kayıt geride kaldıysa True
+        """
+        return (self._journal is not None and not self._journal_pending
+                and self._snapshot_is_stale()
+                and self._journal.size() >= self.COMPACTION_THRESHOLD)
+    
+    def create_snapshot(self) -> Optional[Tuple[int, Any]]:
+        """
+        Kaydedilecek verinin anlık görüntüsünü alır (GUI thread'inde çağrılır).
+        
+        Görüntü, modelden bağımsız değişmez tuple'lardan oluşur (bkz.
+        freeze_topic); metinler kopyalanmaz, paylaşılır. Her konunun
+        görüntüsü konuda saklanır ve yalnızca record_change ile konunun
+        veya alt ağacının değiştiği bildirildiyse yeniden alınır; böylece
+        maliyet kütüphane boyutuna değil değişen konulara bağlıdır.
+        Serileştirme write_snapshot ile başka bir thread'de yapılır.
+        Tembel içerik modunda bellekteki gövdeler yalnızca toplanır; içerik
+        dosyasına yazma ve fsync da kayıt thread'inde yapılır. Önceki
+        kayıtlarda yazılmış gövdelerin referansları burada modele bağlanır.
+        
+        Model record_change dışında değiştirildiyse hangi konuların
+        değiştiği bilinmediğinden tüm görüntüler yeniden alınır.
+        
+        Returns:
+            Optional[Tuple[int, Any]]: (değişiklik sayacı, veri) veya kütüphane yoksa None
+        """
+        library = self._library
+        if library is None:
+            return None
+        
+        content_file = self._content_file_name()
+        refreeze_all = (library is not self._frozen_library
+                        or library.generation != self._frozen_generation
+                        or content_file != self._frozen_content_file)
+        pending = self._attach_pending_content(keep_unwritten=not refreeze_all)
+        
+        def freeze(topic: Topic) -> Any:
+            frozen = topic._frozen
+            if frozen is None or refreeze_all:
+                children = FrozenList(freeze(child) for child in topic.children)
+                frozen = topic._frozen = freeze_topic(topic, children, content_file, pending)
+            return frozen
+        
+        topics = FrozenList(freeze(topic) for topic in library.topics)
+        self._pending_content = pending
+        frozen_library = freeze_library(library, topics, content_file)
+        snapshot = (library.generation, (frozen_library, content_file, [item for _, item in pending]))
+        self._frozen_library = library
+        self._frozen_content_file = content_file
+        self._frozen_generation = library.generation
+        
+        # Bu ana kadarki kayıtlar görüntüye dahil; yenileri ayrı dosyaya gitsin
+        self._rotate_journal()
+        return snapshot
+    
+    def write_snapshot(self, snapshot: Optional[Tuple[int, Any]]) -> bool:
+        """
+        Anlık görüntüyü serileştirip diske yazar. Herhangi bir thread'den çağrılabilir.
+        
+        Veri önce aynı klasördeki geçici dosyaya yazılıp fsync edilir,
+        ardından atomik olarak asıl dosyanın yerine taşınır. Yazma
+        yarıda kesilirse mevcut dosya bozulmaz.
+        
+        Args:
+            snapshot: create_snapshot ile alınan görüntü
+        
+        Returns:
+            bool: Kaydetme işlemi başarılı ise True
+        """
+        if snapshot is None:
+            return False
+        
+        generation, (frozen, content_file, pending) = snapshot
+        return self._write_library_file(
+            generation,
+            lambda file: dump_frozen_library(frozen, file, indent=self._json_indent),
+            lambda: self._store_pending_content(content_file, pending)
+        )
+    
+    def _write_library_file(self, generation: int, write_func: Callable[[IO[str]], None],
+                            prepare: Optional[Callable[[], None]] = None) -> bool:
+        """
+        Yedek alıp veriyi atomik olarak yazar ve kayıt durumunu günceller.
+        
+        Args:
+            generation: Yazılan verinin değişiklik sayacı
+            write_func: Açık dosyaya veriyi yazan fonksiyon
+            prepare: Yazma kilidi altında, yedekten önce çağrılır (ör. gövdeleri yazmak için)
+        
+        Returns:
+            bool: Kaydetme işlemi başarılı ise True
+        """
+        try:
+            with self._write_lock:
+                # Daha yeni bir kayıt zaten yazıldıysa eski görüntüyle üzerine yazma
+                if self._saved_generation is not None and generation < self._saved_generation:
+                    return True
+                if prepare is not None:
+                    prepare()
+                
+                # Eski dosyayı yedeğe bağla (veri okunmaz/kopyalanmaz)
+                self._backups.backup()
+                
+                # Yeni veriyi kaydet
+                self._write_atomic(self.data_file_path, write_func)
+                self._saved_generation = generation
+                self._json_source_key = self._source_key()
+                
+                # Yeni içerik dosyasını gösteren kayıt yazıldı; eskiler silinebilir
+                if self._obsolete_content_files and generation >= self._content_switch_generation:
+                    self._remove_obsolete_content_files()
+            if self._journal is not None and not self._journal_pending:
+                self._journal.discard_rotated()
+            self._backups.prune_async()
             return True
         except Exception as e:
             print(f"Veri kaydedilirken hata oluştu: {e}")
             return False
     
+    def dedup_content(self) -> int:
+        """
+        Aynı içerikli konu/örnek gövdelerini tekilleştirir (bakım işlemi).
+        
+        Tembel içerik modunda kullanılan gövdeler yeni bir içerik dosyasına
+        birer kez yazılır; eski dosya yeni library.json kaydedildikten sonra
+        silinir. Diğer modda aynı metinler bellekte tek nesneyi paylaşır.
+        
+        Returns:
+            int: Tekilleştirilen gövde sayısı
+        """
+        if self._library is None:
+            return 0
+        if not self._lazy_content:
+            return self._share_identical_bodies()
+        
+        old_path = self._content_store.path
+        new_path = old_path.with_name(f"{self.data_file_path.stem}.{uuid.uuid4().hex[:8]}.content")
+        # Kayıt thread'i gövde eklerken içerik dosyası değiştirilmez
+        with self._write_lock:
+            try:
+                duplicates = self._content_store.compact(self._library, new_path)
+            except (OSError, ValueError) as e:
+                print(f"İçerik tekilleştirilirken hata oluştu: {e}")
+                return 0
+            self._obsolete_content_files.append(old_path)
+            self._library.mark_dirty()
+            self._content_switch_generation = self._library.generation
+        self.save_library()
+        return duplicates
+    
+    def write_binary_cache(self) -> bool:
+        """
+        Kütüphaneyi ikili başlangıç önbelleğine yazar.
+        
+        Önbellek library.json'un o anki boyutu ve değiştirilme zamanıyla
+        etiketlenir; bu yüzden yalnızca model diskteki JSON ile aynıyken
+        (tam kayıttan sonra değişiklik yokken ve dosya bu servis dışında
+        değiştirilmemişken) yazılır. Önbellek zaten güncelse tekrar
+        yazılmaz.
+        
+        Returns:
+            bool: Önbellek güncelse (yazıldıysa veya zaten güncelse) True
+        """
+        if self._cache_path is None or self._library is None or self._snapshot_is_stale():
+            return False
+        
+        library = self._library
+        try:
+            with self._write_lock:
+                source_key = self._source_key()
+                if source_key != self._json_source_key:
+                    return False
+                if self._cache_path.exists():
+                    with open(self._cache_path, 'rb') as file:
+                        if read_source_key(file.read(64)) == source_key:
+                            return True
+                self._write_atomic(
+                    self._cache_path,
+                    lambda file: write_binary_snapshot(library, file, source_key,
+                                                       self._content_file_name()),
+                    binary=True
+                )
+            return True
+        except OSError as e:
+            print(f"İkili önbellek yazılırken hata oluştu: {e}")
+            return False
+    
+    def close(self) -> None:
+        """İkili önbelleği günceller, yedek budamasını bekler, dosyaları kapatır"""
+        self.write_binary_cache()
+        self._backups.close()
+        if self._journal is not None:
+            self._journal.close()
+        self._content_store.close()
+    
+    def has_unsaved_changes(self) -> bool:
+        """
+        Diske (tam kayıt veya günlük) yazılmamış değişiklik var mı kontrol eder.
+        
+        Returns:
+            bool: Kaydedilmemiş değişiklik varsa True
+        """
+        if self._library is None:
+            return False
+        generation = self._library.generation
+        return generation != self._saved_generation and generation != self._journal_generation
+    
+    def _snapshot_is_stale(self) -> bool:
+        """Son tam kayıttan bu yana kütüphane değişti mi"""
+        return self._library is not None and self._library.generation != self._saved_generation
+    
+    def _source_key(self) -> Tuple[int, int]:
+        """library.json'un (boyut, mtime_ns) çifti; önbelleğin geçerlilik anahtarı"""
+        stat = os.stat(self.data_file_path)
+        return stat.st_size, stat.st_mtime_ns
+    
+    def _load_binary_cache(self, on_topic: Optional[Callable[[Topic], None]]) -> Optional[Library]:
+        """İkili önbellek library.json'un güncel haline aitse ondan yükler"""
+        if self._cache_path is None or not self._cache_path.exists():
+            return None
+        try:
+            return read_binary_snapshot(self._cache_path.read_bytes(), self._json_source_key,
+                                        on_topic, self._content_store)
+        except (OSError, ValueError) as e:
+            print(f"İkili önbellek kullanılamadı, JSON okunuyor: {e}")
+            return None
+    
+    def _rotate_journal(self) -> None:
+        """Tam kayıt başlarken günlüğü döndürür (oynatılamamış günlük yerinde kalır)"""
+        if self._journal is not None and not self._journal_pending:
+            self._journal.rotate()
+    
+    def _mark_saved(self) -> None:
+        """Mevcut kütüphane halini kaydedilmiş olarak işaretler"""
+        self._saved_generation = self._library.generation
+    
+    def _content_file_name(self) -> Optional[str]:
+        """Tembel içerik modunda library.json'a yazılacak içerik dosyası adı"""
+        return self._content_store.path.name if self._lazy_content else None
+    
+    def _remove_obsolete_content_files(self) -> None:
+        """dedup ile yerine yenisi yazılmış içerik dosyalarını siler"""
+        for path in self._obsolete_content_files:
+            for obsolete in (path, path.with_name(path.name + ".idx")):
+                try:
+                    if obsolete.exists():
+                        os.remove(obsolete)
+                except OSError as e:
+                    print(f"Eski içerik dosyası silinemedi: {e}")
+        self._obsolete_content_files.clear()
+    
+    def _share_identical_bodies(self) -> int:
+        """Bellekteki aynı gövde metinlerinin tek bir nesneyi paylaşmasını sağlar"""
+        pool: Dict[str, str] = {}
+        shared = 0
+        stack = list(self._library.topics)
+        while stack:
+            topic = stack.pop()
+            for node in [topic] + topic.examples:
+                text = node._content
+                if node._content_ref is not None or not text:
+                    continue
+                existing = pool.setdefault(text, text)
+                if existing is not text:
+                    node._content = existing
+                    shared += 1
+            stack.extend(topic.children)
+        return shared
+    
+    def _invalidate_frozen(self, op: str, payload: Dict[str, Any]) -> None:
+        """
+        Düzenlemenin etkilediği konuların görüntülerini üst konularıyla
+        birlikte geçersiz kılar (create_snapshot bunları yeniden alır).
+        
+        Etkilenen konu kayıttan çıkarılamıyorsa sonraki görüntüde tüm
+        konular yeniden alınır.
+        """
+        library = self._library
+        if op == 'add_topic':
+            topic = library.find_topic_by_id(payload.get('topic', {}).get('id'))
+            if topic is None:
+                self._frozen_library = None
+                return
+            # Eklenen alt ağaçta eski görüntü kalmasın
+            stack = [topic]
+            while stack:
+                current = stack.pop()
+                current._frozen = None
+                stack.extend(current.children)
+        elif op == 'update_topic' and 'id' in payload:
+            topic = library.find_topic_by_id(payload['id'])
+        elif op == 'delete_topic' and 'parent_id' in payload:
+            # Silinen alt ağaç modelden ayrıldı; görüntüsü onunla birlikte gider
+            topic = library.find_topic_by_id(payload['parent_id']) if payload['parent_id'] else None
+        elif op in ('add_example', 'update_example', 'delete_example') and 'topic_id' in payload:
+            topic = library.find_topic_by_id(payload['topic_id'])
+        else:
+            self._frozen_library = None
+            return
+        
+        while topic is not None:
+            topic._frozen = None
+            topic = topic.parent
+        self._frozen_generation = library.generation
+    
+    def _persist_content(self) -> None:
+        """Tembel içerik modunda bellekteki gövdeleri içerik dosyasına yazar"""
+        if self._lazy_content and self._library is not None:
+            self._content_store.persist(self._library)
+    
+    def _attach_pending_content(self, keep_unwritten: bool) -> List[Tuple[Any, PendingContent]]:
+        """
+        Kayıt thread'inde yazılmış gövdelerin referanslarını modele bağlar
+        (GUI thread'inde). Gövdesi o arada değişmiş düğümlere dokunulmaz.
+        
+        Args:
+            keep_unwritten: Henüz yazılmamış gövdeler (hâlâ görüntülerde
+                oldukları için) bir sonraki kayıtta yazılmak üzere tutulsun mu
+        
+        Returns:
+            List[Tuple[Any, PendingContent]]: Yeni görüntünün ekleyeceği gövdelerle
+            birlikte yazılacak bekleyen gövdeler
+        """
+        unwritten = []
+        for node, item in self._pending_content:
+            if item.ref is None:
+                if keep_unwritten:
+                    unwritten.append((node, item))
+                continue
+            if node._content_ref is None and node._content is item.text:
+                attach_content_ref(node, item.ref)
+            # Görüntü artık yalnızca referansı kullanır; metin bellekten bırakılır
+            item.text = None
+        return unwritten
+    
+    def _store_pending_content(self, content_file: Optional[str],
+                               pending: List[PendingContent]) -> None:
+        """Görüntüdeki bekleyen gövdeleri içerik dosyasına yazar (kayıt thread'inde)"""
+        if not pending:
+            return
+        if content_file != self._content_store.path.name:
+            raise OSError(f"İçerik dosyası görüntü alındıktan sonra değişti: {content_file}")
+        self._content_store.store_pending(pending)
+    
+    def _replay_journal(self) -> None:
+        """
+        Son tam kayıttan sonraki günlük kayıtlarını kütüphaneye uygular
+        
+        Günlük okunamazsa kütüphane günlüksüz haliyle açılır; günlük
+        döndürülmez ve silinmez, yeni kayıtlar sonuna eklenmeye devam eder.
+        """
+        if self._journal is None:
+            return
+        
+        try:
+            count = replay_records(self._library, self._journal.read_records())
+        except Exception as e:
+            # Günlük silinmez; sonraki açılışta yeniden oynatılır
+            print(f"Günlük oynatılamadı: {e}")
+            self._journal_pending = True
+            return
+        self._journal_pending = False
+        if count:
+            print(f"Günlükten {count} değişiklik geri yüklendi")
+        # Günlükteki değişiklikler diskte; yalnızca tam kayıt geride
+        self._journal_generation = self._library.generation
+    
     def get_library(self) -> Library:
         """
         Mevcut kütüphaneyi döndürür. Yüklenmemişse yükler.
@@ -116,13 +604,13 @@ class DataService:
         if backup_path is None:
             from datetime import datetime
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_path = self.data_file_path.with_name(f"library_backup_{timestamp}.json")
+            # Sıkıştırılmış dosyanın yedeği de aynı uzantıları taşır (.json.gz)
+            suffixes = "".join(self.data_file_path.suffixes) or ".json"
+            backup_path = self.data_file_path.with_name(f"library_backup_{timestamp}{suffixes}")
         
         try:
             if self.data_file_path.exists():
-                with open(self.data_file_path, 'r', encoding='utf-8') as original:
-                    with open(backup_path, 'w', encoding='utf-8') as backup:
-                        backup.write(original.read())
+                link_or_copy(self.data_file_path, backup_path)
                 return True
         except Exception as e:
             print(f"Backup oluşturulurken hata oluştu: {e}")
@@ -134,26 +622,31 @@ class DataService:
         Başka bir JSON dosyasından veri içe aktarır.
         
         Args:
-            import_path: İçe aktarılacak JSON dosyasının yolu
+            import_path: İçe aktarılacak JSON dosyasının yolu (düz, gzip veya zstd)
             
         Returns:
             bool: İçe aktarma başarılı ise True
         """
         try:
-            with open(import_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-                self._library = Library.from_dict(data)
+            with open_text_reader(import_path) as file:
+                self._library = load_library_stream(file)
+                self._saved_generation = None
+                self._journal_generation = None
+                # Günlük eski kütüphaneye ait; yeni kütüphanenin kaydıyla atılır
+                self._journal_pending = False
                 return self.save_library()
         except Exception as e:
             print(f"Veri içe aktarılırken hata oluştu: {e}")
             return False
     
-    def export_to_file(self, export_path: str) -> bool:
+    def export_to_file(self, export_path: str, indent: Optional[int] = 2) -> bool:
         """
         Mevcut veriyi başka bir JSON dosyasına dışa aktarır.
         
         Args:
-            export_path: Dışa aktarılacak JSON dosyasının yolu
+            export_path: Dışa aktarılacak JSON dosyasının yolu (`.gz` / `.zst`
+                uzantısında sıkıştırılır)
+            indent: Girinti boşluk sayısı; makineler arası aktarım için None
             
         Returns:
             bool: Dışa aktarma başarılı ise True
@@ -162,13 +655,54 @@ class DataService:
             return False
         
         try:
-            with open(export_path, 'w', encoding='utf-8') as file:
-                json.dump(self._library.to_dict(), file, indent=2, ensure_ascii=False)
+            with open_text_writer(export_path) as file:
+                dump_library_stream(self._library, file, indent=indent)
             return True
         except Exception as e:
             print(f"Veri dışa aktarılırken hata oluştu: {e}")
             return False
     
+    def _write_atomic(self, path: Path, write_func: Callable[[IO], None],
+                      binary: bool = False) -> None:
+        """
+        Dosyayı geçici dosya + fsync + os.replace ile atomik olarak yazar.
+        Metin modunda hedef uzantısı `.gz` / `.zst` ise akış sıkıştırılır.
+        
+        Args:
+            path: Hedef dosya yolu
+            write_func: Açık dosyaya içeriği yazan fonksiyon
+            binary: True ise fonksiyona ikili dosya verilir
+        """
+        path = Path(path)
+        fd, temp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                if binary:
+                    write_func(file)
+                else:
+                    with text_writer(file, compression_for_path(path)) as text:
+                        write_func(text)
+                file.flush()
+                os.fsync(file.fileno())
+            # mkstemp dosyayı 0o600 ile açar; mevcut dosyanın izinleri korunur
+            if path.exists():
+                shutil.copymode(path, temp_path)
+            else:
+                os.chmod(temp_path, 0o644)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        
+        # Dizin girdisini de kalıcı yap (Windows'ta desteklenmez)
+        if hasattr(os, 'O_DIRECTORY'):
+            dir_fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+    
     def _create_default_library(self) -> Library:
         """
         Varsayılan kütüphane yapısını oluşturur.
@@ -0,0 +1,253 @@
+"""
+Append-only değişiklik günlüğü (write-ahead log)
+Her düzenleme JSON Lines formatında küçük bir kayıt olarak eklenir;
+yükleme sırasında son tam kaydın üzerine tekrar oynatılır.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+from ..models.library_models import Library, Topic, Example
+
+
+class Journal:
+    """
+    library.json yanında tutulan değişiklik günlüğü
+
+    Tam kayıt (compaction) başlarken mevcut günlük `.1` uzantılı dosyaya
+    döndürülür (rotate); kayıt başarıyla bitince bu dosya silinir. Kayıt
+    yarıda kalırsa döndürülmüş günlük yerinde kalır ve bir sonraki
+    yüklemede yeniden oynatılır. Bu durumda döndürülmüş kayıtların bir
+    kısmı, hatta sonradan yapılan silmeler, yüklenen dosyada zaten
+    bulunabilir. Bu yüzden kayıtlar idempotent uygulanır: var olan düğüm
+    yeniden eklenmez, hedefi (veya eklenecek konunun üst konusu) artık
+    bulunmayan kayıtlar atlanır.
+    """
+
+    def __init__(self, path: Path, fsync: bool = True):
+        """
+        Journal constructor
+
+        Args:
+            path: Günlük dosyasının yolu
+            fsync: True ise her kayıttan sonra veri diske zorlanır
+        """
+        self.path = Path(path)
+        self.rotated_path = self.path.with_name(self.path.name + ".1")
+        self._fsync = fsync
+        self._file = None
+        self._lock = threading.Lock()
+
+    def append(self, op: str, payload: Dict[str, Any]) -> None:
+        """
+        Günlüğe tek bir kayıt ekler
+
+        Args:
+            op: İşlem adı (add_topic, update_topic, ...)
+            payload: İşleme ait veriler
+        """
+        record = dict(payload, op=op)
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(line)
+            self._file.flush()
+            if self._fsync:
+                os.fsync(self._file.fileno())
+
+    def size(self) -> int:
+        """Günlüğün (döndürülmüş kısım dahil) bayt cinsinden boyutu"""
+        total = 0
+        for path in (self.rotated_path, self.path):
+            if path.exists():
+                total += path.stat().st_size
+        return total
+
+    def rotate(self) -> None:
+        """
+        Mevcut kayıtları döndürülmüş günlüğe taşır (tam kayıt başlarken)
+
+        Önceki bir tam kayıt başarısız olduysa döndürülmüş günlük zaten
+        vardır; bu durumda yeni kayıtlar onun sonuna eklenir.
+        """
+        with self._lock:
+            self._close()
+            if not self.path.exists():
+                return
+            if self.rotated_path.exists():
+                with open(self.path, 'rb') as source, open(self.rotated_path, 'ab') as target:
+                    target.write(source.read())
+                os.remove(self.path)
+            else:
+                os.replace(self.path, self.rotated_path)
+
+    def discard_rotated(self) -> None:
+        """Tam kayda dahil edilmiş döndürülmüş günlüğü siler"""
+        with self._lock:
+            if self.rotated_path.exists():
+                os.remove(self.rotated_path)
+
+    def clear(self) -> None:
+        """Tüm günlüğü siler"""
+        with self._lock:
+            self._close()
+            for path in (self.rotated_path, self.path):
+                if path.exists():
+                    os.remove(path)
+
+    def read_records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Kayıtları yazılma sırasıyla döndürür
+
+        Çökme sırasında yarım kalmış son satır sessizce atlanır.
+        """
+        for path in (self.rotated_path, self.path):
+            if not path.exists():
+                continue
+            with open(path, 'rb') as file:
+                for line in file:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line.decode('utf-8'))
+                    except ValueError:
+                        # JSONDecodeError veya geçersiz UTF-8
+                        print(f"Günlükte bozuk kayıt atlandı: {path}")
+
+    def close(self) -> None:
+        """Açık dosya tanıtıcısını kapatır"""
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def replay_records(library: Library, records: Iterator[Dict[str, Any]]) -> int:
+    """
+    Günlük kayıtlarını kütüphaneye uygular
+
+    Nesne olmayan, bilinmeyen veya uygulanırken hata veren kayıtlar
+    atlanır; geri kalanlar uygulanmaya devam eder.
+
+    Args:
+        library: Kayıtların uygulanacağı kütüphane
+        records: Journal.read_records çıktısı
+
+    Returns:
+        int: Uygulanan kayıt sayısı
+    """
+    count = 0
+    for record in records:
+        if not isinstance(record, dict):
+            print("Günlükte nesne olmayan kayıt atlandı")
+            continue
+        handler = _HANDLERS.get(record.get('op'))
+        if handler is None:
+            print(f"Bilinmeyen günlük kaydı atlandı: {record.get('op')}")
+            continue
+        try:
+            handler(library, record)
+        except Exception as e:
+            # Eksik alanlı veya hatalı değerli tek kayıt kütüphaneyi kaybettirmesin
+            print(f"Uygulanamayan günlük kaydı atlandı ({record.get('op')}): {e!r}")
+            continue
+        count += 1
+    return count
+
+
+def _apply_fields(target: Any, fields: Dict[str, Any]) -> None:
+    """Alan değerlerini nesneye uygular (zaman damgalarını çözerek)"""
+    for name, value in fields.items():
+        if name in ('created_at', 'updated_at'):
+            value = datetime.fromisoformat(value)
+        setattr(target, name, value)
+
+
+def _restore_timestamp(target: Any, record: Dict[str, Any]) -> None:
+    """
+    Yapısal değişikliklerin güncellediği zaman damgasını kayıttakiyle değiştirir
+
+    add_child/remove_example gibi metotlar updated_at'i o anki zamana
+    çeker; kayıttaki değer kullanılarak tekrar oynatma deterministik olur.
+    """
+    if record.get('updated_at'):
+        target.updated_at = datetime.fromisoformat(record['updated_at'])
+
+
+def _add_topic(library: Library, record: Dict[str, Any]) -> None:
+    topic = Topic.from_dict(record['topic'])
+    if library.find_topic_by_id(topic.id) is not None:
+        return
+
+    parent_id = record.get('parent_id')
+    if not parent_id:
+        library.add_topic(topic)
+        _restore_timestamp(library, record)
+        return
+
+    parent = library.find_topic_by_id(parent_id)
+    if parent is None:
+        # Üst konu sonradan silinmiş (silme yüklenen dosyada zaten var);
+        # konuyu ana konu olarak eklemek silinen alt ağacı geri getirirdi
+        print(f"Günlükte üst konusu bulunmayan konu atlandı: {topic.id}")
+        return
+    parent.add_child(topic)
+    _restore_timestamp(parent, record)
+
+
+def _update_topic(library: Library, record: Dict[str, Any]) -> None:
+    topic = library.find_topic_by_id(record['id'])
+    if topic is not None:
+        _apply_fields(topic, record['fields'])
+
+
+def _delete_topic(library: Library, record: Dict[str, Any]) -> None:
+    topic = library.find_topic_by_id(record['id'])
+    if topic is None:
+        return
+    owner = topic.parent if topic.parent is not None else library
+    if topic.parent is not None:
+        topic.parent.remove_child(topic.id)
+    else:
+        library.remove_topic(topic.id)
+    _restore_timestamp(owner, record)
+
+
+def _add_example(library: Library, record: Dict[str, Any]) -> None:
+    topic = library.find_topic_by_id(record['topic_id'])
+    example = Example.from_dict(record['example'])
+    if topic is not None and library.find_example_by_id(example.id) is None:
+        topic.add_example(example)
+        _restore_timestamp(topic, record)
+
+
+def _update_example(library: Library, record: Dict[str, Any]) -> None:
+    example = library.find_example_by_id(record['id'])
+    if example is not None:
+        _apply_fields(example, record['fields'])
+
+
+def _delete_example(library: Library, record: Dict[str, Any]) -> None:
+    topic = library.find_topic_by_id(record['topic_id'])
+    if topic is not None and topic.remove_example(record['id']):
+        _restore_timestamp(topic, record)
+
+
+_HANDLERS = {
+    'add_topic': _add_topic,
+    'update_topic': _update_topic,
+    'delete_topic': _delete_topic,
+    'add_example': _add_example,
+    'update_example': _update_example,
+    'delete_example': _delete_example,
+}
@@ -0,0 +1,474 @@
+"""
+library.json için akış (streaming) tabanlı okuma ve yazma
+Dosya parça parça okunur/yazılır; konu ve örnek nesneleri ile dosya
+arasında ara bir sözlük ağacı kurulmaz.
+"""
+
+import json
+import re
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from ..models.library_models import Library, Topic, Example, isoformat_timestamp, timestamp_text
+from .content_store import ContentRef, ContentStore, PendingContent, attach_content_ref
+
+
+# Tek seferde dosyadan okunan karakter sayısı
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+_NODE_NAMES = {Topic: "Konu", Example: "Örnek"}
+
+
+def _make_node(cls: type, data: Any, content_store: Optional[ContentStore]) -> Any:
+    """Sözlüğü verilen model sınıfına çevirir; gövdesi içerik dosyasındaysa referansa bağlar"""
+    if not isinstance(data, dict):
+        raise json.JSONDecodeError(f"{_NODE_NAMES[cls]} nesnesi bekleniyor", "", 0)
+    node = cls.from_dict(data)
+    content_ref = data.get('content_ref')
+    if content_ref is not None and content_store is not None:
+        attach_content_ref(node, content_store.ref(*content_ref))
+    return node
+
+
+def _node_hook(content_store: Optional[ContentStore]) -> Callable[[Dict[str, Any]], Any]:
+    """
+    json object_hook: sözlüğün alt konularını ve örneklerini hemen modele çevirir
+
+    Bir sözlüğün konu mu örnek mi olduğu anahtarlarına bakılarak değil
+    bulunduğu listeden anlaşılır: `children` elemanları konu, `examples`
+    elemanları örnektir (ana konuları load_library_stream çevirir). Hook
+    içten dışa çağrıldığı için bir düğümün sözlüğü üst konusu kapanınca
+    modele çevrilir; böylece aynı anda bellekte yalnızca çözülmekte olan
+    konu yolundaki sözlükler bulunur.
+    """
+    def build(data: Dict[str, Any]) -> Any:
+        children = data.get('children')
+        if children.__class__ is list:
+            data['children'] = [_make_node(Topic, child, content_store) for child in children]
+        examples = data.get('examples')
+        if examples.__class__ is list:
+            data['examples'] = [_make_node(Example, example, content_store) for example in examples]
+        return data
+    return build
+
+
+_PLAIN_DECODER = json.JSONDecoder()
+_TOPIC_DECODER = json.JSONDecoder(object_hook=_node_hook(None))
+
+
+class _StreamReader:
+    """Dosyayı parça parça tamponlayan basit JSON okuyucu"""
+
+    def __init__(self, file: TextIO, chunk_size: int):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def peek(self) -> str:
+        """Boşluklardan sonraki ilk karakteri döndürür (dosya sonunda '')"""
+        self._skip_whitespace()
+        return self._buffer[self._pos] if self._pos < len(self._buffer) else ""
+
+    def consume(self, char: str) -> bool:
+        """Sıradaki karakter `char` ise onu tüketir"""
+        if self.peek() == char:
+            self._pos += 1
+            return True
+        return False
+
+    def expect(self, char: str) -> None:
+        """Sıradaki karakterin `char` olmasını zorunlu kılar"""
+        if not self.consume(char):
+            raise json.JSONDecodeError(f"'{char}' bekleniyor", self._buffer, self._pos)
+
+    def decode(self, decoder: json.JSONDecoder) -> Any:
+        """Sıradaki tek JSON değerini çözer"""
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # Değer tamponda yarım kalmış olabilir; en az kalan kadar daha oku
+                if not self._fill(len(self._buffer) - self._pos):
+                    raise
+                continue
+
+            # Tamponun sonunda biten sayı kesilmiş olabilir ("12" / "123")
+            if end == len(self._buffer) and self._fill(0):
+                continue
+
+            self._pos = end
+            return value
+
+    def _skip_whitespace(self) -> None:
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer) or not self._fill(0):
+                return
+
+    def _fill(self, min_size: int) -> bool:
+        """Tampona yeni parça ekler; dosya bittiyse False döndürür"""
+        if self._eof:
+            return False
+
+        data = self._file.read(max(self._chunk_size, min_size))
+        if not data:
+            self._eof = True
+            return False
+
+        # Tüketilmiş kısmı at, tampon yalnızca çözülmemiş veriyi tutsun
+        self._buffer = self._buffer[self._pos:] + data
+        self._pos = 0
+        return True
+
+
+def load_library_stream(file: TextIO,
+                        on_topic: Optional[Callable[[Topic], None]] = None,
+                        chunk_size: int = CHUNK_SIZE,
+                        content_store: Optional[ContentStore] = None) -> Library:
+    """
+    library.json içeriğini akış olarak okuyup Library oluşturur
+
+    Args:
+        file: Metin modunda açılmış dosya
+        on_topic: Her ana konu çözüldüğünde (dosyanın geri kalanı
+            okunmadan) çağrılır
+        chunk_size: Tek seferde okunacak karakter sayısı
+        content_store: `content_ref` alanlarının çözüleceği içerik deposu;
+            dosyada `content_file` alanı varsa depo o dosyaya yönlendirilir
+
+    Returns:
+        Library: Oluşturulan kütüphane
+
+    Raises:
+        json.JSONDecodeError: Dosya geçerli bir kütüphane JSON'u değilse
+    """
+    reader = _StreamReader(file, chunk_size)
+    topic_decoder = _TOPIC_DECODER
+    if content_store is not None:
+        topic_decoder = json.JSONDecoder(object_hook=_node_hook(content_store))
+    fields: Dict[str, Any] = {}
+    topics: List[Topic] = []
+
+    reader.expect('{')
+    if not reader.consume('}'):
+        while True:
+            key = reader.decode(_PLAIN_DECODER)
+            if not isinstance(key, str):
+                raise json.JSONDecodeError("Anahtar bekleniyor", "", 0)
+            reader.expect(':')
+
+            if key == 'topics':
+                reader.expect('[')
+                if not reader.consume(']'):
+                    while True:
+                        # Listedeki her eleman (anahtarlarından bağımsız) bir ana konudur
+                        topic = _make_node(Topic, reader.decode(topic_decoder), content_store)
+                        topics.append(topic)
+                        if on_topic is not None:
+                            on_topic(topic)
+                        if reader.consume(']'):
+                            break
+                        reader.expect(',')
+            elif key == 'content_file':
+                content_file = reader.decode(_PLAIN_DECODER)
+                if content_store is not None and isinstance(content_file, str):
+                    content_store.set_path(content_store.path.with_name(content_file))
+            else:
+                fields[key] = reader.decode(_PLAIN_DECODER)
+
+            if reader.consume('}'):
+                break
+            reader.expect(',')
+
+    if reader.peek():
+        raise json.JSONDecodeError("Fazladan veri", "", 0)
+
+    fields['topics'] = topics
+    return Library.from_dict(fields)
+
+
+_ENCODE = json.JSONEncoder(ensure_ascii=False).encode
+
+
+class FrozenList(tuple):
+    """Dondurulmuş görüntüde liste alanı (alt konular, örnekler, etiketler)"""
+    __slots__ = ()
+
+
+class FrozenTopic(tuple):
+    """
+    Konunun değişmez görüntüsü: KEYS sırasıyla alan değerleri
+
+    Zaman damgaları slottaki ham haliyle, diskteki gövde ContentRef
+    olarak tutulur; metne çevirme yazma sırasında yapılır. Böylece
+    görüntü düğüm başına yalnızca birkaç tuple'a mal olur.
+    """
+    __slots__ = ()
+    KEYS = ('id', 'title', 'content', 'parent_id', 'children', 'examples', 'tags',
+            'created_at', 'updated_at', 'is_expanded')
+
+
+class FrozenExample(tuple):
+    """Örneğin değişmez görüntüsü (bkz. FrozenTopic)"""
+    __slots__ = ()
+    KEYS = ('id', 'name', 'content', 'language', 'created_at', 'updated_at')
+
+
+_EMPTY = FrozenList()
+_TIMESTAMP_KEYS = frozenset(('created_at', 'updated_at'))
+
+
+def _frozen_items(node: tuple) -> Iterator[tuple]:
+    """Görüntüdeki değerleri LibraryJsonWriter'ın yazdığı (anahtar, değer) çiftlerine çevirir"""
+    for key, value in zip(node.KEYS, node):
+        if value.__class__ is PendingContent:
+            if value.ref is None:
+                raise ValueError("Gövde içerik dosyasına yazılmadan görüntü yazılamaz")
+            value = value.ref
+        if value.__class__ is ContentRef:
+            yield 'content_ref', [value.offset, value.length]
+        elif key in _TIMESTAMP_KEYS:
+            yield key, timestamp_text(value)
+        else:
+            yield key, value
+
+
+def _frozen_content(node: Any, content_file: Optional[str],
+                    pending: Optional[List[tuple]]) -> Any:
+    """
+    Görüntüdeki gövde: içerik dosyasına yazılacaksa referans, değilse metin
+
+    `pending` verilmişse içerik dosyasına henüz yazılmamış gövdeler
+    PendingContent olur ve (düğüm, PendingContent) çifti listeye eklenir.
+    """
+    ref = node._content_ref
+    if content_file and ref is not None:
+        return ref
+    if content_file and pending is not None and node._content:
+        item = PendingContent(node._content)
+        pending.append((node, item))
+        return item
+    return node.content
+
+
+def _content_item(node: Any, content_file: Optional[str]) -> tuple:
+    """Gövde alanını (metin veya içerik dosyası referansı) döndürür"""
+    ref = node._content_ref
+    if content_file and ref is not None:
+        return 'content_ref', [ref.offset, ref.length]
+    return 'content', node.content
+
+
+def _library_items(library: Library, topics: Any, content_file: Optional[str]) -> List[tuple]:
+    """Kütüphanenin yazılacak alanları (topics: çağrılabilir veya FrozenList)"""
+    header = [('content_file', content_file)] if content_file else []
+    return header + [
+        ('id', library.id),
+        ('name', library.name),
+        ('description', library.description),
+        ('topics', topics),
+        ('created_at', isoformat_timestamp(library, 'created_at')),
+        ('updated_at', isoformat_timestamp(library, 'updated_at')),
+        ('version', library.version),
+    ]
+
+
+def _topic_items(topic: Topic, children: Any, examples: Any, tags: Any,
+                 content_file: Optional[str]) -> List[tuple]:
+    """Konunun yazılacak alanları (liste alanları: çağrılabilir veya FrozenList)"""
+    return [
+        ('id', topic.id),
+        ('title', topic.title),
+        _content_item(topic, content_file),
+        ('parent_id', topic.parent_id),
+        ('children', children),
+        ('examples', examples),
+        ('tags', tags),
+        ('created_at', isoformat_timestamp(topic, 'created_at')),
+        ('updated_at', isoformat_timestamp(topic, 'updated_at')),
+        ('is_expanded', topic.is_expanded),
+    ]
+
+
+def _example_items(example: Example, content_file: Optional[str]) -> List[tuple]:
+    """Örneğin yazılacak alanları"""
+    return [
+        ('id', example.id),
+        ('name', example.name),
+        _content_item(example, content_file),
+        ('language', example.language),
+        ('created_at', isoformat_timestamp(example, 'created_at')),
+        ('updated_at', isoformat_timestamp(example, 'updated_at')),
+    ]
+
+
+def freeze_topic(topic: Topic, children: FrozenList, content_file: Optional[str] = None,
+                 pending: Optional[List[tuple]] = None) -> FrozenTopic:
+    """
+    Konunun modelden bağımsız, değişmez görüntüsünü oluşturur
+
+    Alt konuların görüntüleri çağıran tarafından verilir; böylece
+    değişmemiş alt ağaçların görüntüleri kopyalanmadan paylaşılabilir.
+    Metinler kopyalanmaz, yalnızca referansları tutulur.
+
+    Args:
+        topic: Dondurulacak konu
+        children: Alt konuların görüntüleri (modeldeki sırayla)
+        content_file: LibraryJsonWriter'daki anlamıyla içerik dosyası adı
+        pending: Bellekteki gövdelerin PendingContent olarak toplanacağı liste
+            (verilmezse bu gövdeler metin olarak yazılır)
+    """
+    examples = FrozenList(FrozenExample((
+        example.id, example.name, _frozen_content(example, content_file, pending), example.language,
+        example._created_at, example._updated_at
+    )) for example in topic.examples) if topic.examples else _EMPTY
+    return FrozenTopic((
+        topic.id, topic.title, _frozen_content(topic, content_file, pending), topic.parent_id,
+        children or _EMPTY, examples, FrozenList(topic.tags) if topic.tags else _EMPTY,
+        topic._created_at, topic._updated_at, topic.is_expanded
+    ))
+
+
+def freeze_library(library: Library, topics: FrozenList, content_file: Optional[str] = None) -> tuple:
+    """
+    Ana konu görüntüleri verilen kütüphanenin değişmez görüntüsünü oluşturur
+
+    Returns:
+        tuple: dump_frozen_library ile yazılabilen (anahtar, değer) çiftleri
+    """
+    return tuple(_library_items(library, topics, content_file))
+
+
+class LibraryJsonWriter:
+    """
+    Library modelini to_dict() çağırmadan JSON olarak yazar
+
+    Çıktı `json.dump(library.to_dict(), file, indent=indent,
+    ensure_ascii=False)` ile birebir aynıdır. Model ağacı gezilirken her
+    alan doğrudan dosyaya yazılır; bellek kullanımı kütüphane boyutundan
+    bağımsızdır. freeze_library ile alınmış görüntüler de aynı biçimde
+    yazılır (write_frozen).
+
+    `content_file` verilirse başa bu alan eklenir ve gövdesi içerik
+    dosyasında olan düğümler için `content` yerine
+    `content_ref: [offset, uzunluk]` yazılır.
+    """
+
+    def __init__(self, file: TextIO, indent: Optional[int] = 2,
+                 content_file: Optional[str] = None):
+        """
+        LibraryJsonWriter constructor
+
+        Args:
+            file: Metin modunda açılmış hedef dosya
+            indent: Girinti boşluk sayısı (None ise tek satır)
+            content_file: Gövdelerin tutulduğu içerik dosyasının adı
+        """
+        self._write = file.write
+        self._indent = indent
+        self._content_file = content_file
+
+    def write_library(self, library: Library) -> None:
+        """Kütüphanenin tamamını yazar"""
+        self._write_object(_library_items(
+            library,
+            lambda level: self._write_list(library.topics, self._write_topic, level),
+            self._content_file
+        ), 0)
+
+    def write_frozen(self, frozen: tuple) -> None:
+        """freeze_library ile alınmış görüntüyü yazar (herhangi bir thread'den)"""
+        self._write_object(frozen, 0)
+
+    def _write_topic(self, topic: Topic, level: int) -> None:
+        self._write_object(_topic_items(
+            topic,
+            lambda level: self._write_list(topic.children, self._write_topic, level),
+            lambda level: self._write_list(topic.examples, self._write_example, level),
+            lambda level: self._write_list(topic.tags, self._write_scalar, level),
+            self._content_file
+        ), level)
+
+    def _write_example(self, example: Example, level: int) -> None:
+        self._write_object(_example_items(example, self._content_file), level)
+
+    def _write_scalar(self, value: Any, level: int) -> None:
+        self._write(_ENCODE(value))
+
+    def _write_frozen_item(self, value: Any, level: int) -> None:
+        if value.__class__ is FrozenTopic or value.__class__ is FrozenExample:
+            self._write_object(_frozen_items(value), level)
+        else:
+            self._write(_ENCODE(value))
+
+    def _write_object(self, items: Iterable[tuple], level: int) -> None:
+        """(anahtar, değer) çiftlerini yazar; değer çağrılabilir veya FrozenList ise iç içe yapıdır"""
+        write = self._write
+        opening, separator, closing = self._separators(level)
+        write('{')
+        for i, (key, value) in enumerate(items):
+            write(separator if i else opening)
+            write(_ENCODE(key))
+            write(': ')
+            if value.__class__ is FrozenList:
+                self._write_list(value, self._write_frozen_item, level + 1)
+            elif callable(value):
+                value(level + 1)
+            else:
+                write(_ENCODE(value))
+        write(closing + '}')
+
+    def _write_list(self, items: List[Any], write_item: Callable[[Any, int], None], level: int) -> None:
+        """Liste elemanlarını verilen fonksiyonla yazar"""
+        if not items:
+            self._write('[]')
+            return
+
+        write = self._write
+        opening, separator, closing = self._separators(level)
+        write('[')
+        for i, item in enumerate(items):
+            write(separator if i else opening)
+            write_item(item, level + 1)
+        write(closing + ']')
+
+    def _separators(self, level: int) -> tuple:
+        """json.dump ile aynı (ilk eleman öneki, eleman ayırıcısı, kapanış) üçlüsü"""
+        if self._indent is None:
+            return '', ', ', ''
+        inner = '\n' + ' ' * (self._indent * (level + 1))
+        return inner, ',' + inner, '\n' + ' ' * (self._indent * level)
+
+
+def dump_library_stream(library: Library, file: TextIO, indent: Optional[int] = 2,
+                        content_file: Optional[str] = None) -> None:
+    """
+    Kütüphaneyi ara sözlük ağacı oluşturmadan dosyaya yazar
+
+    Args:
+        library: Yazılacak kütüphane
+        file: Metin modunda açılmış hedef dosya
+        indent: Girinti boşluk sayısı (None ise tek satır)
+        content_file: Gövdelerin tutulduğu içerik dosyasının adı (verilirse
+            diskteki gövdeler referans olarak yazılır)
+    """
+    LibraryJsonWriter(file, indent, content_file).write_library(library)
+
+
+def dump_frozen_library(frozen: tuple, file: TextIO, indent: Optional[int] = 2) -> None:
+    """
+    freeze_library ile alınmış görüntüyü dosyaya yazar
+
+    Görüntü modelden bağımsız olduğundan yazma model değişmeye devam
+    ederken başka bir thread'de yapılabilir.
+
+    Args:
+        frozen: freeze_library ile alınmış görüntü
+        file: Metin modunda açılmış hedef dosya
+        indent: Girinti boşluk sayısı (None ise tek satır)
+    """
+    LibraryJsonWriter(file, indent).write_frozen(frozen)
@@ -0,0 +1,304 @@
+"""
+Tam metin arama için ters indeks (inverted index) servisi
+"""
+
+import re
+import threading
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Callable, Dict, List, Iterable, Iterator, Optional, Set, Tuple
+
+from ..models.library_models import Library, Topic
+
+
+# Kelime ayıklama deseni (unicode harf/rakam dizileri)
+_TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Metni küçük harfli kelimelere ayırır
+
+    Args:
+        text: Kelimelere ayrılacak metin
+
+    Returns:
+        List[str]: Kelime listesi
+    """
+    if not text:
+        return []
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class SearchIndex:
+    """
+    Konu başlığı, içeriği, etiketleri ve örnekleri üzerinde ters indeks
+
+    Her kelime için o kelimeyi içeren konuların ağırlıklı puanları
+    tutulur (posting list). Sorgu maliyeti kütüphane boyutuna değil,
+    sorgudaki kelimelerin posting list boyutuna bağlıdır. Son sorgu
+    kelimesi önek (prefix) olarak eşleşir, böylece yazarken arama da
+    desteklenir.
+
+    Gövdeleri okumak (tembel içerik modunda diskten) büyük kütüphanelerde
+    uzun sürer. Bu yüzden açılışta `rebuild(..., include_bodies=False)`
+    ile yalnızca başlıklar, etiketler ve örnek adları indekslenir; tam
+    indeks `build` ile arka plan thread'inde hazırlanıp `adopt` ile
+    devralınır. Aradaki sürede güncellenen konular devralmada canlı
+    modelden yeniden indekslenir.
+    """
+
+    # Alan ağırlıkları - başlık eşleşmeleri daha üstte sıralanır
+    FIELD_WEIGHTS = {
+        'title': 8,
+        'tags': 4,
+        'content': 1,
+        'example_name': 2,
+        'example_content': 1,
+    }
+
+    def __init__(self, library: Library = None):
+        """
+        SearchIndex constructor
+
+        Args:
+            library: İndekslenecek kütüphane. Belirtilirse hemen indekslenir.
+        """
+        # kelime -> {topic_id: puan}
+        self._postings: Dict[str, Dict[str, int]] = {}
+        # topic_id -> {kelime: puan} (güncelleme/silme için ileri indeks)
+        self._forward: Dict[str, Dict[str, int]] = {}
+        # Önek araması için sıralı kelime listesi
+        self._vocabulary: List[str] = []
+        # Gövdeler indekslenmediyse, o zamandan beri güncellenen/silinen konular
+        # (None: indeks tam)
+        self._touched: Optional[Set[str]] = None
+        # Arka plan aramaları ile GUI güncellemeleri arasındaki senkronizasyon
+        self._lock = threading.RLock()
+
+        if library is not None:
+            self.rebuild(library)
+
+    @property
+    def is_complete(self) -> bool:
+        """Gövdeler de indekslendi mi (False ise yalnızca başlıklar aranır)"""
+        return self._touched is None
+
+    def rebuild(self, library: Library, include_bodies: bool = True) -> None:
+        """
+        İndeksi kütüphanedeki tüm konularla baştan oluşturur
+
+        Args:
+            library: İndekslenecek kütüphane
+            include_bodies: False ise konu ve örnek gövdeleri okunmaz; tam
+                indeks sonradan `build` + `adopt` ile eklenir
+        """
+        with self._lock:
+            self._postings.clear()
+            self._forward.clear()
+            for topic in iter_topics(library):
+                self._add_terms(topic.id, self._collect_terms(topic, include_bodies))
+            self._vocabulary = sorted(self._postings)
+            self._touched = None if include_bodies else set()
+
+    @classmethod
+    def build(cls, topics: Iterable[Topic],
+              is_cancelled: Optional[Callable[[], bool]] = None) -> Optional['SearchIndex']:
+        """
+        Verilen konuların gövdeler dahil tam indeksini oluşturur
+
+        Yeni bir nesne oluşturulduğu için arka plan thread'inde çağrılabilir;
+        model bu sırada değişirse farklar `adopt` ile giderilir.
+
+        Args:
+            topics: İndekslenecek konular (GUI thread'inde alınmış liste)
+            is_cancelled: True döndürürse oluşturma yarıda bırakılır
+
+        Returns:
+            Optional[SearchIndex]: Tam indeks (iptal edildiyse None)
+        """
+        index = cls()
+        for topic in topics:
+            if is_cancelled is not None and is_cancelled():
+                return None
+            index._add_terms(topic.id, index._collect_terms(topic))
+        index._vocabulary = sorted(index._postings)
+        return index
+
+    def adopt(self, built: 'SearchIndex', library: Library) -> bool:
+        """
+        `build` ile hazırlanan tam indeksi devralır (GUI thread'inde)
+
+        Oluşturma sürerken güncellenen veya silinen konular canlı modelden
+        yeniden indekslenir.
+
+        Returns:
+            bool: Devralındıysa True (indeks bu arada baştan kurulduysa False)
+        """
+        with self._lock:
+            touched = self._touched
+            if touched is None:
+                return False
+            self._postings = built._postings
+            self._forward = built._forward
+            self._vocabulary = built._vocabulary
+            self._touched = None
+            for topic_id in touched:
+                topic = library.find_topic_by_id(topic_id)
+                if topic is not None:
+                    self.index_topic(topic)
+                else:
+                    self._remove_terms(topic_id)
+            return True
+
+    def index_topic(self, topic: Topic) -> None:
+        """Tek bir konuyu (alt konuları hariç) indekste ekler veya günceller"""
+        with self._lock:
+            if self._touched is not None:
+                self._touched.add(topic.id)
+            self._remove_terms(topic.id)
+            terms = self._collect_terms(topic)
+            self._forward[topic.id] = terms
+            for term, score in terms.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = {}
+                    insort(self._vocabulary, term)
+                postings[topic.id] = score
+
+    def index_subtree(self, topic: Topic) -> None:
+        """Konuyu tüm alt konularıyla birlikte indeksler"""
+        with self._lock:
+            stack = [topic]
+            while stack:
+                current = stack.pop()
+                self.index_topic(current)
+                stack.extend(current.children)
+
+    def remove_subtree(self, topic: Topic) -> None:
+        """Konuyu tüm alt konularıyla birlikte indeksten çıkarır"""
+        with self._lock:
+            stack = [topic]
+            while stack:
+                current = stack.pop()
+                if self._touched is not None:
+                    self._touched.add(current.id)
+                self._remove_terms(current.id)
+                stack.extend(current.children)
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Sorguyla eşleşen konuları puana göre sıralı döndürür
+
+        Tüm sorgu kelimeleri eşleşmelidir (AND). Son kelime önek
+        olarak, diğerleri tam kelime olarak aranır.
+
+        Args:
+            query: Arama sorgusu
+            limit: En fazla döndürülecek sonuç sayısı
+
+        Returns:
+            List[Tuple[str, int]]: (topic_id, puan) listesi
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        with self._lock:
+            # En küçük posting list'ten başlamak kesişimi hızlandırır
+            candidates = [self._match(term, prefix=(i == len(terms) - 1))
+                          for i, term in enumerate(terms)]
+            candidates.sort(key=len)
+
+            scores = dict(candidates[0])
+            for postings in candidates[1:]:
+                if not scores:
+                    break
+                scores = {topic_id: score + postings[topic_id]
+                          for topic_id, score in scores.items()
+                          if topic_id in postings}
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return ranked
+
+    def __len__(self) -> int:
+        """İndeksteki konu sayısı"""
+        return len(self._forward)
+
+    # Private Methods
+    def _add_terms(self, topic_id: str, terms: Dict[str, int]) -> None:
+        """Konunun kelimelerini ekler (kelime listesi çağıran tarafından sıralanır)"""
+        self._forward[topic_id] = terms
+        for term, score in terms.items():
+            self._postings.setdefault(term, {})[topic_id] = score
+
+    def _match(self, term: str, prefix: bool) -> Dict[str, int]:
+        """Kelimenin (veya öneki) posting list'ini döndürür"""
+        if not prefix:
+            return self._postings.get(term, {})
+
+        merged: Dict[str, int] = {}
+        start = bisect_left(self._vocabulary, term)
+        for candidate in self._iter_prefixed(start, term):
+            for topic_id, score in self._postings[candidate].items():
+                if score > merged.get(topic_id, 0):
+                    merged[topic_id] = score
+        return merged
+
+    def _iter_prefixed(self, start: int, prefix: str) -> Iterable[str]:
+        """Sıralı kelime listesinde verilen önekle başlayanları üretir"""
+        vocabulary = self._vocabulary
+        for i in range(start, len(vocabulary)):
+            if not vocabulary[i].startswith(prefix):
+                break
+            yield vocabulary[i]
+
+    def _remove_terms(self, topic_id: str) -> None:
+        """Konunun tüm kelimelerini posting list'lerden siler"""
+        terms = self._forward.pop(topic_id, None)
+        if not terms:
+            return
+
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(topic_id, None)
+            if not postings:
+                del self._postings[term]
+                position = bisect_left(self._vocabulary, term)
+                if position < len(self._vocabulary) and self._vocabulary[position] == term:
+                    del self._vocabulary[position]
+
+    def _collect_terms(self, topic: Topic, include_bodies: bool = True) -> Dict[str, int]:
+        """Konunun indekslenecek kelimelerini ağırlıklı puanlarıyla toplar"""
+        weights = self.FIELD_WEIGHTS
+        terms: Counter = Counter()
+
+        for token in tokenize(topic.title):
+            terms[token] += weights['title']
+        for tag in topic.tags:
+            for token in tokenize(tag):
+                terms[token] += weights['tags']
+        if include_bodies:
+            for token in tokenize(topic.content):
+                terms[token] += weights['content']
+        for example in topic.examples:
+            for token in tokenize(example.name):
+                terms[token] += weights['example_name']
+            if include_bodies:
+                for token in tokenize(example.content):
+                    terms[token] += weights['example_content']
+
+        return dict(terms)
+
+
+def iter_topics(library: Library) -> Iterator[Topic]:
+    """Kütüphanedeki tüm konuları (alt konular dahil) gezer"""
+    stack = list(library.topics)
+    while stack:
+        topic = stack.pop()
+        yield topic
+        stack.extend(topic.children)
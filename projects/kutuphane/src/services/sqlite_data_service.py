@@ -0,0 +1,532 @@
+"""
+SQLite tabanlı veri yönetim servisi
+"""
+
+import json
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from pathlib import Path
+
+from ..models.library_models import Library, Topic, Example, isoformat_timestamp
+from .data_service import DataService
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS library (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    version TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS topics (
+    id TEXT PRIMARY KEY,
+    parent_id TEXT,
+    position INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    tags TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    is_expanded INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS examples (
+    id TEXT PRIMARY KEY,
+    topic_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    content TEXT NOT NULL,
+    language TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_topics_parent ON topics(parent_id, position);
+CREATE INDEX IF NOT EXISTS idx_examples_topic ON examples(topic_id, position);
+"""
+
+
+_TOPIC_INSERT = "INSERT OR REPLACE INTO topics VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+_TOPIC_UPDATE = ("UPDATE topics SET title = ?, content = ?, tags = ?, created_at = ?, "
+                 "updated_at = ?, is_expanded = ? WHERE id = ?")
+_EXAMPLE_INSERT = "INSERT OR REPLACE INTO examples VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+_EXAMPLE_UPDATE = ("UPDATE examples SET name = ?, content = ?, language = ?, created_at = ?, "
+                   "updated_at = ? WHERE id = ?")
+# Konu ve tüm alt konularının kimlikleri (silme için)
+_SUBTREE = """
+WITH RECURSIVE subtree(id) AS (
+    SELECT ? UNION ALL SELECT topics.id FROM topics JOIN subtree ON topics.parent_id = subtree.id
+)
+"""
+
+
+@dataclass
+class _RowChanges:
+    """create_snapshot ile alınan, veritabanına yazılacak satır değişiklikleri"""
+    # True ise tablolar boşaltılıp tüm satırlar yeniden yazılır
+    full: bool = False
+    library_row: Optional[Tuple] = None
+    topic_inserts: List[Tuple] = field(default_factory=list)
+    topic_updates: List[Tuple] = field(default_factory=list)
+    topic_positions: List[Tuple[int, str]] = field(default_factory=list)
+    deleted_topics: List[str] = field(default_factory=list)
+    example_inserts: List[Tuple] = field(default_factory=list)
+    example_updates: List[Tuple] = field(default_factory=list)
+    example_positions: List[Tuple[int, str]] = field(default_factory=list)
+    deleted_examples: List[str] = field(default_factory=list)
+
+
+class SQLiteDataService(DataService):
+    """
+    SQLite veritabanı ile veri yönetimi yapan servis
+
+    DataService ile aynı public API'yi sunar. Konular ve örnekler ayrı
+    satırlarda saklanır. record_change ile bildirilen düzenlemelerin
+    kimlikleri tutulur; kaydetmede yalnızca bu düğümlerin satırları
+    oluşturulup tek bir transaction içinde yazılır. Kaydetme maliyeti
+    kütüphane boyutuna değil değişiklik sayısına bağlıdır.
+
+    Model record_change dışında değiştirildiyse (mark_dirty ile) hangi
+    düğümlerin değiştiği bilinmez; bu durumda tüm satırlar yeniden yazılır.
+    """
+
+    def __init__(self, data_file_path: str = None):
+        """
+        SQLiteDataService constructor
+
+        Args:
+            data_file_path: Veritabanı dosyasının yolu. Belirtilmezse varsayılan yol kullanılır.
+        """
+        if data_file_path is None:
+            current_dir = Path(__file__).parent.parent.parent
+            data_file_path = current_dir / "data" / "library.db"
+
+        # Satır bazlı yazma zaten küçük olduğundan ayrı günlük tutulmaz
+        super().__init__(data_file_path, use_journal=False, binary_cache=False)
+
+        # Kaydetme arka plan thread'inde de yapılabilir; erişim _write_lock ile sıralanır
+        self._connection = sqlite3.connect(str(self.data_file_path), check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+
+        # Veritabanındaki satırların ait olduğu kütüphane (farklıysa tam yazma gerekir)
+        self._synced_library: Optional[Library] = None
+        # record_change ile bildirilmiş son değişiklik sayacı
+        self._tracked_generation: Optional[int] = None
+        # Başarısız yazmadan sonra değişiklik kümeleri kaybolduğu için tam yazma gerekir
+        self._needs_full_write = False
+        self._reset_changes()
+
+    def load_library(self, on_topic: Optional[Callable[[Topic], None]] = None) -> Library:
+        """
+        Kütüphane verisini veritabanından yükler. Kayıt yoksa yeni kütüphane oluşturur.
+        Satırlar okunamazsa veritabanı önce library.db.backup olarak yedeklenir;
+        yedek alınamazsa hata yükseltilir ve veritabanına yazılmaz.
+
+        Args:
+            on_topic: Her ana konu için çağrılır (hiyerarşi kurulduktan sonra)
+
+        Returns:
+            Library: Yüklenen veya yeni oluşturulan kütüphane
+        """
+        if self._library is not None:
+            return self._library
+
+        try:
+            library = self._read_library()
+            if library is None:
+                # Varsayılan kütüphane oluştur
+                self._library = self._create_default_library()
+                self.save_library()
+            else:
+                self._library = library
+                self._synced_library = library
+                self._tracked_generation = library.generation
+                self._mark_saved()
+                if on_topic is not None:
+                    for topic in library.topics:
+                        on_topic(topic)
+        except (sqlite3.Error, ValueError) as e:
+            print(f"Veri yüklenirken hata oluştu: {e}")
+            # Varsayılan kütüphanenin kaydı tüm satırları siler; önce
+            # veritabanı yedeklenir, yedek alınamazsa hiçbir şey yazılmaz
+            backup_path = self.data_file_path.with_name(self.data_file_path.name + '.backup')
+            if not self.create_backup(str(backup_path)):
+                raise
+            print(f"Hatalı veritabanı {backup_path} olarak yedeklendi")
+            self._library = self._create_default_library()
+            self.save_library()
+
+        return self._library
+
+    def save_library(self, force: bool = False) -> bool:
+        """
+        Son kayıttan bu yana değişen konu ve örnekleri veritabanına yazar.
+
+        Args:
+            force: True ise değişiklik işaretlenmemiş olsa da tüm satırları yeniden yazar
+
+        Returns:
+            bool: Kaydetme işlemi başarılı (veya gereksiz) ise True
+        """
+        if self._library is None:
+            return False
+
+        if force:
+            self._needs_full_write = True
+        elif not self._snapshot_is_stale():
+            return True
+
+        return self.write_snapshot(self.create_snapshot())
+
+    def record_change(self, op: str, **payload: Any) -> None:
+        """
+        Düzenlemeyi kaydeder ve değişen satırların kimliklerini not eder.
+
+        Args:
+            op: İşlem adı (add_topic, update_topic, delete_topic, ...)
+            **payload: İşleme ait veriler (kimlikler buradan alınır)
+        """
+        super().record_change(op, **payload)
+        if self._library is None:
+            return
+
+        if op == 'add_topic':
+            self._added_topics.add(payload['topic']['id'])
+            self._touch_owner(payload.get('parent_id'))
+        elif op == 'update_topic':
+            self._updated_topics.add(payload['id'])
+        elif op == 'delete_topic':
+            self._deleted_topics.add(payload['id'])
+            self._touch_owner(payload.get('parent_id'))
+            self._reordered_topics.add(payload.get('parent_id'))
+        elif op == 'add_example':
+            self._added_examples[payload['example']['id']] = payload['topic_id']
+            self._updated_topics.add(payload['topic_id'])
+        elif op == 'update_example':
+            self._updated_examples.add(payload['id'])
+        elif op == 'delete_example':
+            self._deleted_examples.add(payload['id'])
+            self._updated_topics.add(payload['topic_id'])
+            self._reordered_examples.add(payload['topic_id'])
+        else:
+            # Bilinmeyen işlem: hangi satırların değiştiği bilinmiyor; sonraki
+            # bildirimler sayacı güncellese de tüm satırlar yazılmalı
+            self._needs_full_write = True
+            return
+        self._tracked_generation = self._library.generation
+
+    def create_snapshot(self) -> Optional[Tuple[int, Any]]:
+        """
+        Değişen satırları modelden alır (GUI thread'inde).
+
+        Yalnızca record_change ile bildirilen düğümlerin satırları
+        oluşturulur; değişiklik kümeleri görüntüye aktarılıp boşaltılır.
+
+        Returns:
+            Optional[Tuple[int, Any]]: (değişiklik sayacı, satır değişiklikleri) veya kütüphane yoksa None
+        """
+        library = self._library
+        if library is None:
+            return None
+
+        if (self._needs_full_write or library is not self._synced_library
+                or library.generation != self._tracked_generation):
+            changes = self._collect_all_rows(library)
+            self._synced_library = library
+            self._tracked_generation = library.generation
+            self._needs_full_write = False
+        else:
+            changes = self._collect_changed_rows(library)
+        self._reset_changes()
+        return library.generation, changes
+
+    def write_snapshot(self, snapshot: Optional[Tuple[int, Any]]) -> bool:
+        """
+        Görüntüdeki satır değişikliklerini tek transaction ile yazar (herhangi bir thread'den).
+
+        Args:
+            snapshot: create_snapshot ile alınan görüntü
+
+        Returns:
+            bool: Kaydetme işlemi başarılı ise True
+        """
+        if snapshot is None:
+            return False
+
+        generation, changes = snapshot
+        with self._write_lock:
+            try:
+                with self._connection:
+                    self._write_changes(changes)
+            except sqlite3.Error as e:
+                print(f"Veri kaydedilirken hata oluştu: {e}")
+                # Yazılamayan değişikliklerin kimlikleri artık elde yok
+                self._needs_full_write = True
+                return False
+            self._saved_generation = generation
+        return True
+
+    def create_backup(self, backup_path: str = None) -> bool:
+        """
+        SQLite backup API'si ile tutarlı bir kopya oluşturur.
+
+        Args:
+            backup_path: Backup dosyasının yolu. Belirtilmezse otomatik isim verilir.
+
+        Returns:
+            bool: Backup oluşturma başarılı ise True
+        """
+        if backup_path is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            backup_path = self.data_file_path.with_name(f"library_backup_{timestamp}.db")
+
+        try:
+            target = sqlite3.connect(str(backup_path))
+            try:
+                with self._write_lock:
+                    self._connection.backup(target)
+            finally:
+                target.close()
+            return True
+        except sqlite3.Error as e:
+            print(f"Backup oluşturulurken hata oluştu: {e}")
+            return False
+
+    def close(self) -> None:
+        """Veritabanı bağlantısını kapatır"""
+        self._connection.close()
+        super().close()
+
+    # Private Methods
+    def _reset_changes(self) -> None:
+        """Bekleyen değişiklik kümelerini boşaltır"""
+        self._library_dirty = False
+        self._added_topics: Set[str] = set()
+        self._updated_topics: Set[str] = set()
+        self._deleted_topics: Set[str] = set()
+        # Alt konu sıraları yeniden yazılacak üst konular (None: ana konular)
+        self._reordered_topics: Set[Optional[str]] = set()
+        # Eklenen örnek -> konu kimliği
+        self._added_examples: Dict[str, str] = {}
+        self._updated_examples: Set[str] = set()
+        self._deleted_examples: Set[str] = set()
+        # Örnek sıraları yeniden yazılacak konular
+        self._reordered_examples: Set[str] = set()
+
+    def _touch_owner(self, parent_id: Optional[str]) -> None:
+        """Yapısal değişiklikte updated_at'i değişen üst konuyu veya kütüphaneyi işaretler"""
+        if parent_id:
+            self._updated_topics.add(parent_id)
+        else:
+            self._library_dirty = True
+
+    def _read_library(self) -> Optional[Library]:
+        """Veritabanındaki satırlardan kütüphaneyi oluşturur"""
+        library_row = self._connection.execute("SELECT * FROM library").fetchone()
+        if library_row is None:
+            return None
+
+        library = Library(
+            id=library_row[0],
+            name=library_row[1],
+            description=library_row[2],
+            created_at=library_row[3],
+            updated_at=library_row[4],
+            version=library_row[5]
+        )
+
+        topics: Dict[str, Topic] = {}
+        topic_rows = self._connection.execute(
+            "SELECT * FROM topics ORDER BY position"
+        ).fetchall()
+        for row in topic_rows:
+            topics[row[0]] = Topic(
+                id=row[0],
+                title=row[3],
+                content=row[4],
+                parent_id=row[1],
+                tags=json.loads(row[5]),
+                created_at=row[6],
+                updated_at=row[7],
+                is_expanded=bool(row[8])
+            )
+
+        # Hiyerarşiyi kur (satırlar position sırasıyla geldiği için sıra korunur)
+        for row in topic_rows:
+            topic = topics[row[0]]
+            parent = topics.get(row[1]) if row[1] else None
+            if parent is not None:
+                topic._parent = parent
+                parent.children.append(topic)
+            else:
+                library.topics.append(topic)
+
+        example_rows = self._connection.execute(
+            "SELECT * FROM examples ORDER BY position"
+        ).fetchall()
+        for row in example_rows:
+            topic = topics.get(row[1])
+            if topic is None:
+                continue
+            topic.examples.append(Example(
+                id=row[0],
+                name=row[3],
+                content=row[4],
+                language=row[5],
+                created_at=row[6],
+                updated_at=row[7]
+            ))
+
+        library.rebuild_index()
+        return library
+
+    @staticmethod
+    def _library_row(library: Library) -> Tuple:
+        return (
+            library.id, library.name, library.description,
+            isoformat_timestamp(library, 'created_at'), isoformat_timestamp(library, 'updated_at'),
+            library.version
+        )
+
+    @staticmethod
+    def _topic_row(topic: Topic, parent_id: Optional[str], position: int) -> Tuple:
+        return (
+            topic.id, parent_id, position, topic.title, topic.content,
+            json.dumps(topic.tags, ensure_ascii=False),
+            isoformat_timestamp(topic, 'created_at'), isoformat_timestamp(topic, 'updated_at'),
+            int(topic.is_expanded)
+        )
+
+    @staticmethod
+    def _example_row(example: Example, topic_id: str, position: int) -> Tuple:
+        return (
+            example.id, topic_id, position, example.name, example.content, example.language,
+            isoformat_timestamp(example, 'created_at'), isoformat_timestamp(example, 'updated_at')
+        )
+
+    @staticmethod
+    def _position(items: List[Any], node: Any) -> int:
+        """Düğümün kardeşleri arasındaki sırası (dataclass eşitliği yerine kimlik karşılaştırması)"""
+        for position, item in enumerate(items):
+            if item is node:
+                return position
+        raise ValueError(f"Düğüm üst listesinde bulunamadı: {node.id}")
+
+    def _collect_changed_rows(self, library: Library) -> _RowChanges:
+        """Bildirilen değişikliklerin satırlarını oluşturur (değişiklik sayısıyla orantılı)"""
+        changes = _RowChanges(deleted_topics=list(self._deleted_topics),
+                              deleted_examples=list(self._deleted_examples))
+        if self._library_dirty:
+            changes.library_row = self._library_row(library)
+
+        # Eklenen konular alt ağaçlarıyla birlikte yazılır (silinmiş olanlar atlanır)
+        for topic_id in self._added_topics:
+            topic = library.find_topic_by_id(topic_id)
+            if topic is None:
+                continue
+            siblings = topic.parent.children if topic.parent is not None else library.topics
+            stack = [(topic, topic.parent.id if topic.parent is not None else None,
+                      self._position(siblings, topic))]
+            while stack:
+                current, parent_id, position = stack.pop()
+                changes.topic_inserts.append(self._topic_row(current, parent_id, position))
+                changes.example_inserts.extend(
+                    self._example_row(example, current.id, example_position)
+                    for example_position, example in enumerate(current.examples)
+                )
+                stack.extend((child, current.id, child_position)
+                             for child_position, child in enumerate(current.children))
+
+        for topic_id in self._updated_topics:
+            topic = library.find_topic_by_id(topic_id)
+            if topic is not None:
+                row = self._topic_row(topic, None, 0)
+                changes.topic_updates.append(row[3:] + (topic.id,))
+
+        for parent_id in self._reordered_topics:
+            if parent_id is None:
+                siblings = library.topics
+            else:
+                parent = library.find_topic_by_id(parent_id)
+                if parent is None:
+                    continue
+                siblings = parent.children
+            changes.topic_positions.extend(
+                (position, child.id) for position, child in enumerate(siblings)
+            )
+
+        for example_id, topic_id in self._added_examples.items():
+            topic = library.find_topic_by_id(topic_id)
+            example = library.find_example_by_id(example_id)
+            if topic is not None and example is not None:
+                changes.example_inserts.append(
+                    self._example_row(example, topic_id, self._position(topic.examples, example))
+                )
+
+        for example_id in self._updated_examples:
+            example = library.find_example_by_id(example_id)
+            if example is not None:
+                row = self._example_row(example, "", 0)
+                changes.example_updates.append(row[3:] + (example.id,))
+
+        for topic_id in self._reordered_examples:
+            topic = library.find_topic_by_id(topic_id)
+            if topic is not None:
+                changes.example_positions.extend(
+                    (position, example.id) for position, example in enumerate(topic.examples)
+                )
+        return changes
+
+    def _collect_all_rows(self, library: Library) -> _RowChanges:
+        """Kütüphanenin tamamını satırlara çevirir (tam yazma için)"""
+        changes = _RowChanges(full=True, library_row=self._library_row(library))
+        stack = [(topic, None, position) for position, topic in enumerate(library.topics)]
+        while stack:
+            topic, parent_id, position = stack.pop()
+            changes.topic_inserts.append(self._topic_row(topic, parent_id, position))
+            changes.example_inserts.extend(
+                self._example_row(example, topic.id, example_position)
+                for example_position, example in enumerate(topic.examples)
+            )
+            stack.extend(
+                (child, topic.id, child_position)
+                for child_position, child in enumerate(topic.children)
+            )
+        return changes
+
+    def _write_changes(self, changes: _RowChanges) -> None:
+        """Satır değişikliklerini açık transaction içinde uygular"""
+        execute = self._connection.execute
+        executemany = self._connection.executemany
+
+        if changes.full:
+            for table in ("library", "topics", "examples"):
+                execute(f"DELETE FROM {table}")
+        if changes.library_row is not None:
+            execute("DELETE FROM library")
+            execute("INSERT INTO library VALUES (?, ?, ?, ?, ?, ?)", changes.library_row)
+
+        # Silinen konuların alt ağaçları ve örnekleri veritabanındaki parent_id ile bulunur
+        for topic_id in changes.deleted_topics:
+            execute(_SUBTREE + "DELETE FROM examples WHERE topic_id IN (SELECT id FROM subtree)",
+                    (topic_id,))
+            execute(_SUBTREE + "DELETE FROM topics WHERE id IN (SELECT id FROM subtree)",
+                    (topic_id,))
+        if changes.deleted_examples:
+            executemany("DELETE FROM examples WHERE id = ?",
+                        [(example_id,) for example_id in changes.deleted_examples])
+
+        if changes.topic_inserts:
+            executemany(_TOPIC_INSERT, changes.topic_inserts)
+        if changes.topic_updates:
+            executemany(_TOPIC_UPDATE, changes.topic_updates)
+        if changes.topic_positions:
+            executemany("UPDATE topics SET position = ? WHERE id = ?", changes.topic_positions)
+        if changes.example_inserts:
+            executemany(_EXAMPLE_INSERT, changes.example_inserts)
+        if changes.example_updates:
+            executemany(_EXAMPLE_UPDATE, changes.example_updates)
+        if changes.example_positions:
+            executemany("UPDATE examples SET position = ? WHERE id = ?", changes.example_positions)
@@ -0,0 +1,257 @@
+"""
+Kod parçalarının programlama dilini tahmin eden katmanlı dedektör
+Pygments'in guess_lexer fonksiyonu kayıtlı her lexer'ın analyse_text
+metodunu çalıştırır ve büyük metinlerde çok yavaştır. Burada önce ucuz
+ipuçlarına (dosya uzantısı, shebang, kod çiti) bakılır, sonra metnin
+başında anahtar kelime sıklığına dayalı basit bir sınıflandırıcı
+çalıştırılır; guess_lexer yalnızca son çare olarak metnin başıyla
+çağrılır. İçeriğe dayalı sonuçlar içerik özetiyle önbelleğe alınır.
+"""
+
+import re
+from pathlib import PurePath
+from typing import Dict, List, Optional, Pattern, Tuple
+
+from pygments.lexers import guess_lexer
+from pygments.util import ClassNotFound
+
+from .render_cache import RenderCache, shared_render_cache
+
+
+# Dosya uzantısı -> dil
+EXTENSION_LANGUAGES: Dict[str, str] = {
+    '.py': 'python', '.pyw': 'python',
+    '.js': 'javascript', '.mjs': 'javascript', '.cjs': 'javascript',
+    '.ts': 'typescript',
+    '.java': 'java',
+    '.c': 'c', '.h': 'c',
+    '.cpp': 'c++', '.cc': 'c++', '.cxx': 'c++', '.hpp': 'c++', '.hh': 'c++',
+    '.cs': 'c#',
+    '.html': 'html', '.htm': 'html',
+    '.css': 'css',
+    '.sql': 'sql',
+    '.sh': 'bash', '.bash': 'bash', '.zsh': 'bash',
+    '.ps1': 'powershell', '.psm1': 'powershell',
+    '.json': 'json',
+    '.xml': 'xml', '.xsd': 'xml', '.svg': 'xml',
+    '.yml': 'yaml', '.yaml': 'yaml',
+    '.md': 'markdown', '.markdown': 'markdown',
+    '.go': 'go', '.rs': 'rust', '.rb': 'ruby', '.php': 'php',
+}
+
+# Shebang satırındaki yorumlayıcı -> dil
+_SHEBANG_LANGUAGES = {
+    'python': 'python', 'python3': 'python', 'python2': 'python',
+    'sh': 'bash', 'bash': 'bash', 'zsh': 'bash', 'dash': 'bash',
+    'node': 'javascript', 'nodejs': 'javascript',
+    'pwsh': 'powershell', 'powershell': 'powershell',
+    'ruby': 'ruby', 'php': 'php', 'perl': 'perl',
+}
+
+_SHEBANG = re.compile(r'#!\s*(?:\S*/)?(?:env\s+(?:-\S+\s+)*)?([\w.+-]+)')
+_FENCE = re.compile(r'\s*```\s*([\w#+-]+)')
+
+# Sınıflandırıcı: dil -> (desen, ağırlık) listesi. Her desenin katkısı
+# eşleşme sayısı SIGNAL_CAP ile sınırlanarak hesaplanır; böylece tek
+# bir yaygın desen sonucu belirleyemez.
+_SIGNAL_SOURCES: Dict[str, List[Tuple[str, float]]] = {
+    'python': [
+        (r'^[ \t]*def \w+\(.*\)\s*(?:->.*)?:[ \t]*$', 3),
+        (r'^[ \t]*class \w+(?:\(.*\))?:[ \t]*$', 3),
+        (r'^[ \t]*(?:from [\w.]+ import|import [\w.]+)', 2),
+        (r'\belif\b', 3),
+        (r'\bself\.', 1),
+        (r'\b(?:None|True|False)\b', 1),
+        (r'^[ \t]*print\(', 1),
+    ],
+    'javascript': [
+        (r'\bfunction\s*\w*\s*\(', 2),
+        (r'\b(?:const|let|var)\s+\w+\s*=', 2),
+        (r'=>', 2),
+        (r'\bconsole\.log\(', 3),
+        (r'===|!==', 2),
+        (r'\b(?:document|window)\.', 2),
+    ],
+    'java': [
+        (r'\bpublic\s+(?:static\s+)?(?:final\s+)?(?:class|void|interface)\b', 3),
+        (r'\bSystem\.out\.print', 4),
+        (r'\bString\[\]', 3),
+        (r'@Override\b', 3),
+        (r'^[ \t]*import java\.', 4),
+    ],
+    'c': [
+        (r'^[ \t]*#include\s*<\w+\.h>', 3),
+        (r'\bprintf\s*\(', 2),
+        (r'\bint\s+main\s*\(', 2),
+        (r'\b(?:malloc|free|sizeof)\s*\(', 2),
+    ],
+    'c++': [
+        (r'^[ \t]*#include\s*<\w+>', 3),
+        (r'\bstd::', 3),
+        (r'\b(?:cout|cerr)\s*<<|\bcin\s*>>', 3),
+        (r'\btemplate\s*<', 3),
+    ],
+    'c#': [
+        (r'^[ \t]*using System', 4),
+        (r'\bConsole\.Write', 4),
+        (r'\{\s*get;\s*(?:set;\s*)?\}', 3),
+        (r'^[ \t]*namespace\s+[\w.]+', 2),
+    ],
+    'html': [
+        (r'(?i)<!DOCTYPE html|<html\b', 5),
+        (r'(?i)</?(?:div|span|body|head|p|a|ul|li|table|script)\b[^>]*>', 2),
+    ],
+    'xml': [
+        (r'^\s*<\?xml\b', 6),
+        (r'<\w+:\w+\b|\bxmlns\b', 2),
+    ],
+    'css': [
+        (r'^[ \t]*[\w.#:\[\]=,>~+ -]+\{[ \t]*$', 1),
+        (r'^[ \t]*[\w-]+\s*:\s*[^;{}]+;[ \t]*$', 2),
+        (r'@media\b|@import\b', 3),
+    ],
+    'sql': [
+        (r'(?i)\bSELECT\b[\s\S]+?\bFROM\b', 4),
+        (r'(?i)\b(?:INSERT\s+INTO|UPDATE\s+\w+\s+SET|DELETE\s+FROM|CREATE\s+TABLE)\b', 4),
+        (r'(?i)\b(?:WHERE|JOIN|GROUP\s+BY|ORDER\s+BY)\b', 2),
+    ],
+    'bash': [
+        (r'^[ \t]*(?:if \[|then$|fi$|do$|done$|esac$)', 3),
+        (r'^[ \t]*(?:echo|export|cd|sudo|apt(?:-get)?|grep|chmod|mkdir)\b', 2),
+        (r'\$\{\w+\}|\$\(', 2),
+    ],
+    'powershell': [
+        (r'\b(?:Get|Set|New|Remove|Write|Invoke|Import)-[A-Z]\w+', 4),
+        (r'\s-(?:eq|ne|gt|lt|like|match)\b', 2),
+        (r'\$\w+\s*=', 1),
+    ],
+    'json': [
+        (r'\A\s*[\[{]\s*"', 5),
+        (r'"\s*:\s*(?:"|\d|\{|\[|true|false|null)', 1),
+    ],
+    'yaml': [
+        (r'^---[ \t]*$', 3),
+        (r'^[ \t]*[\w-]+:[ \t]+[^\s{;]', 1),
+        (r'^[ \t]*- [\w"\']', 1),
+    ],
+    'markdown': [
+        (r'^#{1,6} \S', 2),
+        (r'\[[^\]\n]+\]\([^)\n]+\)', 2),
+        (r'^```', 3),
+    ],
+}
+
+_SIGNALS: Dict[str, List[Tuple[Pattern, float]]] = {
+    language: [(re.compile(source, re.MULTILINE), weight) for source, weight in signals]
+    for language, signals in _SIGNAL_SOURCES.items()
+}
+
+
+class LanguageDetector:
+    """Katmanlı ve önbellekli dil tahmini"""
+
+    # İçerik analizinde bakılan karakter sayısı (metnin başı)
+    HEAD_CHARS = 4096
+    # Bir desenin en fazla kaç eşleşmesi sayılır
+    SIGNAL_CAP = 5
+    # Sınıflandırıcı sonucunun kabul edilmesi için en düşük puan ve
+    # ikinci en yüksek puana göre en az oran
+    MIN_SCORE = 4.0
+    MIN_MARGIN = 1.5
+    # Tablolar değiştiğinde artırılır (önbellekteki eski tahminler kullanılmaz)
+    DETECTOR_VERSION = 1
+
+    def __init__(self, cache: Optional[RenderCache] = None):
+        """
+        LanguageDetector constructor
+
+        Args:
+            cache: Tahmin önbelleği (varsayılan: ortak işlenmiş çıktı önbelleği)
+        """
+        self.cache = cache if cache is not None else shared_render_cache()
+
+    def detect(self, code: str, filename: Optional[str] = None, hint: Optional[str] = None) -> str:
+        """
+        Kodun dilini tahmin eder
+
+        Sırasıyla açık ipucu, dosya uzantısı, shebang ve kod çiti, anahtar
+        kelime sınıflandırıcısı ve son olarak guess_lexer denenir.
+
+        Args:
+            code: Analiz edilecek kod
+            filename: Kodun geldiği dosyanın adı (varsa)
+            hint: Zaten bilinen dil (ör. örneğin etiketi; 'text' yok sayılır)
+
+        Returns:
+            str: highlight_code'a verilebilecek dil adı (bulunamazsa 'text')
+        """
+        if hint and hint.lower() not in ('text', 'plain'):
+            return hint.lower()
+        if filename:
+            language = EXTENSION_LANGUAGES.get(PurePath(filename).suffix.lower())
+            if language:
+                return language
+        if not code.strip():
+            return 'text'
+        return self.cache.get_or_render(code, 'detect', self.DETECTOR_VERSION, self._detect_content)
+
+    def _detect_content(self, code: str) -> str:
+        """detect() için önbelleksiz içerik analizi"""
+        head = code[:self.HEAD_CHARS]
+        first_line = head.lstrip().split('\n', 1)[0]
+
+        if first_line.startswith('#!'):
+            shebang = _SHEBANG.match(first_line)
+            if shebang:
+                interpreter = re.sub(r'[\d.]+$', '', shebang.group(1)) or shebang.group(1)
+                language = _SHEBANG_LANGUAGES.get(interpreter) or _SHEBANG_LANGUAGES.get(shebang.group(1))
+                if language:
+                    return language
+
+        fence = _FENCE.match(first_line)
+        if fence:
+            return fence.group(1).lower()
+
+        language = self.classify(head)
+        if language:
+            return language
+
+        try:
+            lexer = guess_lexer(head)
+        except ClassNotFound:
+            return 'text'
+        return lexer.aliases[0] if lexer.aliases else lexer.name.lower()
+
+    def classify(self, text: str) -> Optional[str]:
+        """
+        Anahtar kelime sıklığına göre dil tahmini yapar
+
+        Returns:
+            Optional[str]: Yeterince belirgin bir kazanan yoksa None
+        """
+        scores = self.scores(text)
+        if not scores:
+            return None
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        best_language, best = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+        if best >= self.MIN_SCORE and best >= runner_up * self.MIN_MARGIN:
+            return best_language
+        return None
+
+    def scores(self, text: str) -> Dict[str, float]:
+        """Her dil için sınıflandırıcı puanı (sıfır puanlılar hariç)"""
+        cap = self.SIGNAL_CAP
+        scores = {}
+        for language, signals in _SIGNALS.items():
+            score = 0.0
+            for pattern, weight in signals:
+                count = 0
+                for _ in pattern.finditer(text):
+                    count += 1
+                    if count == cap:
+                        break
+                score += weight * count
+            if score:
+                scores[language] = score
+        return scores
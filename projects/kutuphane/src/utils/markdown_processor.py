@@ -3,91 +3,147 @@ Markdown işleme yardımcı fonksiyonları
 """
 
 import re
-from typing import Dict, List
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .render_cache import RenderCache, shared_render_cache
+
+
+# Derlenmiş desenler (her çağrıda yeniden derlenmez)
+_FENCE_OPEN = re.compile(r'```(\w+)?')
+_HEADING = re.compile(r'(#{1,3}) (.*)')
+# Satır içi biçimler tek bir alternatifli desende; metin soldan sağa
+# bir kez taranır. Sıra önceliği belirler: kod > kalın > italik > link.
+# Link metni ve adresi karakter sınıflarıyla sınırlanır; kapanmayan
+# "[" veya "[a](" tekrarlarında geri izleme patlamaz, eşleşme doğrusal kalır.
+_INLINE = re.compile(
+    r'`(?P<code>.*?)`'
+    r'|\*\*(?P<bold>.*?)\*\*'
+    r'|\*(?P<italic>.*?)\*'
+    r'|\[(?P<text>[^\[\]\n]*)\]\((?P<url>[^()\s]*)\)'
+)
+_LINK = re.compile(r'\[([^\[\]\n]*)\]\(([^()\s]*)\)')
+# Bu öneklerle başlayan paragraflar <p> ile sarılmaz
+_BLOCK_PREFIXES = ('<h', '<li>', '<pre>', '<ul>', '<ol>')
+_LIST_PREFIXES = ('* ', '• ')
+
+
+class RenderedMarkdown(NamedTuple):
+    """Tek taramada üretilen HTML ve düz metin"""
+    html: str
+    plain_text: str
 
 
 class MarkdownProcessor:
     """Basit markdown işleme için yardımcı sınıf"""
     
-    def __init__(self):
-        # Basit markdown pattern'ları
-        self.patterns = {
-            'bold': r'\*\*(.*?)\*\*',
-            'italic': r'\*(.*?)\*',
-            'code_inline': r'`(.*?)`',
-            'code_block': r'```(\w+)?\n(.*?)\n```',
-            'link': r'\[(.*?)\]\((.*?)\)',
-            'heading1': r'^# (.*?)$',
-            'heading2': r'^## (.*?)$',
-            'heading3': r'^### (.*?)$',
-            'list_item': r'^\* (.*?)$',
-            'list_item_bullet': r'^• (.*?)$'
-        }
+    # Çıktı biçimi değiştiğinde artırılır (önbellekteki eski sonuçlar kullanılmaz)
+    RENDERER_VERSION = 'markdown-1'
     
-    def to_html(self, markdown_text: str) -> str:
+    def __init__(self, cache: Optional[RenderCache] = None):
         """
-        Markdown metnini HTML'e çevirir
+        MarkdownProcessor constructor
+        
+        Args:
+            cache: İşlenmiş çıktı önbelleği (varsayılan: SyntaxHighlighter ile ortak önbellek)
+        """
+        self.cache = cache if cache is not None else shared_render_cache()
+    
+    def render(self, markdown_text: str) -> RenderedMarkdown:
+        """
+        Markdown metnini tek taramada HTML'e ve düz metne çevirir
+        
+        Metin satır satır bir kez gezilir: kod blokları, başlıklar ve liste
+        öğeleri satır başından tanınır, satır içi biçimler tek bir derlenmiş
+        desenle işlenir. Süre metin uzunluğuyla doğrusal artar. Kod
+        bloklarının içi biçimlendirilmez. Sonuç önbellekte saklanır; aynı
+        metin yeniden işlenmez.
         
         Args:
             markdown_text: Markdown formatında metin
             
         Returns:
-            str: HTML formatında metin
+            RenderedMarkdown: (html, plain_text)
         """
         if not markdown_text:
-            return ""
+            return RenderedMarkdown("", "")
+        return self.cache.get_or_render(markdown_text, 'markdown', self.RENDERER_VERSION,
+                                        self._render)
+    
+    def _render(self, markdown_text: str) -> RenderedMarkdown:
+        """render() için önbelleksiz tek tarama"""
+        lines = markdown_text.split('\n')
+        line_count = len(lines)
+        blocks: List[str] = []
+        paragraph: List[str] = []
+        plain: List[str] = []
+        inline = self._render_inline
+        # Kapanmamış bir çit bulunduysa sonrasında hiç ``` satırı yoktur
+        fences_left = True
         
-        html = markdown_text
+        i = 0
+        while i < line_count:
+            line = lines[i]
+            i += 1
+            
+            if not line:
+                # Boş satır paragrafı bitirir
+                self._flush_paragraph(paragraph, blocks)
+                plain.append("")
+                continue
+            
+            if fences_left and line.startswith('```'):
+                fence = _FENCE_OPEN.fullmatch(line)
+                if fence is not None:
+                    end = i
+                    while end < line_count and not lines[end].startswith('```'):
+                        end += 1
+                    if end < line_count:
+                        body = '\n'.join(lines[i:end])
+                        tail_html, tail_plain = inline(lines[end][3:])
+                        paragraph.append(
+                            f'<pre><code class="language-{fence.group(1) or ""}">{body}</code></pre>{tail_html}'
+                        )
+                        plain.append(body + tail_plain)
+                        i = end + 1
+                        continue
+                    fences_left = False
+            
+            if line[0] == '#':
+                heading = _HEADING.match(line)
+                if heading is not None:
+                    level = len(heading.group(1))
+                    html, text = inline(heading.group(2))
+                    paragraph.append(f'<h{level}>{html}</h{level}>')
+                    plain.append(text)
+                    continue
+            
+            if line.startswith(_LIST_PREFIXES):
+                html, text = inline(line[2:])
+                paragraph.append(f'<li>{html}</li>')
+                plain.append(text)
+                continue
+            
+            html, text = inline(line)
+            paragraph.append(html)
+            plain.append(text)
         
-        # Kod blokları (önce işlenmeli)
-        html = re.sub(
-            self.patterns['code_block'],
-            r'<pre><code class="language-\1">\2</code></pre>',
-            html,
-            flags=re.MULTILINE | re.DOTALL
+        self._flush_paragraph(paragraph, blocks)
+        return RenderedMarkdown(
+            '\n'.join(blocks).replace('\n', '<br>'),
+            '\n'.join(plain).strip()
         )
+    
+    def to_html(self, markdown_text: str) -> str:
+        """
+        Markdown metnini HTML'e çevirir
         
-        # Başlıklar
-        html = re.sub(self.patterns['heading1'], r'<h1>\1</h1>', html, flags=re.MULTILINE)
-        html = re.sub(self.patterns['heading2'], r'<h2>\1</h2>', html, flags=re.MULTILINE)
-        html = re.sub(self.patterns['heading3'], r'<h3>\1</h3>', html, flags=re.MULTILINE)
-        
-        # Bold ve italic
-        html = re.sub(self.patterns['bold'], r'<strong>\1</strong>', html)
-        html = re.sub(self.patterns['italic'], r'<em>\1</em>', html)
-        
-        # Inline kod
-        html = re.sub(self.patterns['code_inline'], r'<code>\1</code>', html)
-        
-        # Linkler
-        html = re.sub(self.patterns['link'], r'<a href="\2">\1</a>', html)
-        
-        # Liste öğeleri
-        html = re.sub(self.patterns['list_item'], r'<li>\1</li>', html, flags=re.MULTILINE)
-        html = re.sub(self.patterns['list_item_bullet'], r'<li>\1</li>', html, flags=re.MULTILINE)
-        
-        # Paragraflar
-        paragraphs = html.split('\n\n')
-        formatted_paragraphs = []
-        
-        for paragraph in paragraphs:
-            paragraph = paragraph.strip()
-            if paragraph:
-                # Başlık, liste öğesi veya kod bloku değilse paragraf olarak sar
-                if not (paragraph.startswith('<h') or 
-                       paragraph.startswith('<li>') or 
-                       paragraph.startswith('<pre>') or
-                       paragraph.startswith('<ul>') or
-                       paragraph.startswith('<ol>')):
-                    paragraph = f'<p>{paragraph}</p>'
-                formatted_paragraphs.append(paragraph)
-        
-        html = '\n'.join(formatted_paragraphs)
-        
-        # Satır sonlarını <br> ile değiştir
-        html = html.replace('\n', '<br>')
-        
-        return html
+        Args:
+            markdown_text: Markdown formatında metin
+            
+        Returns:
+            str: HTML formatında metin
+        """
+        return self.render(markdown_text).html
     
     def to_plain_text(self, markdown_text: str) -> str:
         """
@@ -99,24 +155,64 @@ class MarkdownProcessor:
         Returns:
             str: Düz metin
         """
-        if not markdown_text:
-            return ""
-        
-        text = markdown_text
+        return self.render(markdown_text).plain_text
+    
+    def _render_inline(self, text: str) -> Tuple[str, str]:
+        """Satır içi biçimleri (HTML, düz metin) çiftine çevirir"""
+        if '*' not in text and '`' not in text and '[' not in text:
+            return text, text
         
-        # Markdown işaretlerini kaldır
-        text = re.sub(self.patterns['bold'], r'\1', text)
-        text = re.sub(self.patterns['italic'], r'\1', text)
-        text = re.sub(self.patterns['code_inline'], r'\1', text)
-        text = re.sub(self.patterns['code_block'], r'\2', text, flags=re.MULTILINE | re.DOTALL)
-        text = re.sub(self.patterns['link'], r'\1', text)
-        text = re.sub(self.patterns['heading1'], r'\1', text, flags=re.MULTILINE)
-        text = re.sub(self.patterns['heading2'], r'\1', text, flags=re.MULTILINE)
-        text = re.sub(self.patterns['heading3'], r'\1', text, flags=re.MULTILINE)
-        text = re.sub(self.patterns['list_item'], r'\1', text, flags=re.MULTILINE)
-        text = re.sub(self.patterns['list_item_bullet'], r'\1', text, flags=re.MULTILINE)
+        html: List[str] = []
+        plain: List[str] = []
+        pos = 0
+        for match in _INLINE.finditer(text):
+            start = match.start()
+            if start > pos:
+                segment = text[pos:start]
+                html.append(segment)
+                plain.append(segment)
+            pos = match.end()
+            
+            code = match.group('code')
+            if code is not None:
+                html.append(f'<code>{code}</code>')
+                plain.append(code)
+                continue
+            
+            bold = match.group('bold')
+            if bold is not None:
+                inner_html, inner_plain = self._render_inline(bold)
+                html.append(f'<strong>{inner_html}</strong>')
+                plain.append(inner_plain)
+                continue
+            
+            italic = match.group('italic')
+            if italic is not None:
+                inner_html, inner_plain = self._render_inline(italic)
+                html.append(f'<em>{inner_html}</em>')
+                plain.append(inner_plain)
+                continue
+            
+            inner_html, inner_plain = self._render_inline(match.group('text'))
+            html.append(f'<a href="{match.group("url")}">{inner_html}</a>')
+            plain.append(inner_plain)
         
-        return text.strip()
+        if pos < len(text):
+            html.append(text[pos:])
+            plain.append(text[pos:])
+        return ''.join(html), ''.join(plain)
+    
+    @staticmethod
+    def _flush_paragraph(paragraph: List[str], blocks: List[str]) -> None:
+        """Biriken satırları paragraf olarak ekler (gerekirse <p> ile sarar)"""
+        if not paragraph:
+            return
+        text = '\n'.join(paragraph).strip()
+        paragraph.clear()
+        if text:
+            if not text.startswith(_BLOCK_PREFIXES):
+                text = f'<p>{text}</p>'
+            blocks.append(text)
     
     def extract_links(self, markdown_text: str) -> List[Dict[str, str]]:
         """
@@ -132,7 +228,7 @@ class MarkdownProcessor:
             return []
         
         links = []
-        matches = re.finditer(self.patterns['link'], markdown_text)
+        matches = _LINK.finditer(markdown_text)
         
         for match in matches:
             links.append({
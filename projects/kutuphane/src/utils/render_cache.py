@@ -0,0 +1,122 @@
+"""
+İşlenmiş (render edilmiş) çıktılar için paylaşılan LRU önbelleği
+Markdown ve syntax highlighting çıktıları (içerik özeti, dil, işleyici
+sürümü) anahtarıyla saklanır; aynı konu veya örnek yeniden seçildiğinde
+metin baştan işlenmez. İşleyicinin çıktısı değişirse sürümü artırılır,
+eski kayıtlar kendiliğinden kullanılmaz olur.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+RenderKey = Tuple[bytes, str, Hashable]
+
+
+def content_hash(text: str) -> bytes:
+    """Metnin önbellek anahtarında kullanılan özeti"""
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+def _size_of(value: Any) -> int:
+    """Önbellek bütçesi için değerin yaklaşık karakter sayısı"""
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, tuple):
+        return sum(_size_of(item) for item in value)
+    return 1
+
+
+class RenderCache:
+    """
+    Boyut sınırlı, thread-safe LRU önbelleği
+
+    Hem kayıt sayısı hem de saklanan metinlerin toplam karakter sayısı
+    sınırlıdır; sınır aşılınca en uzun süredir kullanılmayan kayıtlar
+    atılır. Arka plan işleri de aynı önbelleği kullanabilir.
+    """
+
+    DEFAULT_MAX_ENTRIES = 512
+    DEFAULT_MAX_CHARS = 16 * 1024 * 1024
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_chars: int = DEFAULT_MAX_CHARS):
+        """
+        RenderCache constructor
+
+        Args:
+            max_entries: En fazla kayıt sayısı
+            max_chars: Saklanan metinlerin toplam karakter bütçesi
+        """
+        self.max_entries = max_entries
+        self.max_chars = max_chars
+        self._entries: "OrderedDict[RenderKey, Tuple[Any, int]]" = OrderedDict()
+        self._chars = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(text: str, language: str, version: Hashable) -> RenderKey:
+        """(içerik özeti, dil, işleyici sürümü) anahtarı oluşturur"""
+        return content_hash(text), language, version
+
+    def get(self, key: RenderKey) -> Optional[Any]:
+        """Kayıtlı çıktıyı döndürür (yoksa None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: RenderKey, value: Any) -> None:
+        """Çıktıyı önbelleğe ekler (bütçeden büyükse eklemez)"""
+        size = _size_of(value)
+        if size > self.max_chars:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._chars -= old[1]
+            self._entries[key] = (value, size)
+            self._chars += size
+            while len(self._entries) > self.max_entries or self._chars > self.max_chars:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._chars -= evicted
+
+    def get_or_render(self, text: str, language: str, version: Hashable,
+                      render: Callable[[str], Any]) -> Any:
+        """
+        Önbellekteki çıktıyı döndürür; yoksa `render(text)` ile üretip saklar
+
+        İşleme kilit dışında yapılır; aynı metni iki thread aynı anda
+        işlerse sonuçlardan biri kalır.
+        """
+        key = self.make_key(text, language, version)
+        value = self.get(key)
+        if value is None:
+            value = render(text)
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Önbelleği boşaltır"""
+        with self._lock:
+            self._entries.clear()
+            self._chars = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_shared_cache: Optional[RenderCache] = None
+_shared_lock = threading.Lock()
+
+
+def shared_render_cache() -> RenderCache:
+    """MarkdownProcessor ve SyntaxHighlighter'ın varsayılan ortak önbelleği"""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = RenderCache()
+        return _shared_cache
@@ -2,29 +2,98 @@
 Syntax highlighting yardımcı fonksiyonları
 """
 
-from pygments import highlight
-from pygments.lexers import get_lexer_by_name, guess_lexer
+from functools import lru_cache
+from html import escape
+from io import StringIO
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from pygments import __version__ as pygments_version, highlight
+from pygments.lexer import Lexer
+from pygments.lexers import get_lexer_by_name
 from pygments.formatters import HtmlFormatter
 from pygments.util import ClassNotFound
 
+from .language_detector import LanguageDetector
+from .render_cache import RenderCache, shared_render_cache
+
+
+# Renklendirilmeden gösterilen diller
+_PLAIN_LANGUAGES = frozenset(('', 'text', 'plain'))
+
+
+@lru_cache(maxsize=None)
+def _lexer_for(language: str) -> Optional[Lexer]:
+    """
+    Dil adına karşılık gelen lexer'ı döndürür (bilinmeyen dil için None)
+    
+    Pygments'in eklenti/kayıt taraması her dil için bir kez yapılır;
+    bilinmeyen diller de None olarak saklanır ve tekrar aranmaz. Lexer
+    nesneleri durum tutmadığından tüm çağrılarda paylaşılır.
+    """
+    try:
+        return get_lexer_by_name(language)
+    except ClassNotFound:
+        return None
+
+
+def _plain_html(code: str) -> str:
+    """Renklendirilemeyen kodu kaçışlanmış <pre> bloğu olarak döndürür"""
+    return f"<pre>{escape(code, quote=False)}</pre>"
+
+
+class HighlightCancelled(Exception):
+    """Renklendirme yarıda iptal edildi"""
+
+
+# İptal kontrolü kaç token'da bir yapılır
+_CANCEL_CHECK_TOKENS = 512
+
+
+def _cancellable(tokens: Iterator, is_cancelled: Callable[[], bool]) -> Iterator:
+    """Token akışını belirli aralıklarla iptal kontrolü yaparak aktarır"""
+    for count, token in enumerate(tokens):
+        if count % _CANCEL_CHECK_TOKENS == 0 and is_cancelled():
+            raise HighlightCancelled()
+        yield token
+
 
 class SyntaxHighlighter:
     """Kod syntax highlighting için yardımcı sınıf"""
     
-    def __init__(self):
+    # Çıktı biçimi değiştiğinde artırılır (önbellekteki eski sonuçlar kullanılmaz)
+    RENDERER_VERSION = 2
+    
+    def __init__(self, cache: Optional[RenderCache] = None, style: str = 'default'):
+        """
+        SyntaxHighlighter constructor
+        
+        Args:
+            cache: İşlenmiş çıktı önbelleği (varsayılan: MarkdownProcessor ile ortak önbellek)
+            style: Pygments renk stili
+        """
         self.formatter = HtmlFormatter(
-            style='default',
+            style=style,
             noclasses=True,
             linenos=False
         )
+        self.cache = cache if cache is not None else shared_render_cache()
+        self.detector = LanguageDetector(self.cache)
+        # Stil ve Pygments sürümü de çıktıyı etkiler
+        self._version = ('pygments', pygments_version, style, self.RENDERER_VERSION)
     
-    def highlight_code(self, code: str, language: str = 'text') -> str:
+    def highlight_code(self, code: str, language: str = 'text',
+                       is_cancelled: Optional[Callable[[], bool]] = None) -> str:
         """
         Verilen kodu syntax highlighting ile formatlar
         
+        Sonuç (kod özeti, dil, sürüm) anahtarıyla önbelleğe alınır; aynı
+        kod tekrar gösterildiğinde yeniden işlenmez.
+        
         Args:
             code: Formatlanacak kod
             language: Programlama dili (python, javascript, etc.)
+            is_cancelled: Arka plan işlerinde iptal kontrolü; True dönerse
+                işlem HighlightCancelled ile yarıda kesilir
             
         Returns:
             str: HTML formatında highlight edilmiş kod
@@ -32,36 +101,77 @@ class SyntaxHighlighter:
         if not code.strip():
             return code
         
-        try:
-            if language.lower() == 'text' or language.lower() == 'plain':
-                return f"<pre>{code}</pre>"
-            
-            lexer = get_lexer_by_name(language.lower())
-            highlighted = highlight(code, lexer, self.formatter)
-            return highlighted
+        language = language.lower()
+        return self.cache.get_or_render(
+            code, language, self._version,
+            lambda text: self._highlight(text, language, is_cancelled)
+        )
+    
+    def cached_html(self, code: str, language: str = 'text') -> Optional[str]:
+        """
+        Kod daha önce formatlandıysa önbellekteki HTML'i döndürür
+        
+        Hiçbir zaman renklendirme yapmaz; GUI thread'inde sonucun hazır
+        olup olmadığını anlamak için kullanılır.
+        
+        Returns:
+            Optional[str]: HTML veya önbellekte yoksa None
+        """
+        if not code.strip():
+            return code
+        return self.cache.get(self.cache.make_key(code, language.lower(), self._version))
+    
+    def highlight_many(self, items: Iterable[Tuple[str, str]]) -> List[str]:
+        """
+        Birden çok kodu sırayla formatlar (ör. bir konunun tüm örnekleri)
+        
+        Her dil için lexer bir kez aranır; önbellekte olan kodlar yeniden
+        işlenmez.
+        
+        Args:
+            items: (kod, dil) çiftleri
             
-        except ClassNotFound:
+        Returns:
+            List[str]: Girdiyle aynı sırada HTML çıktıları
+        """
+        return [self.highlight_code(code, language) for code, language in items]
+    
+    def _highlight(self, code: str, language: str,
+                   is_cancelled: Optional[Callable[[], bool]] = None) -> str:
+        """highlight_code() için önbelleksiz işleme"""
+        if language in _PLAIN_LANGUAGES:
+            return _plain_html(code)
+        
+        lexer = _lexer_for(language)
+        if lexer is None:
             # Bilinmeyen dil, düz metin olarak göster
-            return f"<pre>{code}</pre>"
-        except Exception:
-            # Hata durumunda düz metin döndür
-            return f"<pre>{code}</pre>"
+            return _plain_html(code)
+        if is_cancelled is None:
+            return highlight(code, lexer, self.formatter)
+        
+        # pygments.highlight ile aynı adımlar; token akışı iptal kontrolünden geçer
+        output = StringIO()
+        self.formatter.format(_cancellable(lexer.get_tokens(code), is_cancelled), output)
+        return output.getvalue()
     
-    def guess_language(self, code: str) -> str:
+    def guess_language(self, code: str, filename: Optional[str] = None,
+                       hint: Optional[str] = None) -> str:
         """
         Kod içeriğinden programlama dilini tahmin eder
         
+        Önce ipucu, dosya uzantısı ve shebang'e, sonra anahtar kelime
+        sınıflandırıcısına bakılır; Pygments'in guess_lexer'ı yalnızca son
+        çaredir. Sonuç içerik özetiyle önbelleğe alınır.
+        
         Args:
             code: Analiz edilecek kod
+            filename: Kodun geldiği dosyanın adı (varsa)
+            hint: Zaten bilinen dil (varsa)
             
         Returns:
             str: Tahmin edilen dil
         """
-        try:
-            lexer = guess_lexer(code)
-            return lexer.name.lower()
-        except:
-            return 'text'
+        return self.detector.detect(code, filename, hint)
     
     def get_supported_languages(self) -> list:
         """
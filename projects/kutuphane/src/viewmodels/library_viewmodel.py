@@ -4,11 +4,14 @@ MVVM mimarisinin ViewModel katmanı - UI ile Model arasındaki köprü
 """
 
 from typing import List, Optional, Dict, Any
-from PySide6.QtCore import QObject, Signal, Property, QModelIndex
-from PySide6.QtGui import QStandardItemModel, QStandardItem
+from PySide6.QtCore import QObject, Signal, Slot, Property, QModelIndex, QThreadPool
 
 from ..models.library_models import Library, Topic, Example
 from ..services.data_service import DataService
+from ..services.search_index import SearchIndex, iter_topics
+from ..utils.syntax_highlighter import HighlightCancelled, SyntaxHighlighter
+from .topic_tree_model import TopicTreeModel
+from .workers import Worker
 
 
 class LibraryViewModel(QObject):
@@ -22,8 +25,19 @@ class LibraryViewModel(QObject):
     library_saved = Signal(bool)  # bool: başarı durumu
     topic_selected = Signal(str)  # topic_id
     example_selected = Signal(str)  # example_id
+    example_highlighted = Signal(str)  # example_id
     data_changed = Signal()
     error_occurred = Signal(str)  # error_message
+    search_started = Signal()
+    search_results_ready = Signal(list)  # sıralı sonuç parçası
+    search_finished = Signal(int)  # toplam sonuç sayısı
+    
+    # Canlı aramada tek seferde UI'a iletilen sonuç sayısı
+    SEARCH_BATCH_SIZE = 50
+    
+    # Bundan uzun örnekler renklendirilmez; Pygments'in satır içi stilli
+    # HTML'i metnin ~10 katıdır ve QTextEdit'te ayrıştırılması GUI'yi bloklar
+    HIGHLIGHT_MAX_CHARS = 100_000
     
     def __init__(self, data_service: DataService = None):
         super().__init__()
@@ -37,8 +51,34 @@ class LibraryViewModel(QObject):
         self._current_example: Optional[Example] = None
         self._search_results: List[Topic] = []
         
-        # Tree model for QTreeView
-        self._tree_model: Optional[QStandardItemModel] = None
+        # Tam metin arama indeksi (model değiştikçe artımlı güncellenir;
+        # gövdeler açılışta arka planda indekslenir)
+        self._search_index = SearchIndex()
+        self._index_worker: Optional[Worker] = None
+        self._index_generation = 0
+        
+        # Arka plan işleri (canlı arama vb.)
+        self._thread_pool = QThreadPool(self)
+        self._search_worker: Optional[Worker] = None
+        self._search_generation = 0
+        self._search_query = ""
+        
+        # Kaydetme için tek thread'li ayrı havuz (kayıtlar sırayla yazılır)
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+        self._save_worker: Optional[Worker] = None
+        self._save_pending = False
+        
+        # Örnek kodu renklendirme (tek thread; yalnızca son seçilen örnek işlenir)
+        self._highlighter = SyntaxHighlighter()
+        self._highlight_pool = QThreadPool(self)
+        self._highlight_pool.setMaxThreadCount(1)
+        self._highlight_worker: Optional[Worker] = None
+        self._highlight_generation = 0
+        self._current_example_html = ""
+        
+        # Tree model for QTreeView (tembel yüklenen)
+        self._tree_model: Optional[TopicTreeModel] = None
         
     # Properties - UI'ın erişebileceği özellikler
     @Property(bool, notify=library_loaded)
@@ -71,11 +111,17 @@ class LibraryViewModel(QObject):
         """Seçili örneğin programlama dili"""
         return self._current_example.language if self._current_example else "text"
     
+    @Property(str, notify=example_highlighted)
+    def current_example_html(self) -> str:
+        """Seçili örneğin renklendirilmiş HTML'i (henüz hazır değilse boş)"""
+        return self._current_example_html
+    
     # Public Methods - UI'ın çağırabileceği metotlar
     def load_library(self) -> None:
         """Kütüphane verilerini yükler"""
         try:
             self._current_library = self._data_service.load_library()
+            self._rebuild_search_index()
             self._update_tree_model()
             self.library_loaded.emit()
         except Exception as e:
@@ -92,13 +138,64 @@ class LibraryViewModel(QObject):
             self.error_occurred.emit(f"Veri kaydedilirken hata oluştu: {str(e)}")
             self.library_saved.emit(False)
     
-    def get_tree_model(self) -> QStandardItemModel:
+    def save_library_async(self) -> None:
+        """
+        Kütüphaneyi GUI'yi bloklamadan kaydeder.
+        
+        Model anlık görüntüsü GUI thread'inde alınır; serileştirme, fsync
+        ve atomik dosya değişimi arka plan thread'inde yapılır. Sonuç
+        library_saved ile bildirilir. Devam eden bir kayıt varsa yeni
+        kayıt o bittikten sonra yapılır.
+        """
+        if self._save_worker is not None:
+            self._save_pending = True
+            return
+        
+        self._save_pending = False
+        try:
+            snapshot = self._data_service.create_snapshot()
+        except Exception as e:
+            self.error_occurred.emit(f"Veri kaydedilirken hata oluştu: {str(e)}")
+            self.library_saved.emit(False)
+            return
+        if snapshot is None:
+            return
+        
+        worker = Worker(lambda _worker: self._data_service.write_snapshot(snapshot))
+        worker.signals.finished.connect(self._on_save_done)
+        worker.signals.error.connect(self._on_save_error)
+        self._save_worker = worker
+        self._save_pool.start(worker)
+    
+    def wait_for_pending_save(self) -> None:
+        """Arka planda devam eden kaydın bitmesini bekler (kapanışta)"""
+        self._save_pool.waitForDone()
+    
+    def close(self) -> None:
+        """Veri servisini kapatır (başlangıç önbelleği bu sırada yazılır)"""
+        self.cancel_highlight()
+        self._highlight_pool.waitForDone()
+        # Arka plan indekslemesi içerik dosyasını okuyor olabilir
+        if self._index_worker is not None:
+            self._index_worker.cancel()
+            self._index_worker = None
+        self.cancel_search()
+        self._thread_pool.waitForDone()
+        self.wait_for_pending_save()
+        self._data_service.close()
+    
+    def has_unsaved_changes(self) -> bool:
+        """Son kayıttan bu yana diske yazılmamış değişiklik var mı"""
+        return self._data_service.has_unsaved_changes()
+    
+    def needs_compaction(self) -> bool:
+        """Düzenleme günlüğü tam kayda katlanacak kadar büyüdü mü"""
+        return self._data_service.needs_compaction()
+    
+    def get_tree_model(self) -> TopicTreeModel:
         """Tree view için model döndürür"""
         if self._tree_model is None:
-            self._tree_model = QStandardItemModel()
-            self._tree_model.setHorizontalHeaderLabels(["Konular"])
-            if self._current_library:
-                self._update_tree_model()
+            self._tree_model = TopicTreeModel(self._current_library, self)
         return self._tree_model
     
     def select_topic_by_id(self, topic_id: str) -> None:
@@ -110,6 +207,7 @@ class LibraryViewModel(QObject):
         if topic:
             self._current_topic = topic
             self._current_example = None  # Örnek seçimini temizle
+            self.cancel_highlight()
             self.topic_selected.emit(topic_id)
     
     def select_example_by_id(self, example_id: str) -> None:
@@ -120,6 +218,7 @@ class LibraryViewModel(QObject):
         for example in self._current_topic.examples:
             if example.id == example_id:
                 self._current_example = example
+                self._highlight_example_async(example)
                 self.example_selected.emit(example_id)
                 break
     
@@ -133,14 +232,20 @@ class LibraryViewModel(QObject):
         if parent_id:
             # Alt konu olarak ekle
             parent_topic = self._current_library.find_topic_by_id(parent_id)
-            if parent_topic:
-                parent_topic.add_child(new_topic)
+            if parent_topic is None:
+                # Hiçbir yere bağlanmayan konu indekslenmez ve günlüğe yazılmaz
+                return ""
+            parent_topic.add_child(new_topic)
         else:
             # Ana konu olarak ekle
             self._current_library.add_topic(new_topic)
         
-        self._update_tree_model()
-        self.data_changed.emit()
+        self._search_index.index_topic(new_topic)
+        self._insert_tree_item(new_topic)
+        owner = new_topic.parent if new_topic.parent is not None else self._current_library
+        self._record_change('add_topic', topic=new_topic.to_dict(),
+                            parent_id=new_topic.parent.id if new_topic.parent else None,
+                            updated_at=owner.updated_at.isoformat())
         return new_topic.id
     
     def update_topic_content(self, topic_id: str, content: str) -> None:
@@ -153,7 +258,10 @@ class LibraryViewModel(QObject):
             topic.content = content
             from datetime import datetime
             topic.updated_at = datetime.now()
-            self.data_changed.emit()
+            self._search_index.index_topic(topic)
+            self._record_change('update_topic', id=topic_id, fields={
+                'content': content, 'updated_at': topic.updated_at.isoformat()
+            })
     
     def update_topic_title(self, topic_id: str, title: str) -> None:
         """Konu başlığını günceller"""
@@ -165,35 +273,40 @@ class LibraryViewModel(QObject):
             topic.title = title
             from datetime import datetime
             topic.updated_at = datetime.now()
-            self._update_tree_model()
-            self.data_changed.emit()
+            self._search_index.index_topic(topic)
+            self._update_tree_item_text(topic)
+            self._record_change('update_topic', id=topic_id, fields={
+                'title': title, 'updated_at': topic.updated_at.isoformat()
+            })
     
     def delete_topic(self, topic_id: str) -> bool:
         """Konu siler"""
         if not self._current_library:
             return False
         
-        # Ana konularda ara
-        if self._current_library.remove_topic(topic_id):
-            self._update_tree_model()
-            self.data_changed.emit()
-            return True
-        
-        # Alt konularda ara (recursive)
-        def remove_from_children(topics: List[Topic]) -> bool:
-            for topic in topics:
-                if topic.remove_child(topic_id):
-                    return True
-                if remove_from_children(topic.children):
-                    return True
+        topic = self._current_library.find_topic_by_id(topic_id)
+        if not topic:
             return False
         
-        if remove_from_children(self._current_library.topics):
-            self._update_tree_model()
-            self.data_changed.emit()
-            return True
+        if self._tree_model:
+            self._tree_model.begin_remove_topic(topic)
         
-        return False
+        # Üst konu referansı sayesinde ağacı taramaya gerek yok
+        owner = topic.parent if topic.parent is not None else self._current_library
+        parent_id = topic.parent.id if topic.parent is not None else None
+        if topic.parent is not None:
+            removed = topic.parent.remove_child(topic_id)
+        else:
+            removed = self._current_library.remove_topic(topic_id)
+        
+        if self._tree_model:
+            self._tree_model.end_remove_topic(topic)
+        
+        if removed:
+            self._search_index.remove_subtree(topic)
+            self._record_change('delete_topic', id=topic_id, parent_id=parent_id,
+                                updated_at=owner.updated_at.isoformat())
+        return removed
     
     def add_new_example(self, name: str, content: str, language: str = "text") -> str:
         """Seçili konuya yeni örnek ekler"""
@@ -202,7 +315,10 @@ class LibraryViewModel(QObject):
         
         new_example = Example(name=name, content=content, language=language)
         self._current_topic.add_example(new_example)
-        self.data_changed.emit()
+        self._search_index.index_topic(self._current_topic)
+        self._record_change('add_example', topic_id=self._current_topic.id,
+                            example=new_example.to_dict(),
+                            updated_at=self._current_topic.updated_at.isoformat())
         return new_example.id
     
     def update_example(self, example_id: str, name: str = None, 
@@ -222,7 +338,13 @@ class LibraryViewModel(QObject):
                 
                 from datetime import datetime
                 example.updated_at = datetime.now()
-                self.data_changed.emit()
+                self._search_index.index_topic(self._current_topic)
+                self._record_change('update_example', topic_id=self._current_topic.id,
+                                    id=example_id, fields={
+                                        'name': example.name, 'content': example.content,
+                                        'language': example.language,
+                                        'updated_at': example.updated_at.isoformat()
+                                    })
                 break
     
     def delete_example(self, example_id: str) -> bool:
@@ -233,7 +355,9 @@ class LibraryViewModel(QObject):
         if self._current_topic.remove_example(example_id):
             if self._current_example and self._current_example.id == example_id:
                 self._current_example = None
-            self.data_changed.emit()
+            self._search_index.index_topic(self._current_topic)
+            self._record_change('delete_example', topic_id=self._current_topic.id, id=example_id,
+                                updated_at=self._current_topic.updated_at.isoformat())
             return True
         return False
     
@@ -242,44 +366,63 @@ class LibraryViewModel(QObject):
         if not self._current_library or not query.strip():
             return []
         
-        results = self._current_library.search_topics(query)
-        self._search_results = results
+        # Ters indeks sorgusu - maliyet posting list boyutuyla orantılı
+        results = []
+        for topic_id, score in self._search_index.search(query):
+            topic = self._current_library.find_topic_by_id(topic_id)
+            if topic:
+                results.append((topic, score))
+        self._search_results = [topic for topic, _ in results]
         
         # UI için uygun format
-        return [
-            {
-                'id': topic.id,
-                'title': topic.title,
-                'content_preview': topic.content[:100] + "..." if len(topic.content) > 100 else topic.content,
-                'tags': topic.tags
-            }
-            for topic in results
-        ]
+        return [self._search_result_to_dict(topic, score) for topic, score in results]
+    
+    def search_topics_async(self, query: str) -> None:
+        """
+        Aramayı arka plan thread'inde çalıştırır.
+        
+        Sonuçlar sıralı parçalar halinde search_results_ready ile gelir.
+        Yeni bir arama başlatılınca önceki arama iptal edilir ve ondan
+        gelebilecek geç sonuçlar yok sayılır.
+        """
+        self.cancel_search()
+        self._search_generation += 1
+        self._search_query = query
+        self.search_started.emit()
+        
+        if not self._current_library or not query.strip():
+            self._search_results = []
+            self.search_finished.emit(0)
+            return
+        
+        worker = Worker(self._run_search, self._search_generation, query)
+        worker.signals.progress.connect(self._on_search_batch)
+        worker.signals.finished.connect(self._on_search_done)
+        worker.signals.error.connect(self._on_search_error)
+        self._search_worker = worker
+        self._thread_pool.start(worker)
+    
+    def cancel_search(self) -> None:
+        """Devam eden arka plan aramasını iptal eder"""
+        if self._search_worker is not None:
+            self._search_worker.cancel()
+            self._search_worker = None
+    
+    def cancel_highlight(self) -> None:
+        """Devam eden örnek renklendirmesini iptal eder"""
+        self._highlight_generation += 1
+        self._current_example_html = ""
+        if self._highlight_worker is not None:
+            self._highlight_worker.cancel()
+            self._highlight_worker = None
     
     def get_topic_hierarchy(self, topic_id: str) -> List[Dict[str, str]]:
         """Konunun hiyerarşisini döndürür (breadcrumb için)"""
         if not self._current_library:
             return []
         
-        def find_path(topics: List[Topic], target_id: str, path: List[Topic] = None) -> Optional[List[Topic]]:
-            if path is None:
-                path = []
-            
-            for topic in topics:
-                current_path = path + [topic]
-                if topic.id == target_id:
-                    return current_path
-                
-                result = find_path(topic.children, target_id, current_path)
-                if result:
-                    return result
-            
-            return None
-        
-        path = find_path(self._current_library.topics, topic_id)
-        if path:
-            return [{'id': topic.id, 'title': topic.title} for topic in path]
-        return []
+        path = self._current_library.get_topic_path(topic_id)
+        return [{'id': topic.id, 'title': topic.title} for topic in path]
     
     def get_current_topic_examples(self) -> List[Dict[str, Any]]:
         """Seçili konunun örneklerini döndürür"""
@@ -291,37 +434,202 @@ class LibraryViewModel(QObject):
                 'id': example.id,
                 'name': example.name,
                 'language': example.language,
-                'content_preview': example.content[:50] + "..." if len(example.content) > 50 else example.content
+                'content_preview': example.get_content_preview(50)
             }
             for example in self._current_topic.examples
         ]
     
     # Private Methods
-    def _update_tree_model(self) -> None:
-        """Tree model'ı günceller"""
-        if not self._tree_model or not self._current_library:
+    @Slot(object)
+    def _on_save_done(self, success: bool) -> None:
+        """Arka plan kaydı tamamlandığında (GUI thread)"""
+        self._save_worker = None
+        self.library_saved.emit(success)
+        if not success:
+            self.error_occurred.emit("Veri kaydedilemedi!")
+        elif self._save_pending and (self.has_unsaved_changes() or self.needs_compaction()):
+            self.save_library_async()
+    
+    @Slot(str)
+    def _on_save_error(self, message: str) -> None:
+        """Arka plan kaydı hata verdiğinde (GUI thread)"""
+        self._save_worker = None
+        self.error_occurred.emit(f"Veri kaydedilirken hata oluştu: {message}")
+        self.library_saved.emit(False)
+    
+    def _record_change(self, op: str, **payload: Any) -> None:
+        """Düzenlemeyi günlüğe işler ve data_changed sinyalini yayar"""
+        self._data_service.record_change(op, **payload)
+        self.data_changed.emit()
+    
+    def _rebuild_search_index(self) -> None:
+        """
+        Arama indeksini yüklenen kütüphaneyle baştan kurar
+        
+        Başlık, etiket ve örnek adları hemen indekslenir. Konu ve örnek
+        gövdeleri (tembel içerik modunda diskten okunarak) arka planda
+        indekslenir; böylece açılış gövdelerin toplam boyutunu beklemez.
+        Tam indeks hazır olunca devralınır ve süren arama tekrarlanır.
+        """
+        if self._index_worker is not None:
+            self._index_worker.cancel()
+            self._index_worker = None
+        self._index_generation += 1
+        
+        library = self._current_library
+        self._search_index.rebuild(library, include_bodies=False)
+        topics = list(iter_topics(library))
+        worker = Worker(self._run_index_build, self._index_generation, topics)
+        worker.signals.finished.connect(self._on_index_built)
+        worker.signals.error.connect(self._on_index_error)
+        self._index_worker = worker
+        self._thread_pool.start(worker)
+    
+    def _run_index_build(self, worker: Worker, generation: int, topics: List[Topic]) -> tuple:
+        """Worker thread'inde gövdeler dahil tam indeksi oluşturur"""
+        return generation, SearchIndex.build(topics, worker.is_cancelled)
+    
+    def _run_search(self, worker: Worker, generation: int, query: str) -> tuple:
+        """Worker thread'inde çalışan arama (sonuçları parça parça iletir)"""
+        library = self._current_library
+        topics: List[Topic] = []
+        batch: List[Dict[str, Any]] = []
+        
+        for topic_id, score in self._search_index.search(query):
+            if worker.is_cancelled():
+                break
+            topic = library.find_topic_by_id(topic_id)
+            if topic is None:
+                continue
+            topics.append(topic)
+            batch.append(self._search_result_to_dict(topic, score))
+            if len(batch) >= self.SEARCH_BATCH_SIZE:
+                worker.report_progress((generation, batch))
+                batch = []
+        
+        if batch:
+            worker.report_progress((generation, batch))
+        return generation, topics
+    
+    def _highlight_example_async(self, example: Example) -> None:
+        """
+        Örneğin renklendirmesini arka planda başlatır
+        
+        Sonuç önbellekteyse hemen kullanılır. Değilse UI önce düz metni
+        gösterir; HTML hazır olunca example_highlighted yayılır. Başka bir
+        örnek seçilince önceki iş iptal edilir ve geç sonucu yok sayılır.
+        HIGHLIGHT_MAX_CHARS'tan uzun örnekler düz metin olarak kalır.
+        """
+        self.cancel_highlight()
+        content, language = example.content, example.language
+        if len(content) > self.HIGHLIGHT_MAX_CHARS:
             return
+        html = self._highlighter.cached_html(content, language)
+        if html is not None:
+            self._current_example_html = html
+            return
+        
+        worker = Worker(self._run_highlight, self._highlight_generation, example.id, content, language)
+        worker.signals.finished.connect(self._on_highlight_done)
+        self._highlight_worker = worker
+        self._highlight_pool.start(worker)
+    
+    def _run_highlight(self, worker: Worker, generation: int, example_id: str,
+                       content: str, language: str) -> tuple:
+        """
+        Worker thread'inde çalışan renklendirme
         
-        self._tree_model.clear()
-        self._tree_model.setHorizontalHeaderLabels(["Konular"])
-        
-        def add_topic_to_model(topic: Topic, parent_item: QStandardItem = None):
-            item = QStandardItem(topic.title)
-            item.setData(topic.id, role=256)  # Custom role for topic ID
-            item.setEditable(False)
-            
-            if parent_item:
-                parent_item.appendRow(item)
-            else:
-                self._tree_model.appendRow(item)
-            
-            # Alt konuları ekle
-            for child in topic.children:
-                add_topic_to_model(child, item)
-        
-        # Ana konuları ekle
-        for topic in self._current_library.topics:
-            add_topic_to_model(topic)
+        Hata da sonuçla birlikte döndürülür; böylece önceki bir örneğe ait
+        geç gelen hata, nesil numarasıyla ayıklanıp yok sayılabilir.
+        """
+        try:
+            html = self._highlighter.highlight_code(content, language, worker.is_cancelled)
+        except HighlightCancelled:
+            return generation, example_id, None, None
+        except Exception as e:
+            return generation, example_id, None, str(e)
+        return generation, example_id, html, None
+    
+    @Slot(object)
+    def _on_highlight_done(self, payload: tuple) -> None:
+        """Renklendirme tamamlandığında veya hata verdiğinde (GUI thread)"""
+        generation, example_id, html, error = payload
+        if generation != self._highlight_generation:
+            return
+        self._highlight_worker = None
+        if error is not None:
+            # Düz metin gösterilmeye devam eder
+            self.error_occurred.emit(f"Örnek renklendirilemedi: {error}")
+            return
+        if html is None:
+            return
+        self._current_example_html = html
+        self.example_highlighted.emit(example_id)
+    
+    @Slot(object)
+    def _on_index_built(self, payload: tuple) -> None:
+        """Gövdeler dahil arama indeksi hazır olduğunda (GUI thread)"""
+        generation, index = payload
+        if generation != self._index_generation or index is None:
+            return
+        self._index_worker = None
+        if self._search_index.adopt(index, self._current_library) and self._search_query.strip():
+            # Yalnızca başlıklarda yapılmış aramayı tam indeksle tekrarla
+            self.search_topics_async(self._search_query)
+    
+    @Slot(str)
+    def _on_index_error(self, message: str) -> None:
+        """Arka plan indekslemesi hata verdiğinde (GUI thread)"""
+        self._index_worker = None
+        self.error_occurred.emit(f"Arama indeksi oluşturulamadı: {message}")
+    
+    @Slot(object)
+    def _on_search_batch(self, payload: tuple) -> None:
+        """Arama sonuç parçası geldiğinde (GUI thread)"""
+        generation, batch = payload
+        if generation == self._search_generation:
+            self.search_results_ready.emit(batch)
+    
+    @Slot(object)
+    def _on_search_done(self, payload: tuple) -> None:
+        """Arama tamamlandığında (GUI thread)"""
+        generation, topics = payload
+        if generation != self._search_generation:
+            return
+        self._search_worker = None
+        self._search_results = topics
+        self.search_finished.emit(len(topics))
+    
+    @Slot(str)
+    def _on_search_error(self, message: str) -> None:
+        """Arama hata verdiğinde (GUI thread)"""
+        self._search_worker = None
+        self.error_occurred.emit(f"Arama sırasında hata oluştu: {message}")
+    
+    def _search_result_to_dict(self, topic: Topic, score: int) -> Dict[str, Any]:
+        """Arama sonucunu UI için uygun formata çevirir"""
+        return {
+            'id': topic.id,
+            'title': topic.title,
+            'content_preview': topic.get_content_preview(100),
+            'tags': topic.tags,
+            'score': score
+        }
+    
+    def _update_tree_model(self) -> None:
+        """Tree model'ı baştan oluşturur (yükleme ve içe aktarma sonrası)"""
+        if self._tree_model:
+            self._tree_model.set_library(self._current_library)
+    
+    def _insert_tree_item(self, topic: Topic) -> None:
+        """Yeni eklenen konuyu tree model'a bildirir"""
+        if self._tree_model:
+            self._tree_model.topic_inserted(topic)
+    
+    def _update_tree_item_text(self, topic: Topic) -> None:
+        """Konu başlığı değişikliğini tree model'a bildirir"""
+        if self._tree_model:
+            self._tree_model.topic_changed(topic)
     
     def create_backup(self) -> bool:
         """Manuel backup oluşturur"""
@@ -331,20 +639,31 @@ class LibraryViewModel(QObject):
             self.error_occurred.emit(f"Backup oluşturulurken hata: {str(e)}")
             return False
     
-    def export_data(self, file_path: str) -> bool:
-        """Veriyi dışa aktarır"""
+    def export_data(self, file_path: str, indent: Optional[int] = 2) -> bool:
+        """Veriyi dışa aktarır (indent=None: girintisiz, makineler arası aktarım için)"""
         try:
-            return self._data_service.export_to_file(file_path)
+            return self._data_service.export_to_file(file_path, indent)
         except Exception as e:
             self.error_occurred.emit(f"Dışa aktarım hatası: {str(e)}")
             return False
     
+    def dedup_content(self) -> int:
+        """Aynı içerikli gövdeleri tekilleştirir (bakım işlemi)"""
+        try:
+            # Arka plan kaydı eski içerik dosyasını gösteren görüntüyü yazıyor olabilir
+            self.wait_for_pending_save()
+            return self._data_service.dedup_content()
+        except Exception as e:
+            self.error_occurred.emit(f"Tekilleştirme hatası: {str(e)}")
+            return 0
+    
     def import_data(self, file_path: str) -> bool:
         """Veriyi içe aktarır"""
         try:
             success = self._data_service.import_from_file(file_path)
             if success:
                 self._current_library = self._data_service.get_library()
+                self._rebuild_search_index()
                 self._update_tree_model()
                 self.library_loaded.emit()
             return success
@@ -0,0 +1,236 @@
+"""
+Konu ağacı için tembel (lazy) yüklenen Qt modeli
+Topic nesneleri üzerinde doğrudan çalışır, alt düğümler yalnızca
+ilgili dal açıldığında görünür hale getirilir.
+"""
+
+from typing import Dict, List, Optional, Any
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, Qt
+
+from ..models.library_models import Library, Topic
+
+
+# Konu ID'sinin tutulduğu özel rol (Qt.UserRole)
+TOPIC_ID_ROLE = 256
+
+
+class TopicTreeModel(QAbstractItemModel):
+    """
+    Library içindeki konuları gösteren QAbstractItemModel
+
+    Her düğüm için o ana kadar görünür kılınmış (fetch edilmiş) çocuk
+    sayısı tutulur; canFetchMore/fetchMore ile parça parça açılır.
+    Bellek ve açılış süresi ağacın boyutuna değil, görünen kısma bağlıdır.
+    """
+
+    # fetchMore çağrısı başına görünür kılınacak satır sayısı
+    FETCH_BATCH_SIZE = 256
+
+    def __init__(self, library: Library = None, parent=None):
+        super().__init__(parent)
+        self._library: Optional[Library] = None
+        # topic_id (kök için None) -> görünür çocuk sayısı
+        self._fetched: Dict[Optional[str], int] = {}
+        # topic_id -> kardeşler arasındaki satır numarası
+        self._rows: Dict[str, int] = {}
+        # begin_remove_topic ile end_remove_topic arasındaki bekleyen silme
+        self._pending_removal: Optional[tuple] = None
+        # topic_inserted sırasında view'ın yeni satırı ayrıca fetch etmesini engeller
+        self._inserting = False
+
+        if library is not None:
+            self.set_library(library)
+
+    def set_library(self, library: Optional[Library]) -> None:
+        """Modeli verilen kütüphaneyle sıfırlar"""
+        self.beginResetModel()
+        self._library = library
+        self._fetched.clear()
+        self._rows.clear()
+        if library is not None:
+            # Kök seviyenin ilk parçası hemen görünür olsun
+            self._fetched[None] = min(len(library.topics), self.FETCH_BATCH_SIZE)
+        self.endResetModel()
+
+    # QAbstractItemModel arayüzü
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+
+        topic = self._children_of(self._topic_from_index(parent))[row]
+        self._rows[topic.id] = row
+        return self.createIndex(row, column, topic)
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+
+        parent_topic = index.internalPointer().parent
+        if parent_topic is None:
+            return QModelIndex()
+        return self.createIndex(self._row_of(parent_topic), 0, parent_topic)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0 or self._library is None:
+            return 0
+        return self._fetched.get(self._key(parent), 0)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.column() > 0 or self._library is None:
+            return False
+        return bool(self._children_of(self._topic_from_index(parent)))
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        if parent.column() > 0 or self._library is None or self._inserting:
+            return False
+        children = self._children_of(self._topic_from_index(parent))
+        return self._fetched.get(self._key(parent), 0) < len(children)
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        if self._library is None or self._inserting:
+            return
+
+        key = self._key(parent)
+        fetched = self._fetched.get(key, 0)
+        children = self._children_of(self._topic_from_index(parent))
+        count = min(len(children) - fetched, self.FETCH_BATCH_SIZE)
+        if count <= 0:
+            return
+
+        self.beginInsertRows(parent, fetched, fetched + count - 1)
+        self._fetched[key] = fetched + count
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        topic = index.internalPointer()
+        if role == Qt.DisplayRole:
+            return topic.title
+        if role == TOPIC_ID_ROLE:
+            return topic.id
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and section == 0:
+            return "Konular"
+        return None
+
+    # Artımlı güncellemeler - ViewModel model değişikliklerinden sonra çağırır
+    def index_for_topic(self, topic: Topic) -> QModelIndex:
+        """Konunun model index'ini döndürür (henüz görünür değilse geçersiz)"""
+        if self._library is None:
+            return QModelIndex()
+
+        parent_key = topic.parent.id if topic.parent is not None else None
+        row = self._row_of(topic)
+        if row < 0 or row >= self._fetched.get(parent_key, 0):
+            return QModelIndex()
+        return self.createIndex(row, 0, topic)
+
+    def topic_inserted(self, topic: Topic) -> None:
+        """Kardeşlerinin sonuna eklenmiş bir konuyu modele bildirir"""
+        if self._library is None:
+            return
+
+        parent_topic = topic.parent
+        parent_key = parent_topic.id if parent_topic is not None else None
+        if parent_topic is not None:
+            parent_index = self.index_for_topic(parent_topic)
+            if not parent_index.isValid():
+                # Üst düğüm hiç görünmüyor; açıldığında fetchMore ile gelecek
+                return
+        else:
+            parent_index = QModelIndex()
+
+        siblings = self._children_of(parent_topic)
+        row = len(siblings) - 1
+        self._rows[topic.id] = row
+        fetched = self._fetched.get(parent_key, 0)
+        if fetched == row:
+            # Üst düğümün tüm çocukları görünür; yeni satırı hemen ekle
+            self._inserting = True
+            try:
+                self.beginInsertRows(parent_index, row, row)
+                self._fetched[parent_key] = fetched + 1
+                self.endInsertRows()
+            finally:
+                self._inserting = False
+
+    def topic_changed(self, topic: Topic) -> None:
+        """Tek bir konunun görünen verisinin değiştiğini bildirir"""
+        index = self.index_for_topic(topic)
+        if index.isValid():
+            self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def begin_remove_topic(self, topic: Topic) -> None:
+        """Konu modelden silinmeden önce çağrılır"""
+        self._pending_removal = None
+        index = self.index_for_topic(topic)
+        if not index.isValid():
+            return
+
+        parent_key = topic.parent.id if topic.parent is not None else None
+        self._pending_removal = (parent_key, index.row(), topic.parent)
+        self.beginRemoveRows(self.parent(index), index.row(), index.row())
+
+    def end_remove_topic(self, topic: Topic) -> None:
+        """Konu modelden silindikten sonra çağrılır"""
+        # Silinen alt ağacın önbellek kayıtlarını temizle
+        stack = [topic]
+        while stack:
+            current = stack.pop()
+            self._rows.pop(current.id, None)
+            self._fetched.pop(current.id, None)
+            stack.extend(current.children)
+
+        if self._pending_removal is None:
+            return
+
+        parent_key, row, parent_topic = self._pending_removal
+        self._pending_removal = None
+        self._fetched[parent_key] -= 1
+        # Sonraki kardeşlerin satır numaraları bir kaydı
+        siblings = self._children_of(parent_topic)
+        for i in range(row, len(siblings)):
+            if siblings[i].id in self._rows:
+                self._rows[siblings[i].id] = i
+        self.endRemoveRows()
+
+    # Yardımcı metotlar
+    def _children_of(self, topic: Optional[Topic]) -> List[Topic]:
+        """Düğümün çocuk listesini döndürür (None kök seviyesidir)"""
+        if topic is None:
+            return self._library.topics if self._library is not None else []
+        return topic.children
+
+    def _topic_from_index(self, index: QModelIndex) -> Optional[Topic]:
+        """Index'in gösterdiği konuyu döndürür (kök için None)"""
+        return index.internalPointer() if index.isValid() else None
+
+    def _key(self, index: QModelIndex) -> Optional[str]:
+        """Fetch sayacı anahtarını döndürür"""
+        topic = self._topic_from_index(index)
+        return topic.id if topic is not None else None
+
+    def _row_of(self, topic: Topic) -> int:
+        """Konunun kardeşleri arasındaki satırını döndürür"""
+        row = self._rows.get(topic.id)
+        siblings = self._children_of(topic.parent)
+        if row is not None and row < len(siblings) and siblings[row] is topic:
+            return row
+
+        for i, sibling in enumerate(siblings):
+            if sibling is topic:
+                self._rows[topic.id] = i
+                return i
+        return -1
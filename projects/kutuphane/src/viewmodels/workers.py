@@ -0,0 +1,67 @@
+"""
+Arka plan iş parçacığı yardımcıları
+Uzun süren işleri QThreadPool üzerinde çalıştırıp sonuçlarını
+sinyallerle GUI thread'ine iletir.
+"""
+
+import threading
+from typing import Any, Callable
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+class WorkerSignals(QObject):
+    """Worker'ın GUI thread'ine ilettiği sinyaller"""
+
+    progress = Signal(object)  # ara sonuç
+    finished = Signal(object)  # nihai sonuç
+    error = Signal(str)  # error_message
+
+
+class Worker(QRunnable):
+    """
+    Verilen fonksiyonu thread pool üzerinde çalıştıran iptal edilebilir iş
+
+    Fonksiyon ilk argüman olarak worker'ın kendisini alır; böylece
+    `report_progress` ile ara sonuç gönderebilir ve `is_cancelled` ile
+    iptal edilip edilmediğini kontrol edebilir. İptal edilen bir işin
+    sinyalleri artık yayılmaz.
+    """
+
+    def __init__(self, fn: Callable[..., Any], *args, **kwargs):
+        super().__init__()
+        self.signals = WorkerSignals()
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+        self._cancelled = threading.Event()
+        # Python tarafı referansı ViewModel tutar
+        self.setAutoDelete(False)
+
+    def cancel(self) -> None:
+        """İşi iptal eder (çalışan fonksiyon is_cancelled ile kontrol etmelidir)"""
+        self._cancelled.set()
+
+    def is_cancelled(self) -> bool:
+        """İş iptal edildi mi"""
+        return self._cancelled.is_set()
+
+    def report_progress(self, value: Any) -> None:
+        """Ara sonucu GUI thread'ine iletir"""
+        if not self.is_cancelled():
+            self.signals.progress.emit(value)
+
+    def run(self) -> None:
+        """Thread pool tarafından çağrılır"""
+        if self.is_cancelled():
+            return
+
+        try:
+            result = self._fn(self, *self._args, **self._kwargs)
+        except Exception as e:
+            if not self.is_cancelled():
+                self.signals.error.emit(str(e))
+            return
+
+        if not self.is_cancelled():
+            self.signals.finished.emit(result)
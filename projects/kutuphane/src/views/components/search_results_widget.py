@@ -0,0 +1,54 @@
+"""
+Arama sonuçları widget'ı
+"""
+
+from typing import List, Dict, Any
+from PySide6.QtWidgets import QListWidget, QListWidgetItem
+from PySide6.QtCore import Signal
+
+
+class SearchResultsWidget(QListWidget):
+    """Canlı arama sonuçlarını sıralı olarak gösteren liste widget'ı"""
+    
+    # Signals
+    topic_selected = Signal(str)  # topic_id
+    
+    def __init__(self):
+        super().__init__()
+        self._setup_ui()
+    
+    def _setup_ui(self):
+        """UI ayarlarını yapar"""
+        # Liste ayarları
+        self.setAlternatingRowColors(True)
+        self.setSelectionMode(QListWidget.SingleSelection)
+        self.setMaximumHeight(200)
+        self.setUniformItemSizes(True)
+        self.hide()
+        
+        # Signals
+        self.itemClicked.connect(self._on_item_clicked)
+    
+    def clear_results(self):
+        """Sonuçları temizler"""
+        self.clear()
+    
+    def append_results(self, results: List[Dict[str, Any]]):
+        """Gelen sonuç parçasını listenin sonuna ekler (sıra korunur)"""
+        self.setUpdatesEnabled(False)
+        for result in results:
+            item = QListWidgetItem()
+            item.setText(result['title'])
+            item.setToolTip(result['content_preview'])
+            item.setData(256, result['id'])  # Custom role for topic ID
+            self.addItem(item)
+        self.setUpdatesEnabled(True)
+        
+        if self.count() > 0:
+            self.show()
+    
+    def _on_item_clicked(self, item: QListWidgetItem):
+        """Sonuca tıklandığında"""
+        topic_id = item.data(256)
+        if topic_id:
+            self.topic_selected.emit(topic_id)
@@ -3,8 +3,7 @@ Konu ağacı widget'ı
 """
 
 from PySide6.QtWidgets import QTreeView, QHeaderView
-from PySide6.QtCore import Signal, QModelIndex
-from PySide6.QtGui import QStandardItemModel
+from PySide6.QtCore import Signal, QModelIndex, QAbstractItemModel
 
 
 class TopicTreeWidget(QTreeView):
@@ -37,10 +36,10 @@ class TopicTreeWidget(QTreeView):
         self.clicked.connect(self._on_item_clicked)
         self.doubleClicked.connect(self._on_item_double_clicked)
     
-    def set_model(self, model: QStandardItemModel):
+    def set_model(self, model: QAbstractItemModel):
         """Tree model'ını ayarlar"""
         super().setModel(model)
-        # İlk seviyeyi expand et
+        # İlk seviyeyi expand et (tembel modelde yalnızca bu dallar yüklenir)
         if model.rowCount() > 0:
             for i in range(model.rowCount()):
                 index = model.index(i, 0)
@@ -49,8 +48,7 @@ class TopicTreeWidget(QTreeView):
     def _on_item_clicked(self, index: QModelIndex):
         """Tree item'a tıklandığında"""
         if index.isValid():
-            item = self.model().itemFromIndex(index)
-            topic_id = item.data(256)  # Custom role for topic ID
+            topic_id = index.data(256)  # Custom role for topic ID
             if topic_id:
                 self._selected_topic_id = topic_id
                 self.topic_selected.emit(topic_id)
@@ -11,24 +11,28 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QAction, QIcon, QFont
+from html import escape
 from typing import Optional
 
 from ..viewmodels.library_viewmodel import LibraryViewModel
+from ..services.compression import compression_for_path, zstd_available
+from ..services.data_service import DataService
 from .components.topic_tree_widget import TopicTreeWidget
 from .components.content_editor import ContentEditor
 from .components.example_list_widget import ExampleListWidget
+from .components.search_results_widget import SearchResultsWidget
 
 
 class MainWindow(QMainWindow):
     """Ana uygulama penceresi - 3 panel tasarım"""
     
-    def __init__(self):
+    def __init__(self, data_service: DataService = None):
         super().__init__()
         self.setWindowTitle("Kişisel Kütüphane v1.0")
         self.setGeometry(100, 100, 1400, 800)
         
-        # ViewModel
-        self.view_model = LibraryViewModel()
+        # ViewModel (veri servisi verilmezse JSON tabanlı servis kullanılır)
+        self.view_model = LibraryViewModel(data_service)
         
         # UI bileşenlerini oluştur
         self._setup_ui()
@@ -87,6 +91,15 @@ class MainWindow(QMainWindow):
         search_layout.addWidget(self.search_button)
         layout.addLayout(search_layout)
         
+        # Canlı arama sonuçları (yazarken dolar)
+        self.search_results = SearchResultsWidget()
+        layout.addWidget(self.search_results)
+        
+        # Yazma bitene kadar aramayı geciktiren timer (debounce)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(250)
+        
         # Konu ağacı
         self.topic_tree = TopicTreeWidget()
         layout.addWidget(self.topic_tree)
@@ -210,6 +223,10 @@ class MainWindow(QMainWindow):
         import_action.triggered.connect(self._import_data)
         file_menu.addAction(import_action)
         
+        dedup_action = QAction("İçerikleri Tekilleştir", self)
+        dedup_action.triggered.connect(self._dedup_content)
+        file_menu.addAction(dedup_action)
+        
         file_menu.addSeparator()
         
         exit_action = QAction("Çıkış", self)
@@ -266,12 +283,19 @@ class MainWindow(QMainWindow):
         self.view_model.library_saved.connect(self._on_library_saved)
         self.view_model.topic_selected.connect(self._on_topic_selected)
         self.view_model.example_selected.connect(self._on_example_selected)
+        self.view_model.example_highlighted.connect(self._on_example_highlighted)
         self.view_model.data_changed.connect(self._on_data_changed)
         self.view_model.error_occurred.connect(self._on_error)
+        self.view_model.search_started.connect(self.search_results.clear_results)
+        self.view_model.search_results_ready.connect(self.search_results.append_results)
+        self.view_model.search_finished.connect(self._on_search_finished)
         
         # UI sinyalleri
         self.search_button.clicked.connect(self._search_topics)
         self.search_input.returnPressed.connect(self._search_topics)
+        self.search_input.textChanged.connect(self._search_timer.start)
+        self._search_timer.timeout.connect(self._search_topics)
+        self.search_results.topic_selected.connect(self.view_model.select_topic_by_id)
         
         self.add_topic_btn.clicked.connect(self._add_topic)
         self.edit_topic_btn.clicked.connect(self._edit_topic)
@@ -302,6 +326,9 @@ class MainWindow(QMainWindow):
     def _on_library_saved(self, success: bool):
         """Kütüphane kaydedildiğinde çağrılır"""
         if success:
+            # Kayıt sürerken yeni değişiklik yapıldıysa işaret kalsın
+            if not self.view_model.has_unsaved_changes():
+                self.setWindowTitle("Kişisel Kütüphane v1.0")
             self.status_bar.showMessage("Kaydedildi", 2000)
         else:
             self.status_bar.showMessage("Kaydetme hatası!", 5000)
@@ -324,14 +351,34 @@ class MainWindow(QMainWindow):
     
     def _on_example_selected(self, example_id: str):
         """Örnek seçildiğinde çağrılır"""
-        content = f"**{self.view_model.current_example_name}**\n\n"
-        content += f"Dil: {self.view_model.current_example_language}\n\n"
-        content += "```" + self.view_model.current_example_language + "\n"
-        content += self.view_model.current_example_content + "\n```"
-        
-        self.example_viewer.setMarkdown(content)
+        # Renklendirme hazır değilse önce düz metin gösterilir
+        self._show_example(self.view_model.current_example_html or
+                           f"<pre>{escape(self.view_model.current_example_content, quote=False)}</pre>")
         self.status_bar.showMessage(f"Örnek seçildi: {self.view_model.current_example_name}")
     
+    def _on_example_highlighted(self, example_id: str):
+        """Seçili örneğin renklendirmesi arka planda bittiğinde çağrılır"""
+        self._show_example(self.view_model.current_example_html)
+    
+    def _show_example(self, code_html: str):
+        """Örnek görüntüleme alanını başlık ve kod HTML'i ile doldurur"""
+        content = f"<p><b>{escape(self.view_model.current_example_name)}</b></p>"
+        content += f"<p>Dil: {escape(self.view_model.current_example_language)}</p>"
+        content += code_html
+        self.example_viewer.setHtml(content)
+    
+    def _on_search_finished(self, total: int):
+        """Canlı arama tamamlandığında çağrılır"""
+        if not self.search_input.text().strip():
+            self.search_results.hide()
+            return
+        
+        if total:
+            self.status_bar.showMessage(f"{total} sonuç bulundu")
+        else:
+            self.search_results.hide()
+            self.status_bar.showMessage("Sonuç bulunamadı")
+    
     def _on_data_changed(self):
         """Veri değiştiğinde çağrılır"""
         self.setWindowTitle("Kişisel Kütüphane v1.0 *")  # * ile değişiklik belirt
@@ -357,7 +404,7 @@ class MainWindow(QMainWindow):
     def _open_file(self):
         """Dosya açma diyalogu"""
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Kütüphane Dosyası Aç", "", "JSON Files (*.json)"
+            self, "Kütüphane Dosyası Aç", "", self._library_file_filter()
         )
         
         if file_path:
@@ -365,23 +412,39 @@ class MainWindow(QMainWindow):
                 self.setWindowTitle("Kişisel Kütüphane v1.0")
     
     def _save_file(self):
-        """Mevcut kütüphaneyi kaydet"""
-        self.view_model.save_library()
-        self.setWindowTitle("Kişisel Kütüphane v1.0")
+        """Mevcut kütüphaneyi kaydet (arka planda)"""
+        self.view_model.save_library_async()
     
     def _export_data(self):
         """Veri dışa aktarma"""
+        filters = ["JSON Files (*.json)", "Sıkıştırılmış JSON (*.json.gz)"]
+        if zstd_available():
+            filters.append("Sıkıştırılmış JSON - zstd (*.json.zst)")
         file_path, _ = QFileDialog.getSaveFileName(
-            self, "Veri Dışa Aktar", "", "JSON Files (*.json)"
+            self, "Veri Dışa Aktar", "", ";;".join(filters)
         )
         
         if file_path:
-            self.view_model.export_data(file_path)
+            # Sıkıştırılmış dosyalar makineler arası aktarım içindir; girinti gereksiz
+            indent = None if compression_for_path(file_path) else 2
+            self.view_model.export_data(file_path, indent)
+    
+    def _dedup_content(self):
+        """Aynı içerikli gövdeleri tekilleştir"""
+        count = self.view_model.dedup_content()
+        self.status_bar.showMessage(f"{count} tekrarlanan içerik birleştirildi", 3000)
+    
+    def _library_file_filter(self) -> str:
+        """Açma/içe aktarma diyaloglarında gösterilecek dosya türleri"""
+        patterns = "*.json *.json.gz"
+        if zstd_available():
+            patterns += " *.json.zst"
+        return f"Kütüphane Dosyaları ({patterns})"
     
     def _import_data(self):
         """Veri içe aktarma"""
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Veri İçe Aktar", "", "JSON Files (*.json)"
+            self, "Veri İçe Aktar", "", self._library_file_filter()
         )
         
         if file_path:
@@ -393,15 +456,10 @@ class MainWindow(QMainWindow):
         self.search_input.selectAll()
     
     def _search_topics(self):
-        """Konu arama"""
+        """Konu arama (arka planda çalışır, sonuçlar parça parça gelir)"""
+        self._search_timer.stop()
         query = self.search_input.text().strip()
-        if query:
-            results = self.view_model.search_topics(query)
-            # Arama sonuçlarını göster (basitleştirilmiş)
-            if results:
-                self.status_bar.showMessage(f"{len(results)} sonuç bulundu")
-            else:
-                self.status_bar.showMessage("Sonuç bulunamadı")
+        self.view_model.search_topics_async(query)
     
     def _add_topic(self):
         """Yeni konu ekle"""
@@ -453,8 +511,9 @@ class MainWindow(QMainWindow):
         pass
     
     def _auto_save(self):
-        """Otomatik kaydetme"""
-        self.view_model.save_library()
+        """Otomatik kaydetme (değişiklik yoksa veya günlükteyse hiçbir şey yazılmaz)"""
+        if self.view_model.has_unsaved_changes() or self.view_model.needs_compaction():
+            self.view_model.save_library_async()
     
     def _show_about(self):
         """Hakkında diyalogu"""
@@ -468,6 +527,8 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event):
         """Uygulama kapatılırken"""
-        # Son değişiklikleri kaydet
+        # Devam eden arka plan kaydını bekle, günlüğü tam kayda katla
+        self.view_model.wait_for_pending_save()
         self.view_model.save_library()
+        self.view_model.close()
         event.accept()
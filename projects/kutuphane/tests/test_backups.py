@@ -0,0 +1,77 @@
+"""
+Dönen yedek testleri
+"""
+
+import os
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+
+# Test için proje root'unu path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.services.backups import BackupRotator
+from src.services.data_service import DataService
+
+
+class TestBackupRotator(unittest.TestCase):
+    """BackupRotator testleri"""
+
+    def setUp(self):
+        """Test öncesi hazırlık"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_path = Path(self.temp_dir.name) / "library.json.gz"
+        self.rotator = BackupRotator(self.data_path, keep=3)
+
+    def tearDown(self):
+        """Test sonrası temizlik"""
+        self.rotator.close()
+        self.temp_dir.cleanup()
+
+    def test_backup_keeps_old_version(self):
+        """Dosya yerine yenisi yazılınca yedeğin eski içeriği koruması testi"""
+        self.assertIsNone(self.rotator.backup())
+
+        self.data_path.write_bytes(b"eski")
+        backup = self.rotator.backup()
+        self.assertTrue(backup.name.startswith("library.") and backup.name.endswith(".json.gz"))
+        if hasattr(os, 'link'):
+            self.assertTrue(os.path.samefile(backup, self.data_path))
+
+        # Kayıtlar dosyayı yerinde değiştirmez, yenisini yerine taşır
+        temp_path = self.data_path.with_name("yeni.tmp")
+        temp_path.write_bytes(b"yeni")
+        os.replace(temp_path, self.data_path)
+        self.assertEqual(backup.read_bytes(), b"eski")
+
+    def test_prune_keeps_newest(self):
+        """Budamanın en yeni `keep` yedeği bırakması testi"""
+        self.data_path.write_bytes(b"veri")
+        created = [self.rotator.backup() for _ in range(5)]
+        # Yedek adına uymayan dosyalara dokunulmaz
+        (self.rotator.directory / "notlar.txt").write_text("elle eklendi")
+
+        self.rotator.prune_async()
+        self.rotator.close()
+        self.assertEqual(self.rotator.list_backups(), created[-3:])
+        self.assertTrue((self.rotator.directory / "notlar.txt").exists())
+
+    def test_data_service_rotates_on_save(self):
+        """DataService kayıtlarının yedek sayısını sınırlaması testi"""
+        service = DataService(str(Path(self.temp_dir.name) / "library.json"), backup_count=2)
+        library = service.load_library()
+        for i in range(4):
+            library.topics[0].title = f"Sürüm {i}"
+            library.mark_dirty()
+            self.assertTrue(service.save_library())
+        service.close()
+
+        backups = service._backups.list_backups()
+        self.assertEqual(len(backups), 2)
+        self.assertIn('"Sürüm 2"', backups[-1].read_text(encoding='utf-8'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+İkili başlangıç önbelleği testleri
+"""
+
+import io
+import unittest
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Test için proje root'unu path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.models.library_models import Library, Topic, Example
+from src.services.binary_snapshot import read_binary_snapshot, write_binary_snapshot
+from src.services.content_store import ContentStore, attach_content_ref
+
+
+class TestBinarySnapshot(unittest.TestCase):
+    """write_binary_snapshot / read_binary_snapshot testleri"""
+
+    def setUp(self):
+        """Test öncesi hazırlık"""
+        self.library = Library(name="İkili \"Test\"", description="açıklama\nğüşı")
+        for i in range(3):
+            topic = Topic(title=f"Konu {i}", content="İçerik " * 20, tags=["python", "notlar"],
+                          is_expanded=bool(i % 2))
+            child = Topic(title="Alt", tags=["python"])
+            child.add_example(Example(name="Örnek", content="print('ş')", language="python"))
+            child.add_example(Example(name="Boş"))
+            topic.add_child(child)
+            self.library.add_topic(topic)
+        # Saat dilimli ve henüz çözülmemiş zaman damgaları metin olarak saklanır
+        self.library.topics[0].created_at = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        self.library.topics[1]._updated_at = "2023-12-31T23:59:59.000001"
+        self.library.topics[2].created_at = datetime(1960, 5, 6, 7, 8, 9, 10)
+
+    def _dump(self, library, source_key=(10, 20), content_file=None):
+        stream = io.BytesIO()
+        write_binary_snapshot(library, stream, source_key, content_file)
+        return stream.getvalue()
+
+    def test_round_trip(self):
+        """Okunan kütüphanenin yazılanla aynı olması testi"""
+        data = self._dump(self.library)
+        topics = []
+        loaded = read_binary_snapshot(data, (10, 20), on_topic=topics.append)
+
+        self.assertEqual(loaded.to_dict(), self.library.to_dict())
+        self.assertEqual(topics, loaded.topics)
+        child = loaded.topics[1].children[0]
+        self.assertIs(child.parent, loaded.topics[1])
+        self.assertIs(loaded.find_example_by_id(child.examples[0].id), child.examples[0])
+        # Etiketler tek bir metin nesnesini paylaşır
+        self.assertIs(loaded.topics[0].tags[0], child.tags[0])
+        self.assertEqual(data.count("python".encode('utf-8')), 1)
+
+    def test_stale_or_corrupt(self):
+        """Başka JSON haline ait önbelleğin reddedilmesi, bozuk önbellekte hata verilmesi testi"""
+        data = self._dump(self.library)
+        self.assertIsNone(read_binary_snapshot(data, (10, 21)))
+        self.assertIsNone(read_binary_snapshot(b"", (10, 20)))
+
+        corrupt = bytearray(data)
+        corrupt[-3] ^= 0xFF
+        with self.assertRaises(ValueError):
+            read_binary_snapshot(bytes(corrupt), (10, 20))
+
+    def test_content_refs(self):
+        """İçerik dosyasındaki gövdelerin referans olarak saklanması testi"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = ContentStore(Path(temp_dir) / "library.content")
+            try:
+                topic = self.library.topics[0]
+                attach_content_ref(topic, store.append(topic.content))
+                store.sync()
+
+                # İçerik dosyası verilmezse gövde metin olarak yazılır
+                inline = read_binary_snapshot(self._dump(self.library), (10, 20))
+                self.assertIsNone(inline.topics[0]._content_ref)
+                self.assertEqual(inline.topics[0].content, topic.content)
+
+                data = self._dump(self.library, content_file="library.content")
+                loaded = read_binary_snapshot(data, (10, 20), content_store=store)
+                ref = loaded.topics[0]._content_ref
+                self.assertEqual((ref.offset, ref.length), (topic._content_ref.offset, topic._content_ref.length))
+                self.assertEqual(loaded.topics[0].content, topic.content)
+            finally:
+                store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+İçerik deposu testleri
+"""
+
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+
+# Test için proje root'unu path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.models.library_models import Library, Topic, Example
+from src.services.content_store import ContentStore, attach_content_ref
+
+
+class TestContentStore(unittest.TestCase):
+    """ContentStore testleri"""
+
+    def setUp(self):
+        """Test öncesi hazırlık"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = ContentStore(Path(self.temp_dir.name) / "library.content", cache_chars=1000)
+
+    def tearDown(self):
+        """Test sonrası temizlik"""
+        self.store.close()
+        self.temp_dir.cleanup()
+
+    def test_append_and_read_after_growth(self):
+        """Eşleme sonrası eklenen gövdelerin de okunabilmesi testi"""
+        first = self.store.append("ilk gövde ğüş")
+        self.assertEqual(first.view().tobytes(), "ilk gövde ğüş".encode('utf-8'))
+
+        # Eşleme kurulduktan sonra dosya büyür
+        second = self.store.append("ikinci")
+        self.store.sync()
+        self.store._cache.clear()
+        self.assertEqual(second.load(), "ikinci")
+        self.assertEqual(first.load(), "ilk gövde ğüş")
+
+    def test_view_is_zero_copy(self):
+        """view'in eşlenmiş dosyayı kopyalamadan döndürmesi testi"""
+        ref = self.store.append("x" * 100)
+        view = ref.view()
+        self.assertIsInstance(view, memoryview)
+        self.assertTrue(view.readonly)
+        self.assertEqual(len(view), 100)
+        view.release()
+
+    def test_preview_and_cache_budget(self):
+        """Büyük gövdelerin önbelleğe alınmaması ve önizlemenin kısmi çözülmesi testi"""
+        big = self.store.append("ş" * 5000)
+        self.store._cache.clear()
+        self.assertEqual(big.preview(3), "şşş")
+        self.assertNotIn(big.offset, self.store._cache)
+
+        self.assertEqual(len(big.load()), 5000)
+        self.assertNotIn(big.offset, self.store._cache)
+
+        small = self.store.append("küçük")
+        self.assertIn(small.offset, self.store._cache)
+
+    def test_model_preview_uses_store(self):
+        """Model önizlemesinin diskteki gövdeyle çalışması testi"""
+        example = Example(name="Log")
+        attach_content_ref(example, self.store.append("satır\n" * 50))
+        self.assertEqual(example.get_content_preview(5), "satır...")
+        self.assertEqual(example.content, "satır\n" * 50)
+
+        example.content = "yeni"
+        self.assertIsNone(example._content_ref)
+        self.assertEqual(example.get_content_preview(5), "yeni")
+
+    def test_identical_bodies_stored_once(self):
+        """Aynı gövdenin dosyaya bir kez yazılması testi (yeniden açınca da)"""
+        first = self.store.append("ortak gövde")
+        self.assertIs(self.store.append("ortak gövde"), first)
+        self.store.sync()
+        size = self.store.path.stat().st_size
+
+        reopened = ContentStore(self.store.path)
+        try:
+            ref = reopened.append("ortak gövde")
+            self.assertEqual((ref.offset, ref.length), (first.offset, first.length))
+            self.assertEqual(self.store.path.stat().st_size, size)
+        finally:
+            reopened.close()
+
+    def test_compact_moves_to_new_file(self):
+        """compact ile kullanılan gövdelerin tekilleştirilip yeni dosyaya taşınması testi"""
+        library = Library()
+        topic = Topic(title="Konu", content="konu gövdesi")
+        library.add_topic(topic)
+        for _ in range(3):
+            topic.add_example(Example(name="Kopya", content="aynı kod"))
+        # Eski dosyada kullanılmayan bir gövde ve kopyalar ayrı ayrı duruyor
+        self.store.append("artık kullanılmıyor")
+        for node in [topic] + topic.examples:
+            attach_content_ref(node, self.store.ref(*self._raw_append(node.content)))
+
+        new_path = Path(self.temp_dir.name) / "library.new.content"
+        self.assertEqual(self.store.compact(library, new_path), 2)
+        self.assertEqual(self.store.path, new_path)
+        self.assertEqual(new_path.stat().st_size, len("konu gövdesi".encode('utf-8') + "aynı kod".encode('utf-8')))
+        self.assertEqual([e.content for e in topic.examples], ["aynı kod"] * 3)
+        self.assertEqual(topic.content, "konu gövdesi")
+
+    def _raw_append(self, text):
+        """Tekilleştirmeyi atlayarak gövdeyi dosyanın sonuna yazar"""
+        data = text.encode('utf-8')
+        with open(self.store.path, 'ab') as file:
+            offset = file.tell()
+            file.write(data)
+        return offset, len(data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,647 @@
+"""
+Veri servisleri için testler
+"""
+
+import gzip
+import os
+import sqlite3
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+# Test için proje root'unu path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.models.library_models import Topic, Example
+from src.services.compression import zstd_available
+from src.services.data_service import DataService
+from src.services.sqlite_data_service import SQLiteDataService
+
+
+class TestDataService(unittest.TestCase):
+    """JSON tabanlı DataService testleri"""
+    
+    def setUp(self):
+        """Test öncesi hazırlık"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_path = Path(self.temp_dir.name) / "library.json"
+        self.service = DataService(str(self.data_path))
+    
+    def tearDown(self):
+        """Test sonrası temizlik"""
+        self.temp_dir.cleanup()
+    
+    def test_save_skipped_without_changes(self):
+        """Değişiklik yokken kaydetmenin dosyaya dokunmaması testi"""
+        library = self.service.load_library()
+        backups = self.service._backups
+        self.assertFalse(self.service.has_unsaved_changes())
+        
+        # Değişiklik yok: ne yedek ne de yazma yapılmalı
+        self.data_path.write_text("dokunulmadı", encoding='utf-8')
+        self.assertTrue(self.service.save_library())
+        self.assertEqual(self.data_path.read_text(encoding='utf-8'), "dokunulmadı")
+        self.assertEqual(backups.list_backups(), [])
+        
+        # Yapısal değişiklik otomatik olarak işaretlenir
+        library.topics[0].add_child(Topic(title="Yeni"))
+        self.assertTrue(self.service.has_unsaved_changes())
+        self.assertTrue(self.service.save_library())
+        self.assertFalse(self.service.has_unsaved_changes())
+        self.assertEqual(len(backups.list_backups()), 1)
+        
+        # Alan değişikliği mark_dirty ile işaretlenir
+        library.topics[0].title = "Değişti"
+        library.mark_dirty()
+        self.assertTrue(self.service.save_library())
+        reloaded = DataService(str(self.data_path)).load_library()
+        self.assertEqual(reloaded.topics[0].title, "Değişti")
+    
+    def test_snapshot_write(self):
+        """Anlık görüntünün sonradan yapılan değişikliklerden etkilenmemesi testi"""
+        library = self.service.load_library()
+        library.topics[0].title = "Görüntüdeki"
+        library.mark_dirty()
+        snapshot = self.service.create_snapshot()
+        
+        # Görüntü alındıktan sonraki değişiklik yazılmamalı ve kirli kalmalı
+        library.topics[0].title = "Sonraki"
+        library.mark_dirty()
+        self.assertTrue(self.service.write_snapshot(snapshot))
+        self.assertTrue(self.service.has_unsaved_changes())
+        
+        reloaded = DataService(str(self.data_path)).load_library()
+        self.assertEqual(reloaded.topics[0].title, "Görüntüdeki")
+    
+    def test_snapshot_refreezes_only_changed_path(self):
+        """Görüntüde yalnızca değişen konu ve üst konularının yeniden alınması testi"""
+        library = self.service.load_library()
+        library.add_topic(Topic(title="Diğer"))
+        self.service.create_snapshot()
+        
+        root, other = library.topics
+        basics = root.children[0].children[0]
+        sibling = basics.children[1]
+        frozen_other, frozen_sibling = other._frozen, sibling._frozen
+        self.assertIsNotNone(frozen_other)
+        
+        basics.children[0].title = "Güncel"
+        self.service.record_change('update_topic', id=basics.children[0].id,
+                                   fields={'title': "Güncel"})
+        self.assertIsNone(root._frozen)
+        self.assertIs(other._frozen, frozen_other)
+        
+        snapshot = self.service.create_snapshot()
+        self.assertIs(other._frozen, frozen_other)
+        self.assertIs(sibling._frozen, frozen_sibling)
+        self.assertTrue(self.service.write_snapshot(snapshot))
+        reloaded = DataService(str(self.data_path)).load_library()
+        self.assertEqual(reloaded.to_dict(), library.to_dict())
+    
+    def test_new_file_mode(self):
+        """İlk kez oluşturulan dosyanın 0o644, mevcut dosyanın kendi izinleriyle yazılması testi"""
+        if os.name != 'posix':
+            self.skipTest("POSIX izinleri gerekli")
+        self.service.load_library()
+        self.assertEqual(self.data_path.stat().st_mode & 0o777, 0o644)
+        
+        os.chmod(self.data_path, 0o600)
+        self.assertTrue(self.service.save_library(force=True))
+        self.assertEqual(self.data_path.stat().st_mode & 0o777, 0o600)
+    
+    def test_failed_write_keeps_original(self):
+        """Yarıda kalan yazmanın mevcut dosyayı bozmaması testi"""
+        self.service.load_library()
+        original = self.data_path.read_text(encoding='utf-8')
+        
+        def failing_write(file):
+            file.write('{"yarım": ')
+            raise IOError("disk dolu")
+        
+        with self.assertRaises(IOError):
+            self.service._write_atomic(self.data_path, failing_write)
+        
+        self.assertEqual(self.data_path.read_text(encoding='utf-8'), original)
+        self.assertEqual(list(Path(self.temp_dir.name).glob("*.tmp")), [])
+
+
+class TestCompressedFiles(unittest.TestCase):
+    """Sıkıştırılmış kütüphane dosyası testleri"""
+    
+    def setUp(self):
+        """Test öncesi hazırlık"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.dir = Path(self.temp_dir.name)
+    
+    def tearDown(self):
+        """Test sonrası temizlik"""
+        self.temp_dir.cleanup()
+    
+    def test_gzip_main_store(self):
+        """Ana dosyanın .json.gz olarak yazılıp okunması testi"""
+        data_path = self.dir / "library.json.gz"
+        service = DataService(str(data_path), json_indent=None)
+        library = service.load_library()
+        library.topics[0].title = "Sıkıştırılmış"
+        library.mark_dirty()
+        self.assertTrue(service.save_library())
+        service.close()
+        
+        with gzip.open(data_path, 'rt', encoding='utf-8') as file:
+            text = file.read()
+        self.assertNotIn('\n', text)
+        self.assertEqual([p.name[-8:] for p in service._backups.list_backups()], [".json.gz"])
+        
+        reloaded = DataService(str(data_path), binary_cache=False).load_library()
+        self.assertEqual(reloaded.to_dict(), library.to_dict())
+    
+    def test_export_import_compressed(self):
+        """Girintisiz/sıkıştırılmış dışa aktarımın içe aktarılabilmesi testi"""
+        service = DataService(str(self.dir / "library.json"))
+        expected = service.load_library().to_dict()
+        plain_path = self.dir / "export.json"
+        compact_path = self.dir / "export.json.gz"
+        self.assertTrue(service.export_to_file(str(plain_path)))
+        self.assertTrue(service.export_to_file(str(compact_path), indent=None))
+        self.assertLess(compact_path.stat().st_size, plain_path.stat().st_size / 3)
+        
+        # Biçim uzantıdan değil içerikten anlaşılır
+        renamed = compact_path.rename(self.dir / "export-gz.json")
+        other = DataService(str(self.dir / "other.json"))
+        self.assertTrue(other.import_from_file(str(renamed)))
+        self.assertEqual(other.get_library().to_dict(), expected)
+    
+    @unittest.skipUnless(zstd_available(), "zstandard kurulu değil")
+    def test_zstd_export(self):
+        """zstd ile dışa aktarım testi"""
+        service = DataService(str(self.dir / "library.json"))
+        expected = service.load_library().to_dict()
+        path = self.dir / "export.json.zst"
+        self.assertTrue(service.export_to_file(str(path), indent=None))
+        self.assertTrue(service.import_from_file(str(path)))
+        self.assertEqual(service.get_library().to_dict(), expected)
+
+
+class TestJournal(unittest.TestCase):
+    """Düzenleme günlüğü testleri"""
+    
+    def setUp(self):
+        """Test öncesi hazırlık"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_path = Path(self.temp_dir.name) / "library.json"
+        self.service = DataService(str(self.data_path))
+        self.library = self.service.load_library()
+    
+    def tearDown(self):
+        """Test sonrası temizlik"""
+        self.service.close()
+        self.temp_dir.cleanup()
+    
+    def _reload(self):
+        """Aynı dosyayı yeni bir servisle açar"""
+        self.service.close()
+        self.service = DataService(str(self.data_path))
+        return self.service.load_library()
+    
+    def test_changes_replayed_without_full_save(self):
+        """Tam kayıt yapılmadan günlükteki düzenlemelerin geri yüklenmesi testi"""
+        snapshot_text = self.data_path.read_text(encoding='utf-8')
+        parent = self.library.topics[0]
+        new_topic = Topic(title="Günlükteki")
+        parent.add_child(new_topic)
+        self.service.record_change('add_topic', topic=new_topic.to_dict(), parent_id=parent.id,
+                                   updated_at=parent.updated_at.isoformat())
+        parent.content = "Yeni içerik"
+        self.service.record_change('update_topic', id=parent.id, fields={'content': "Yeni içerik"})
+        example = Example(name="Örnek", content="print(1)")
+        new_topic.add_example(example)
+        self.service.record_change('add_example', topic_id=new_topic.id, example=example.to_dict(),
+                                   updated_at=new_topic.updated_at.isoformat())
+        
+        # Günlüğe yazılan değişiklik kaydedilmiş sayılır, tam kayıt dokunulmadan kalır
+        self.assertFalse(self.service.has_unsaved_changes())
+        self.assertEqual(self.data_path.read_text(encoding='utf-8'), snapshot_text)
+        
+        loaded = self._reload()
+        self.assertEqual(loaded.to_dict(), self.library.to_dict())
+        self.assertEqual(loaded.find_example_by_id(example.id).content, "print(1)")
+        self.assertEqual(loaded.find_topic_by_id(new_topic.id).parent.id, parent.id)
+    
+    def test_compaction_clears_journal(self):
+        """Tam kaydın günlüğü boşaltması testi"""
+        topic = self.library.topics[0]
+        topic.title = "Değişti"
+        self.service.record_change('update_topic', id=topic.id, fields={'title': "Değişti"})
+        journal_path = self.data_path.with_suffix('.journal')
+        self.assertGreater(journal_path.stat().st_size, 0)
+        
+        self.service.COMPACTION_THRESHOLD = 1
+        self.assertTrue(self.service.needs_compaction())
+        self.assertTrue(self.service.save_library())
+        self.assertFalse(self.service.needs_compaction())
+        self.assertEqual(self.service._journal.size(), 0)
+        
+        loaded = self._reload()
+        self.assertEqual(loaded.topics[0].title, "Değişti")
+    
+    def test_interrupted_compaction_is_replayed(self):
+        """Yarıda kalan tam kayıttan sonra döndürülmüş günlüğün tekrar oynatılması testi"""
+        topic = self.library.topics[0]
+        child = topic.children[0]
+        topic.remove_child(child.id)
+        self.service.record_change('delete_topic', id=child.id,
+                                   updated_at=topic.updated_at.isoformat())
+        
+        # Görüntü alındı (günlük döndürüldü) ama yazılmadı
+        self.service.create_snapshot()
+        topic.title = "Sonra"
+        self.service.record_change('update_topic', id=topic.id, fields={'title': "Sonra"})
+        
+        loaded = self._reload()
+        self.assertEqual(loaded.topics[0].title, "Sonra")
+        self.assertIsNone(loaded.find_topic_by_id(child.id))
+        
+        # Tekrar oynatma idempotent: ikinci yükleme de aynı sonucu verir
+        self.assertEqual(self._reload().to_dict(), loaded.to_dict())
+    
+    def test_crash_before_discarding_rotated_journal(self):
+        """Tam kayıt yazılıp döndürülmüş günlük silinemeden çökülmesi testi"""
+        parent = self.library.topics[0].children[0]
+        grandparent = parent.parent
+        child = Topic(title="Silinen üstün çocuğu")
+        parent.add_child(child)
+        self.service.record_change('add_topic', topic=child.to_dict(), parent_id=parent.id,
+                                   updated_at=parent.updated_at.isoformat())
+        grandparent.remove_child(parent.id)
+        self.service.record_change('delete_topic', id=parent.id, parent_id=grandparent.id,
+                                   updated_at=grandparent.updated_at.isoformat())
+        
+        # library.json silmeyi içeriyor ama döndürülmüş günlük yerinde kaldı
+        self.service._journal.discard_rotated = lambda: None
+        self.assertTrue(self.service.save_library())
+        self.assertTrue(self.service._journal.rotated_path.exists())
+        
+        loaded = self._reload()
+        self.assertIsNone(loaded.find_topic_by_id(child.id))
+        self.assertIsNone(loaded.find_topic_by_id(parent.id))
+        self.assertEqual(loaded.to_dict(), self.library.to_dict())
+    
+    def test_invalid_records_are_skipped(self):
+        """Uygulanamayan günlük kayıtlarının dosyayı yedeğe aldırmaması testi"""
+        topic = self.library.topics[0]
+        topic.title = "Korunan"
+        self.service.record_change('update_topic', id=topic.id, fields={'title': "Korunan"})
+        self.service.close()
+        with open(self.data_path.with_suffix('.journal'), 'ab') as journal:
+            journal.write(b'{"op": "update_topic", "id": "%s"}\n' % topic.id.encode())
+            journal.write(b'[1, 2]\n')
+            journal.write(b'{"op": "delete_topic", "id": "x", "updated_at": "d\xfcn"}\n')
+            journal.write(b'{"op": "update_topic", "id": "%s", '
+                          b'"fields": {"updated_at": "bozuk"}}\n' % topic.id.encode())
+        
+        loaded = self._reload()
+        self.assertEqual(loaded.topics[0].title, "Korunan")
+        self.assertFalse(self.data_path.with_name("library.json.backup").exists())
+    
+    def test_unreadable_journal_is_kept(self):
+        """Oynatılamayan günlüğün tam kayıtla silinmemesi testi"""
+        topic = self.library.topics[0]
+        topic.title = "Günlükte"
+        self.service.record_change('update_topic', id=topic.id, fields={'title': "Günlükte"})
+        self.service.close()
+        
+        self.service = DataService(str(self.data_path))
+        with mock.patch.object(self.service._journal, 'read_records', side_effect=OSError("okunamadı")):
+            library = self.service.load_library()
+        self.assertNotEqual(library.topics[0].title, "Günlükte")
+        child = library.topics[0].children[0]
+        child.title = "Sonraki"
+        self.service.record_change('update_topic', id=child.id, fields={'title': "Sonraki"})
+        self.service.COMPACTION_THRESHOLD = 1
+        self.assertFalse(self.service.needs_compaction())
+        self.assertTrue(self.service.save_library(force=True))
+        
+        loaded = self._reload()
+        self.assertEqual(loaded.topics[0].title, "Günlükte")
+        self.assertEqual(loaded.topics[0].children[0].title, "Sonraki")
+
+
+class TestLazyContent(unittest.TestCase):
+    """Tembel içerik yükleme testleri"""
+    
+    def setUp(self):
+        """Test öncesi hazırlık"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_path = Path(self.temp_dir.name) / "library.json"
+        self.service = DataService(str(self.data_path), lazy_content=True)
+        self.library = self.service.load_library()
+        self.expected = self.library.to_dict()
+    
+    def tearDown(self):
+        """Test sonrası temizlik"""
+        self.service.close()
+        self.temp_dir.cleanup()
+    
+    def _reload(self, lazy_content=True):
+        """Aynı dosyayı yeni bir servisle açar"""
+        self.service.close()
+        self.service = DataService(str(self.data_path), lazy_content=lazy_content)
+        return self.service.load_library()
+    
+    def test_bodies_stay_on_disk(self):
+        """Gövdelerin library.json yerine içerik dosyasında tutulması testi"""
+        self.assertNotIn('"content":', self.data_path.read_text(encoding='utf-8').replace('"content": ""', ''))
+        
+        loaded = self._reload()
+        topic = loaded.topics[0]
+        self.assertIsNotNone(topic._content_ref)
+        self.assertEqual(topic._content, "")
+        self.assertEqual(loaded.to_dict(), self.expected)
+    
+    def test_edited_body_is_appended(self):
+        """Değişen gövdenin kaydedilip tekrar okunması testi"""
+        example = next(iter(self.library._example_index.values()))
+        size_before = self.data_path.with_suffix('.content').stat().st_size
+        example.content = "print('yeni')"
+        self.assertIsNone(example._content_ref)
+        self.library.mark_dirty()
+        self.assertTrue(self.service.save_library())
+        self.assertIsNotNone(example._content_ref)
+        self.assertGreater(self.data_path.with_suffix('.content').stat().st_size, size_before)
+        
+        loaded = self._reload()
+        self.assertEqual(loaded.find_example_by_id(example.id).content, "print('yeni')")
+    
+    def test_bodies_written_by_snapshot_writer(self):
+        """Görüntü alınırken gövdelerin diske yazılmayıp kayıt thread'ine bırakılması testi"""
+        content_path = self.data_path.with_suffix('.content')
+        topic = self.library.topics[0].children[0].children[0].children[0]
+        first, second = topic.examples
+        for example, text in ((first, "print('bir')"), (second, "print('iki')")):
+            example.content = text
+            self.service.record_change('update_example', topic_id=topic.id,
+                                       id=example.id, fields={'content': text})
+        size_before = content_path.stat().st_size
+        
+        snapshot = self.service.create_snapshot()
+        self.assertEqual(content_path.stat().st_size, size_before)
+        self.assertTrue(self.service.write_snapshot(snapshot))
+        self.assertGreater(content_path.stat().st_size, size_before)
+        self.assertIsNone(first._content_ref)
+        
+        # Referanslar sonraki görüntüde bağlanır; arada değişen gövde bellekte kalır
+        second.content = "print('üç')"
+        self.service.record_change('update_example', topic_id=topic.id,
+                                   id=second.id, fields={'content': "print('üç')"})
+        self.assertTrue(self.service.write_snapshot(self.service.create_snapshot()))
+        self.assertIsNotNone(first._content_ref)
+        self.assertEqual(first._content, "")
+        self.assertIsNone(second._content_ref)
+        
+        loaded = self._reload()
+        self.assertEqual(loaded.find_example_by_id(first.id).content, "print('bir')")
+        self.assertEqual(loaded.find_example_by_id(second.id).content, "print('üç')")
+    
+    def test_switching_back_inlines_bodies(self):
+        """Tembel mod kapatılınca gövdelerin tekrar JSON'a yazılması testi"""
+        loaded = self._reload(lazy_content=False)
+        loaded.mark_dirty()
+        self.assertTrue(self.service.save_library())
+        self.data_path.with_suffix('.content').unlink()
+        
+        self.assertEqual(self._reload(lazy_content=False).to_dict(), self.expected)
+    
+    def test_dedup_content(self):
+        """dedup ile kopya gövdelerin birleştirilip eski dosyanın silinmesi testi"""
+        topic = self.library.topics[0]
+        body = "tekrarlanan uzun log satırı\n" * 100
+        for i in range(5):
+            topic.add_example(Example(name=f"Kopya {i}", content=body))
+        # Eski dosyada her kopya ayrı yazılmış olsun
+        old_store = self.service._content_store
+        for example in topic.examples[-5:]:
+            example._content_ref = old_store.ref(*self._raw_append(old_store.path, body))
+            example._content = ""
+        self.assertTrue(self.service.save_library(force=True))
+        old_path = old_store.path
+        old_size = old_path.stat().st_size
+        expected = self.library.to_dict()
+        
+        self.assertEqual(self.service.dedup_content(), 4)
+        new_path = self.service._content_store.path
+        self.assertNotEqual(new_path, old_path)
+        self.assertFalse(old_path.exists())
+        self.assertLess(new_path.stat().st_size, old_size - 3 * len(body))
+        
+        loaded = self._reload()
+        self.assertEqual(loaded.to_dict(), expected)
+        refs = {(e._content_ref.offset, e._content_ref.length) for e in loaded.topics[0].examples[-5:]}
+        self.assertEqual(len(refs), 1)
+    
+    def _raw_append(self, path, text):
+        """Tekilleştirmeyi atlayarak gövdeyi içerik dosyasının sonuna yazar"""
+        data = text.encode('utf-8')
+        with open(path, 'ab') as file:
+            offset = file.tell()
+            file.write(data)
+        return offset, len(data)
+
+
+class TestBinaryCache(unittest.TestCase):
+    """İkili başlangıç önbelleği testleri"""
+    
+    def setUp(self):
+        """Test öncesi hazırlık"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_path = Path(self.temp_dir.name) / "library.json"
+        self.cache_path = self.data_path.with_suffix('.cache')
+        self.service = DataService(str(self.data_path))
+        self.library = self.service.load_library()
+    
+    def tearDown(self):
+        """Test sonrası temizlik"""
+        self.service.close()
+        self.temp_dir.cleanup()
+    
+    def _reload(self):
+        """Aynı dosyayı yeni bir servisle açar"""
+        self.service.close()
+        self.service = DataService(str(self.data_path))
+        return self.service.load_library()
+    
+    def test_cache_used_while_json_unchanged(self):
+        """JSON değişmediyse açılışta önbelleğin okunması testi"""
+        expected = self.library.to_dict()
+        self.service.close()
+        self.assertTrue(self.cache_path.exists())
+        
+        # Aynı boyut ve mtime ile değiştirilen JSON önbellek sayesinde okunmaz
+        stat = self.data_path.stat()
+        text = self.data_path.read_text(encoding='utf-8')
+        self.data_path.write_text(text.replace(expected['name'], expected['name'][::-1]), encoding='utf-8')
+        os.utime(self.data_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(self._reload().to_dict(), expected)
+    
+    def test_stale_cache_ignored(self):
+        """Kapanıştan sonra yazılan JSON'un önbelleğe tercih edilmesi testi"""
+        self.service.close()
+        other = DataService(str(self.data_path), binary_cache=False)
+        other.load_library().topics[0].title = "Başka süreçte değişti"
+        other.load_library().mark_dirty()
+        self.assertTrue(other.save_library())
+        
+        self.assertEqual(self._reload().topics[0].title, "Başka süreçte değişti")
+    
+    def test_not_written_with_unsaved_changes(self):
+        """Model JSON'dan ilerideyken önbellek yazılmaması testi"""
+        self.library.topics[0].add_child(Topic(title="Günlükte"))
+        self.service.record_change('add_topic')
+        self.assertFalse(self.service.write_binary_cache())
+        self.assertTrue(self.service.save_library())
+        self.assertTrue(self.service.write_binary_cache())
+        
+        loaded = self._reload()
+        self.assertEqual(loaded.to_dict(), self.library.to_dict())
+
+
+class TestSQLiteDataService(unittest.TestCase):
+    """SQLiteDataService testleri"""
+    
+    def setUp(self):
+        """Test öncesi hazırlık"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.temp_dir.name) / "library.db"
+        self.service = SQLiteDataService(str(self.db_path))
+    
+    def tearDown(self):
+        """Test sonrası temizlik"""
+        self.service.close()
+        self.temp_dir.cleanup()
+    
+    def _reload(self):
+        """Aynı veritabanını yeni bir servisle açar"""
+        self.service.close()
+        self.service = SQLiteDataService(str(self.db_path))
+        return self.service.load_library()
+    
+    def test_round_trip(self):
+        """Kaydet/yükle sonrası hiyerarşinin korunması testi"""
+        library = self.service.load_library()
+        original = library.to_dict()
+        
+        loaded = self._reload()
+        self.assertEqual(loaded.to_dict(), original)
+        
+        # Hiyerarşi ve indeks kurulmuş olmalı
+        leaf = loaded.topics[0].children[0].children[0].children[0]
+        self.assertEqual(leaf.get_depth(), 3)
+        self.assertIs(loaded.find_topic_by_id(leaf.id), leaf)
+    
+    def test_only_changed_rows_are_written(self):
+        """Yalnızca record_change ile bildirilen satırların yazılması testi"""
+        library = self.service.load_library()
+        connection = self.service._connection
+        
+        # Değişiklik yoksa hiçbir satır yazılmamalı
+        before = connection.total_changes
+        self.assertTrue(self.service.save_library())
+        self.assertEqual(connection.total_changes, before)
+        
+        # Tek konu değişince tek satır yazılmalı
+        topic = library.topics[0]
+        topic.content = "Güncellendi"
+        self.service.record_change('update_topic', id=topic.id, fields={'content': topic.content})
+        before = connection.total_changes
+        self.assertTrue(self.service.save_library())
+        self.assertEqual(connection.total_changes - before, 1)
+        
+        # Yeni konu + örnek ekleme, ortadaki kardeşi silip sona yeni konu ekleme
+        new_topic = Topic(title="Yeni")
+        new_topic.add_example(Example(name="Örnek", content="x = 1"))
+        library.add_topic(new_topic)
+        self.service.record_change('add_topic', topic=new_topic.to_dict(), parent_id=None)
+        basics = topic.children[0].children[0]
+        removed_id = basics.children[0].id
+        basics.remove_child(removed_id)
+        self.service.record_change('delete_topic', id=removed_id, parent_id=basics.id)
+        last = Topic(title="Son")
+        basics.add_child(last)
+        self.service.record_change('add_topic', topic=last.to_dict(), parent_id=basics.id)
+        example = basics.children[0].examples[0]
+        example.name = "Yeniden adlandırıldı"
+        self.service.record_change('update_example', id=example.id, fields={'name': example.name})
+        self.assertTrue(self.service.save_library())
+        
+        loaded = self._reload()
+        self.assertEqual(loaded.to_dict(), library.to_dict())
+        self.assertEqual(loaded.topics[0].content, "Güncellendi")
+        self.assertEqual(loaded.topics[1].examples[0].content, "x = 1")
+        self.assertEqual([child.title for child in loaded.topics[0].children[0].children[0].children],
+                         ["Kontrol Yapıları", "Son"])
+        # Silinen konunun örnekleri de silinmeli
+        count = self.service._connection.execute("SELECT COUNT(*) FROM examples").fetchone()[0]
+        self.assertEqual(count, 2)
+    
+    def test_untracked_change_rewrites_all_rows(self):
+        """record_change dışındaki değişikliklerde tüm satırların yeniden yazılması testi"""
+        library = self.service.load_library()
+        library.topics[0].title = "Doğrudan"
+        library.mark_dirty()
+        self.assertTrue(self.service.save_library())
+        library = self._reload()
+        self.assertEqual(library.topics[0].title, "Doğrudan")
+        
+        # Bilinmeyen işlemden sonra gelen bildirim tam yazmayı engellememeli
+        child = library.topics[0].children[0]
+        child.content = "Bilinmeyen"
+        self.service.record_change('reorder_topics', id=child.id)
+        library.topics[0].title = "Bildirilen"
+        self.service.record_change('update_topic', id=library.topics[0].id,
+                                   fields={'title': "Bildirilen"})
+        self.assertTrue(self.service.save_library())
+        reloaded = self._reload()
+        self.assertEqual((reloaded.topics[0].title, reloaded.topics[0].children[0].content),
+                         ("Bildirilen", "Bilinmeyen"))
+    
+    def test_unreadable_rows_are_backed_up(self):
+        """Okunamayan satırlarda veritabanının yedeklenip ezilmemesi testi"""
+        library = self.service.load_library()
+        library.topics[0].title = "Kullanıcı"
+        self.service.record_change('update_topic', id=library.topics[0].id,
+                                   fields={'title': "Kullanıcı"})
+        self.assertTrue(self.service.save_library())
+        topic_id = library.topics[0].id
+        self.service.close()
+        connection = sqlite3.connect(str(self.db_path))
+        with connection:
+            connection.execute("UPDATE topics SET tags = '[not json' WHERE id = ?", (topic_id,))
+        connection.close()
+        
+        self.service = SQLiteDataService(str(self.db_path))
+        self.service.load_library()
+        backup = sqlite3.connect(str(self.db_path.with_name("library.db.backup")))
+        try:
+            rows = backup.execute("SELECT title, tags FROM topics WHERE id = ?", (topic_id,)).fetchall()
+        finally:
+            backup.close()
+        self.assertEqual(rows, [("Kullanıcı", '[not json')])
+    
+    def test_export_and_import(self):
+        """JSON dışa/içe aktarma testi"""
+        self.service.load_library()
+        export_path = Path(self.temp_dir.name) / "export.json"
+        self.assertTrue(self.service.export_to_file(str(export_path)))
+        
+        other = SQLiteDataService(str(Path(self.temp_dir.name) / "other.db"))
+        try:
+            self.assertTrue(other.import_from_file(str(export_path)))
+            self.assertEqual(other.get_library().to_dict(), self.service.get_library().to_dict())
+        finally:
+            other.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
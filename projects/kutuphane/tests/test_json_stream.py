@@ -0,0 +1,138 @@
+"""
+Akış tabanlı JSON okuma/yazma testleri
+"""
+
+import io
+import json
+import unittest
+import sys
+from pathlib import Path
+
+# Test için proje root'unu path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.models.library_models import Library, Topic, Example
+from src.services.json_stream import (
+    FrozenList, dump_frozen_library, dump_library_stream, freeze_library, freeze_topic,
+    load_library_stream,
+)
+
+
+class TestLoadLibraryStream(unittest.TestCase):
+    """load_library_stream testleri"""
+
+    def setUp(self):
+        """Test öncesi hazırlık"""
+        self.library = Library(name="Akış Testi", description="Çok \"satırlı\"\naçıklama")
+        for i in range(5):
+            topic = Topic(title=f"Konu {i}", content="İçerik " * 50, tags=["a", "b"])
+            child = Topic(title=f"Alt {i}", is_expanded=True)
+            child.add_example(Example(name="Örnek", content="print('{x}')\n" * 20, language="python"))
+            topic.add_child(child)
+            self.library.add_topic(topic)
+        self.text = json.dumps(self.library.to_dict(), indent=2, ensure_ascii=False)
+
+    def test_matches_from_dict(self):
+        """Küçük parçalarla okunan sonucun json.load + from_dict ile aynı olması testi"""
+        expected = Library.from_dict(json.loads(self.text))
+        for chunk_size in (1, 7, 64, 1 << 16):
+            loaded = load_library_stream(io.StringIO(self.text), chunk_size=chunk_size)
+            self.assertEqual(loaded.to_dict(), expected.to_dict())
+
+        # Hiyerarşi ve indeks kurulmuş olmalı
+        child = loaded.topics[2].children[0]
+        self.assertIs(child.parent, loaded.topics[2])
+        self.assertIs(loaded.find_topic_by_id(child.id), child)
+        self.assertIs(loaded.find_example_by_id(child.examples[0].id), child.examples[0])
+
+    def test_on_topic_called_during_parse(self):
+        """Ana konuların dosya bitmeden bildirilmesi testi"""
+        stream = io.StringIO(self.text)
+        positions = []
+        load_library_stream(stream, on_topic=lambda topic: positions.append(stream.tell()),
+                            chunk_size=256)
+
+        self.assertEqual(len(positions), 5)
+        self.assertLess(positions[0], len(self.text.encode('utf-8')))
+
+    def test_node_type_follows_container(self):
+        """Düğüm türünün anahtarlardan değil bulunduğu listeden belirlenmesi testi"""
+        text = json.dumps({'name': "K", 'topics': [
+            {'id': "yalın"},
+            {'id': "dolu", 'title': "Konu",
+             'children': [{'id': "alt", 'name': "başlıksız"}],
+             'examples': [{'id': "örnek", 'title': "başlıklı örnek", 'language': "python"}]},
+        ]})
+        library = load_library_stream(io.StringIO(text), chunk_size=16)
+
+        self.assertEqual([topic.id for topic in library.topics], ["yalın", "dolu"])
+        self.assertIsInstance(library.find_topic_by_id("alt"), Topic)
+        self.assertIs(library.find_topic_by_id("alt").parent, library.topics[1])
+        self.assertEqual(library.find_example_by_id("örnek").language, "python")
+
+    def test_invalid_json_raises(self):
+        """Bozuk/yarım dosyada hata verilmesi testi"""
+        for text in (self.text[:len(self.text) // 2], '{"topics": [1]}', self.text + "{}"):
+            with self.assertRaises(json.JSONDecodeError):
+                load_library_stream(io.StringIO(text), chunk_size=64)
+
+
+class TestDumpLibraryStream(unittest.TestCase):
+    """dump_library_stream testleri"""
+
+    def test_matches_json_dump(self):
+        """Çıktının json.dump(to_dict()) ile birebir aynı olması testi"""
+        library = Library(name="Yazma \"Testi\"", description="")
+        empty = Topic(title="Boş")
+        full = Topic(title="Dolu\tkonu", content="Satır 1\nSatır 2 ğüşı", tags=["x", "ÿ"])
+        full.add_example(Example(name="Örnek", content="</script>\\", language="python"))
+        full.add_child(Topic(title="Alt"))
+        library.add_topic(empty)
+        library.add_topic(full)
+
+        for indent in (2, None, 4):
+            stream = io.StringIO()
+            dump_library_stream(library, stream, indent=indent)
+            expected = json.dumps(library.to_dict(), indent=indent, ensure_ascii=False)
+            self.assertEqual(stream.getvalue(), expected)
+
+        # Boş kütüphane
+        stream = io.StringIO()
+        dump_library_stream(Library(), stream)
+        self.assertEqual(json.loads(stream.getvalue())['topics'], [])
+
+    def test_frozen_snapshot_matches_stream(self):
+        """Dondurulmuş görüntünün aynı çıktıyı vermesi ve modelden bağımsız olması testi"""
+        library = Library(name="Görüntü")
+        topic = Topic(title="Konu", content="Gövde", tags=["a"], created_at="2024-01-02T03:04:05")
+        topic.add_example(Example(name="Örnek", content="x = 1", language="python"))
+        topic.add_child(Topic(title="Alt", is_expanded=True))
+        library.add_topic(topic)
+        library.add_topic(Topic(title="Boş"))
+
+        def freeze(node):
+            return freeze_topic(node, FrozenList(freeze(child) for child in node.children))
+        frozen = freeze_library(library, FrozenList(freeze(node) for node in library.topics))
+
+        for indent in (2, None):
+            expected = io.StringIO()
+            dump_library_stream(library, expected, indent=indent)
+            stream = io.StringIO()
+            dump_frozen_library(frozen, stream, indent=indent)
+            self.assertEqual(stream.getvalue(), expected.getvalue())
+
+        # Görüntü alındıktan sonraki değişiklikler yazılanı etkilemez
+        before = io.StringIO()
+        dump_frozen_library(frozen, before)
+        topic.title = "Değişti"
+        topic.tags.append("b")
+        topic.examples[0].content = "x = 2"
+        topic.add_child(Topic(title="Yeni"))
+        after = io.StringIO()
+        dump_frozen_library(frozen, after)
+        self.assertEqual(after.getvalue(), before.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
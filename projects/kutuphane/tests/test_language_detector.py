@@ -0,0 +1,66 @@
+"""
+Dil tahmini testleri
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Test için proje root'unu path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils import language_detector
+from src.utils.language_detector import LanguageDetector
+from src.utils.render_cache import RenderCache
+
+
+SAMPLES = {
+    'python': "import os\n\ndef f(x):\n    if x:\n        return None\n    elif x > 2:\n        print(x)\n",
+    'javascript': "const x = 1;\nfunction f(a) {\n  return a === 2;\n}\nconsole.log(f(x));\n",
+    'java': "public class Main {\n    public static void main(String[] args) {\n"
+            "        System.out.println(\"merhaba\");\n    }\n}\n",
+    'c++': "#include <iostream>\nint main() {\n    std::cout << \"x\" << std::endl;\n}\n",
+    'sql': "SELECT id, name\nFROM users\nWHERE age > 18\nORDER BY name;\n",
+    'json': '{\n  "name": "x",\n  "items": [1, 2],\n  "ok": true\n}\n',
+    'yaml': "---\nname: app\nservices:\n  - web\n  - db\n",
+}
+
+
+class TestLanguageDetector(unittest.TestCase):
+    """LanguageDetector testleri"""
+
+    def setUp(self):
+        """Test öncesi hazırlık"""
+        self.detector = LanguageDetector(cache=RenderCache())
+
+    def test_hints(self):
+        """İpucu, uzantı, shebang ve kod çitinin içerikten önce gelmesi testi"""
+        python = SAMPLES['python']
+        self.assertEqual(self.detector.detect(python, hint="SQL"), "sql")
+        self.assertEqual(self.detector.detect(python, hint="text", filename="betik.sh"), "bash")
+        self.assertEqual(self.detector.detect("x = 1\n", filename="a.txt"), self.detector.detect("x = 1\n"))
+        self.assertEqual(self.detector.detect("#!/usr/bin/env python3\nx = 1"), "python")
+        self.assertEqual(self.detector.detect("#!/bin/bash\nls"), "bash")
+        self.assertEqual(self.detector.detect("```sql\nselect 1\n```"), "sql")
+        self.assertEqual(self.detector.detect("   \n"), "text")
+
+    def test_classifier(self):
+        """Anahtar kelime sınıflandırıcısının örnekleri doğru tanıması testi"""
+        with mock.patch.object(language_detector, 'guess_lexer') as guess:
+            for language, code in SAMPLES.items():
+                self.assertEqual(self.detector.detect(code), language)
+        guess.assert_not_called()
+
+    def test_fallback_cached(self):
+        """guess_lexer'ın yalnızca son çare olarak ve içerik başına bir kez çağrılması testi"""
+        original = language_detector.guess_lexer
+        with mock.patch.object(language_detector, 'guess_lexer', side_effect=original) as guess:
+            for _ in range(3):
+                self.assertEqual(self.detector.detect("merhaba dünya"), "text")
+        self.assertEqual(guess.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
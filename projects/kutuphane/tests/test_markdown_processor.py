@@ -0,0 +1,74 @@
+"""
+Markdown işleyici testleri
+"""
+
+import unittest
+import sys
+import time
+from pathlib import Path
+
+# Test için proje root'unu path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.markdown_processor import MarkdownProcessor
+
+
+class TestMarkdownProcessor(unittest.TestCase):
+    """MarkdownProcessor testleri"""
+
+    def setUp(self):
+        """Test öncesi hazırlık"""
+        self.processor = MarkdownProcessor()
+
+    def test_html_and_plain_text(self):
+        """Başlık, liste ve satır içi biçimlerin tek taramada çevrilmesi testi"""
+        text = "# Başlık\nMetin **kalın** ve *italik* `kod` [link](http://x)\n\n* öğe **2**"
+        rendered = self.processor.render(text)
+
+        self.assertEqual(
+            rendered.html,
+            '<h1>Başlık</h1><br>Metin <strong>kalın</strong> ve <em>italik</em> '
+            '<code>kod</code> <a href="http://x">link</a><br><li>öğe <strong>2</strong></li>'
+        )
+        self.assertEqual(rendered.plain_text, "Başlık\nMetin kalın ve italik kod link\n\nöğe 2")
+        self.assertEqual(self.processor.to_html(text), rendered.html)
+        self.assertEqual(self.processor.to_plain_text(text), rendered.plain_text)
+        self.assertEqual(self.processor.to_html("a\n\nb"), "<p>a</p><br><p>b</p>")
+
+    def test_code_block_is_literal(self):
+        """Kod bloğu içeriğinin biçimlendirilmemesi testi"""
+        text = "```python\ndef f(*a, **k):\n\n    # yorum\n```"
+        rendered = self.processor.render(text)
+
+        self.assertEqual(
+            rendered.html,
+            '<pre><code class="language-python">def f(*a, **k):<br><br>    # yorum</code></pre>'
+        )
+        self.assertEqual(rendered.plain_text, "def f(*a, **k):\n\n    # yorum")
+
+    def test_unclosed_fence(self):
+        """Kapanmamış kod çitinin düz satır gibi işlenmesi testi"""
+        text = "```python\n" + "satır\n" * 1000 + "**son**"
+        html = self.processor.to_html(text)
+        self.assertNotIn("<pre>", html)
+        self.assertTrue(html.endswith("<strong>son</strong></p>"))
+        self.assertEqual(
+            self.processor.extract_links("[a](b) ve [c](d)"),
+            [{'text': 'a', 'url': 'b'}, {'text': 'c', 'url': 'd'}]
+        )
+
+
+    def test_unclosed_links(self):
+        """Kapanmayan link tekrarlarının doğrusal sürede işlenmesi testi"""
+        for text in ("[a](" * 20000, "[" * 20000):
+            start = time.perf_counter()
+            rendered = self.processor.render(text)
+            self.assertLess(time.perf_counter() - start, 1.0)
+            self.assertEqual(rendered.plain_text, text)
+            self.assertEqual(self.processor.extract_links(text), [])
+        self.assertEqual(self.processor.to_html("[[a](u)"), '<p>[<a href="u">a</a></p>')
+
+
+if __name__ == '__main__':
+    unittest.main()
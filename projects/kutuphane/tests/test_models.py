@@ -5,6 +5,7 @@ Veri modelleri için temel testler
 import unittest
 import sys
 import os
+from datetime import datetime
 from pathlib import Path
 
 # Test için proje root'unu path'e ekle
@@ -59,6 +60,32 @@ class TestLibraryModels(unittest.TestCase):
         self.assertEqual(self.topic.children[0], child_topic)
         self.assertEqual(child_topic.parent_id, self.topic.id)
     
+    def test_parent_links_and_depth(self):
+        """Üst konu referansı, derinlik ve yol testi"""
+        child = Topic(title="Alt Konu")
+        grandchild = Topic(title="Alt Alt Konu")
+        self.library.add_topic(self.topic)
+        self.topic.add_child(child)
+        child.add_child(grandchild)
+        
+        self.assertIsNone(self.topic.parent)
+        self.assertIs(grandchild.parent, child)
+        self.assertEqual(self.topic.get_depth(), 0)
+        self.assertEqual(grandchild.get_depth(), 2)
+        self.assertEqual(
+            [t.title for t in self.library.get_topic_path(grandchild.id)],
+            ["Test Konusu", "Alt Konu", "Alt Alt Konu"]
+        )
+        
+        # Silinen alt konunun üst referansı temizlenmeli
+        child.remove_child(grandchild.id)
+        self.assertIsNone(grandchild.parent)
+        self.assertEqual(grandchild.get_depth(), 0)
+        
+        # from_dict sonrası da referanslar kurulmalı
+        loaded = Library.from_dict(self.library.to_dict())
+        self.assertEqual(loaded.find_topic_by_id(child.id).get_depth(), 1)
+    
     def test_add_example_to_topic(self):
         """Konuya örnek ekleme testi"""
         self.topic.add_example(self.example)
@@ -71,6 +98,43 @@ class TestLibraryModels(unittest.TestCase):
         found_topic = self.library.find_topic_by_id(self.topic.id)
         self.assertEqual(found_topic, self.topic)
     
+    def test_index_follows_tree_mutations(self):
+        """ID indeksinin ekleme/silme işlemleriyle güncel kalması testi"""
+        self.library.add_topic(self.topic)
+        child = Topic(title="Alt Konu")
+        grandchild = Topic(title="Alt Alt Konu")
+        grandchild.add_example(self.example)
+        child.add_child(grandchild)
+        self.topic.add_child(child)
+        
+        # Sonradan eklenen alt ağaç ve örnekleri de bulunmalı
+        self.assertIs(self.library.find_topic_by_id(grandchild.id), grandchild)
+        self.assertIs(self.library.find_example_by_id(self.example.id), self.example)
+        
+        # Örnek silinince indeksten düşmeli
+        grandchild.remove_example(self.example.id)
+        self.assertIsNone(self.library.find_example_by_id(self.example.id))
+        
+        # Alt konu silinince tüm alt ağaç indeksten düşmeli
+        self.topic.remove_child(child.id)
+        self.assertIsNone(self.library.find_topic_by_id(child.id))
+        self.assertIsNone(self.library.find_topic_by_id(grandchild.id))
+        
+        self.library.remove_topic(self.topic.id)
+        self.assertIsNone(self.library.find_topic_by_id(self.topic.id))
+    
+    def test_index_built_by_from_dict(self):
+        """from_dict ile yüklenen kütüphanede indeks testi"""
+        child = Topic(title="Alt Konu")
+        child.add_example(self.example)
+        self.topic.add_child(child)
+        self.library.add_topic(self.topic)
+        
+        loaded = Library.from_dict(self.library.to_dict())
+        found = loaded.find_topic_by_id(child.id)
+        self.assertEqual(found.title, "Alt Konu")
+        self.assertEqual(loaded.find_example_by_id(self.example.id).name, self.example.name)
+    
     def test_search_topics(self):
         """Konu arama testi"""
         self.topic.title = "Python Temelleri"
@@ -103,6 +167,56 @@ class TestLibraryModels(unittest.TestCase):
         self.assertEqual(len(new_topic.examples), 1)
         self.assertEqual(new_topic.examples[0].name, self.example.name)
 
+    def test_slotted_nodes(self):
+        """Düğümlerin __dict__ taşımaması ve zaman damgalarının korunması testi"""
+        for node in (self.library, self.topic, self.example):
+            self.assertFalse(hasattr(node, '__dict__'))
+            with self.assertRaises(AttributeError):
+                node.undefined_field = 1
+
+        stamp = datetime(2024, 5, 17, 13, 45, 30, 123456)
+        self.topic.updated_at = stamp
+        self.assertEqual(self.topic.updated_at, stamp)
+        self.assertEqual(Topic.from_dict(self.topic.to_dict()), self.topic)
+
+    def test_from_dict_timestamps_and_ids(self):
+        """Zaman damgalarının tembel çözülmesi ve ID'nin yalnızca eksikse üretilmesi testi"""
+        data = self.example.to_dict()
+        loaded = Example.from_dict(data)
+        self.assertIs(loaded.to_dict()['created_at'], data['created_at'])
+        self.assertEqual(loaded.created_at, self.example.created_at)
+        self.assertEqual(loaded.to_dict(), data)
+
+        del data['id'], data['updated_at']
+        first, second = Example.from_dict(data), Example.from_dict(data)
+        self.assertNotEqual(first.id, second.id)
+        self.assertIsInstance(first.updated_at, datetime)
+
+    def test_non_string_timestamps(self):
+        """Sayısal zaman damgalarının kabul edilip geçersizlerin yüklemede reddedilmesi testi"""
+        loaded = Topic.from_dict({'title': "Sayısal", 'created_at': 86400, 'updated_at': 90000.5})
+        self.assertEqual(loaded.created_at, datetime(1970, 1, 2))
+        self.assertEqual(loaded.to_dict()['created_at'], "1970-01-02T00:00:00")
+        self.assertEqual(loaded.to_dict()['updated_at'], "1970-01-02T01:00:00.500000")
+
+        for value in (True, [2024], {'yıl': 2024}):
+            with self.assertRaises(TypeError):
+                Example.from_dict({'name': "Hatalı", 'created_at': value})
+
+        # Epoch başlangıcı (0) eksik değer sayılmaz
+        epoch = Library.from_dict({'created_at': 0, 'updated_at': 0.0})
+        self.assertEqual(epoch.created_at, datetime(1970, 1, 1))
+        self.assertEqual(epoch.updated_at, datetime(1970, 1, 1))
+
+    def test_invalid_timestamp_text(self):
+        """Bozuk zaman damgası metninin ilk erişimde değil yüklemede reddedilmesi testi"""
+        for value in ("dün", "2024-13-01T00:00:00", ""):
+            with self.assertRaises(ValueError):
+                Topic.from_dict({'title': "Hatalı", 'updated_at': value})
+
+        loaded = Example.from_dict({'name': "Geçerli", 'created_at': "2024-01-15T10:30:00"})
+        self.assertEqual(loaded._created_at, "2024-01-15T10:30:00")
+
 
 class TestDataPersistence(unittest.TestCase):
     """Veri kalıcılığı testleri"""
@@ -0,0 +1,67 @@
+"""
+İşlenmiş çıktı önbelleği testleri
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Test için proje root'unu path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.markdown_processor import MarkdownProcessor
+from src.utils.render_cache import RenderCache
+from src.utils.syntax_highlighter import SyntaxHighlighter
+
+
+class TestRenderCache(unittest.TestCase):
+    """RenderCache testleri"""
+
+    def test_lru_limits(self):
+        """Kayıt sayısı ve karakter bütçesi aşılınca en eski kaydın atılması testi"""
+        cache = RenderCache(max_entries=2, max_chars=10)
+        a, b, c = (cache.make_key(text, 'text', 1) for text in "abc")
+        cache.put(a, "1234")
+        cache.put(b, "1234")
+        self.assertEqual(cache.get(a), "1234")  # a en yeni oldu
+        cache.put(c, "12")
+        self.assertIsNone(cache.get(b))
+        self.assertEqual(len(cache), 2)
+
+        cache.put(b, "123456789")
+        self.assertIsNone(cache.get(a))
+        self.assertIsNone(cache.get(c))
+        # Bütçeden büyük çıktı saklanmaz
+        cache.put(a, "x" * 11)
+        self.assertIsNone(cache.get(a))
+
+    def test_key_includes_language_and_version(self):
+        """Aynı metnin farklı dil ve sürümde ayrı saklanması testi"""
+        cache = RenderCache()
+        calls = []
+
+        def render(text):
+            calls.append(text)
+            return text.upper()
+
+        for language, version in (('python', 1), ('python', 1), ('sql', 1), ('python', 2)):
+            self.assertEqual(cache.get_or_render("select", language, version, render), "SELECT")
+        self.assertEqual(len(calls), 3)
+
+    def test_shared_by_renderers(self):
+        """MarkdownProcessor ve SyntaxHighlighter'ın tek önbelleği paylaşması testi"""
+        cache = RenderCache()
+        processor = MarkdownProcessor(cache=cache)
+        highlighter = SyntaxHighlighter(cache=cache)
+
+        html = processor.to_html("**kalın**")
+        code = highlighter.highlight_code("print(1)", "Python")
+        self.assertEqual(len(cache), 2)
+        self.assertIs(processor.to_html("**kalın**"), html)
+        self.assertIs(highlighter.highlight_code("print(1)", "python"), code)
+        self.assertEqual(len(cache), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
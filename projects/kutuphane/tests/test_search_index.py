@@ -0,0 +1,96 @@
+"""
+Arama indeksi testleri
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Test için proje root'unu path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.models.library_models import Library, Topic, Example
+from src.services.search_index import SearchIndex, iter_topics, tokenize
+
+
+class TestSearchIndex(unittest.TestCase):
+    """SearchIndex testleri"""
+    
+    def setUp(self):
+        """Test öncesi hazırlık"""
+        self.library = Library(name="Test Kütüphanesi")
+        self.python = Topic(title="Python Temelleri", content="Değişkenler ve döngüler", tags=["dil"])
+        self.java = Topic(title="Java", content="Nesne yönelimli programlama")
+        self.loops = Topic(title="Döngüler", content="for ve while")
+        self.loops.add_example(Example(name="Liste üreteci", content="squares = [x * x for x in data]"))
+        self.library.add_topic(self.python)
+        self.library.add_topic(self.java)
+        self.python.add_child(self.loops)
+        self.index = SearchIndex(self.library)
+    
+    def _ids(self, query):
+        return [topic_id for topic_id, _ in self.index.search(query)]
+    
+    def test_tokenize(self):
+        """Kelimelere ayırma testi"""
+        self.assertEqual(tokenize("Merhaba, DÜNYA! x_1"), ["merhaba", "dünya", "x_1"])
+        self.assertEqual(tokenize(""), [])
+    
+    def test_search_fields_and_ranking(self):
+        """Başlık, içerik, etiket ve örnek araması testi"""
+        # Başlık eşleşmesi içerik eşleşmesinden önce gelmeli
+        self.assertEqual(self._ids("döngüler"), [self.loops.id, self.python.id])
+        self.assertEqual(self._ids("dil"), [self.python.id])
+        self.assertEqual(self._ids("squares"), [self.loops.id])
+        self.assertEqual(self._ids("kotlin"), [])
+    
+    def test_prefix_and_multi_term(self):
+        """Önek ve çok kelimeli sorgu testi"""
+        self.assertEqual(self._ids("pyth"), [self.python.id])
+        self.assertEqual(self._ids("nesne prog"), [self.java.id])
+        self.assertEqual(self._ids("nesne python"), [])
+    
+    def test_incremental_updates(self):
+        """Artımlı güncelleme testi"""
+        self.java.content = "Kotlin ile birlikte"
+        self.index.index_topic(self.java)
+        self.assertEqual(self._ids("kotlin"), [self.java.id])
+        self.assertEqual(self._ids("nesne"), [])
+        
+        self.index.remove_subtree(self.python)
+        self.assertEqual(self._ids("döngüler"), [])
+        self.assertEqual(len(self.index), 1)
+
+    
+    def test_bodies_indexed_in_background(self):
+        """Başlıkla açılıp tam indeksin sonradan devralınması testi"""
+        self.index.rebuild(self.library, include_bodies=False)
+        self.assertFalse(self.index.is_complete)
+        self.assertEqual(self._ids("python"), [self.python.id])
+        self.assertEqual(self._ids("squares"), [])
+        
+        topics = list(iter_topics(self.library))
+        built = SearchIndex.build(topics)
+        self.assertIsNone(SearchIndex.build(topics, is_cancelled=lambda: True))
+        
+        # Tam indeks hazırlanırken yapılan değişiklikler devralmada korunur
+        self.java.content = "Kotlin ile birlikte"
+        self.index.index_topic(self.java)
+        self.python.remove_child(self.loops.id)
+        self.index.remove_subtree(self.loops)
+        
+        self.assertTrue(self.index.adopt(built, self.library))
+        self.assertTrue(self.index.is_complete)
+        self.assertEqual(self._ids("kotlin"), [self.java.id])
+        self.assertEqual(self._ids("nesne"), [])
+        self.assertEqual(self._ids("squares"), [])
+        self.assertEqual(self._ids("değişkenler"), [self.python.id])
+        self.assertEqual(len(self.index), 2)
+        
+        # Arada baştan kurulan indeks eski sonucu devralmaz
+        self.assertFalse(self.index.adopt(built, self.library))
+
+
+if __name__ == '__main__':
+    unittest.main()
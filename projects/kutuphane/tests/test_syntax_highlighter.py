@@ -0,0 +1,62 @@
+"""
+Syntax highlighting testleri
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Test için proje root'unu path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils import syntax_highlighter
+from src.utils.render_cache import RenderCache
+from src.utils.syntax_highlighter import HighlightCancelled, SyntaxHighlighter
+
+
+class TestSyntaxHighlighter(unittest.TestCase):
+    """SyntaxHighlighter testleri"""
+
+    def setUp(self):
+        """Test öncesi hazırlık"""
+        self.highlighter = SyntaxHighlighter(cache=RenderCache())
+
+    def test_plain_fallback_is_escaped(self):
+        """Düz metin ve bilinmeyen dillerin HTML kaçışlı gösterilmesi testi"""
+        code = "if a < b && c > d:"
+        expected = "<pre>if a &lt; b &amp;&amp; c &gt; d:</pre>"
+        self.assertEqual(self.highlighter.highlight_code(code, "text"), expected)
+        self.assertEqual(self.highlighter.highlight_code(code, "böyle-bir-dil-yok"), expected)
+        self.assertIn('<span', self.highlighter.highlight_code("print(1)", "python"))
+
+    def test_lexer_lookup_cached(self):
+        """Lexer aramasının (bilinmeyen diller dahil) dil başına bir kez yapılması testi"""
+        syntax_highlighter._lexer_for.cache_clear()
+        original = syntax_highlighter.get_lexer_by_name
+        with mock.patch.object(syntax_highlighter, 'get_lexer_by_name', side_effect=original) as lookup:
+            results = self.highlighter.highlight_many(
+                [(f"x = {i}", "Python") for i in range(5)] +
+                [(f"satır {i}", "yok-dil") for i in range(5)]
+            )
+        self.assertEqual(len(results), 10)
+        self.assertEqual(lookup.call_count, 2)
+        self.assertTrue(results[0].startswith('<div'))
+        self.assertEqual(results[-1], "<pre>satır 4</pre>")
+
+    def test_cancelled_highlight_not_cached(self):
+        """İptal edilen renklendirmenin kesilmesi ve önbelleğe girmemesi testi"""
+        code = "def f(x):\n    return x\n" * 200
+        self.assertIsNone(self.highlighter.cached_html(code, "python"))
+        with self.assertRaises(HighlightCancelled):
+            self.highlighter.highlight_code(code, "python", is_cancelled=lambda: True)
+        self.assertIsNone(self.highlighter.cached_html(code, "python"))
+
+        html = self.highlighter.highlight_code(code, "python", is_cancelled=lambda: False)
+        self.assertEqual(html, self.highlighter._highlight(code, "python"))
+        self.assertIs(self.highlighter.cached_html(code, "Python"), html)
+
+
+if __name__ == '__main__':
+    unittest.main()